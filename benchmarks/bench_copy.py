@@ -0,0 +1,57 @@
+"""
+Compare geojson_to_esri_json and esri_json_to_geojson with copy=True, the default, against copy=False on a feature
+collection of polygons, for the time and the memory the new objects of the output take, counted with tracemalloc.
+Every run converts a fresh deep copy of the input, the copy is not counted.
+Run from the repository root:
+    python -m benchmarks.bench_copy
+"""
+import copy
+import math
+import time
+import tracemalloc
+
+import pygeoconv
+
+
+def _collection(features, vertices):
+    result = []
+    for i in range(features):
+        ring = [[round(i % 100 + 0.4 * math.cos(-2 * math.pi * k / vertices), 6),
+                 round(i // 100 + 0.4 * math.sin(-2 * math.pi * k / vertices), 6)] for k in range(vertices)]
+        result.append({'type': 'Feature', 'id': i, 'geometry': {'type': 'Polygon', 'coordinates': [ring + ring[:1]]},
+                       'properties': {'name': f'parcel {i}', 'area': i * 1.5}})
+    return {'type': 'FeatureCollection', 'features': result}
+
+
+def _measure(function, payload):
+    best = math.inf
+    for _ in range(5):
+        value = copy.deepcopy(payload)
+        start = time.perf_counter()
+        function(value)
+        best = min(best, time.perf_counter() - start)
+    value = copy.deepcopy(payload)
+    tracemalloc.start()
+    result = function(value)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return best, allocated
+
+
+def main():
+    for features, vertices in ((20000, 20), (200, 5000)):
+        geojson = _collection(features, vertices)
+        esri = {'features': pygeoconv.geojson_to_esri_json(geojson)}
+        print(f'{features} polygons of {vertices} vertices')
+        for name, function, payload in (
+                ('geojson_to_esri_json', pygeoconv.geojson_to_esri_json, geojson),
+                ('geojson_to_esri_json copy=False', lambda v: pygeoconv.geojson_to_esri_json(v, copy=False), geojson),
+                ('esri_json_to_geojson', pygeoconv.esri_json_to_geojson, esri),
+                ('esri_json_to_geojson copy=False', lambda v: pygeoconv.esri_json_to_geojson(v, copy=False), esri)):
+            seconds, allocated = _measure(function, payload)
+            print(f'    {name:<32} {seconds * 1000:8.1f} ms {allocated / 2 ** 20:8.2f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare esri_json_to_wkt with the conversion through an intermediate GeoJson dict, which is what esri_json_to_wkt
+did before it could write Esri Json directly. Peak memory is measured with tracemalloc.
+Run from the repository root:
+    python -m benchmarks.bench_esri_to_wkt
+"""
+import math
+import timeit
+import tracemalloc
+
+import pygeoconv
+
+
+def _ring(n, cx, cy, r, clockwise):
+    sign = -1 if clockwise else 1
+    ring = [[round(cx + r * math.cos(sign * 2 * math.pi * i / n), 6),
+             round(cy + r * math.sin(sign * 2 * math.pi * i / n), 6)] for i in range(n)]
+    return ring + [ring[0]]
+
+
+def _via_geojson(esri_json):
+    return pygeoconv.geojson_to_wkt(pygeoconv.esri_json_to_geojson(esri_json))
+
+
+def _measure(function):
+    seconds = min(timeit.repeat(function, number=1, repeat=5))
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return seconds, peak
+
+
+def main():
+    # Parcels: a shell with one hole each
+    parcels = [{'rings': [_ring(40, i, i, 0.4, True), _ring(10, i, i, 0.1, False)]} for i in range(10000)]
+    # Hole assignment tests every hole edge against every shell edge, keep the large polygon to its shell
+    large = {'rings': [_ring(200000, 0, 0, 100, True)]}
+    cases = [
+        ('10k polygons, 40 vertex shell and 10 vertex hole', lambda convert: [convert(p) for p in parcels]),
+        ('polygon, 200k vertex shell', lambda convert: convert(large)),
+    ]
+    for name, run in cases:
+        print(name)
+        for mode, convert in (('via geojson', _via_geojson), ('direct', pygeoconv.esri_json_to_wkt)):
+            seconds, peak = _measure(lambda: run(convert))
+            print(f'  {mode:<14}{seconds * 1000:>9.1f}ms  peak {peak / 2 ** 20:>7.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
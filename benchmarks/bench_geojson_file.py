@@ -0,0 +1,59 @@
+"""
+Compare iter_geojson_file with json.load of the whole FeatureCollection followed by geojson_to_esri_json, for the
+time and the peak of Python allocations counted with tracemalloc.
+Run from the repository root:
+    python -m benchmarks.bench_geojson_file
+"""
+import json
+import math
+import tempfile
+import timeit
+import tracemalloc
+
+import pygeoconv
+
+
+def _feature(i, n):
+    angles = [2 * math.pi * k / n for k in range(n)]
+    ring = [[round(i % 100 + 0.4 * math.cos(a), 6), round(i // 100 + 0.4 * math.sin(a), 6)] for a in angles]
+    return {'type': 'Feature', 'id': i, 'geometry': {'type': 'Polygon', 'coordinates': [ring + ring[:1]]},
+            'properties': {'name': f'parcel {i}', 'area': i * 1.5}}
+
+
+def _load(path):
+    with open(path, 'rb') as f:
+        return len(pygeoconv.geojson_to_esri_json(json.load(f)))
+
+
+def _stream(path):
+    return sum(1 for _ in pygeoconv.iter_geojson_file(path, to='esri'))
+
+
+def _measure(function):
+    seconds = min(timeit.repeat(function, number=1, repeat=3))
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    cases = [
+        ('50k features of 20 vertices', [_feature(i, 20) for i in range(50000)]),
+        ('2k features of 1000 vertices', [_feature(i, 1000) for i in range(2000)]),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f'{tmp}/collection.geojson'
+        for name, features in cases:
+            with open(path, 'w') as f:
+                json.dump({'type': 'FeatureCollection', 'features': features}, f)
+            del features
+            print(name)
+            for mode, function in (('json.load', lambda: _load(path)), ('iter_geojson_file', lambda: _stream(path))):
+                seconds, peak = _measure(function)
+                print(f'  {mode:<20}{seconds * 1000:>9.0f}ms  peak {peak / 2 ** 20:>7.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare assigning holes to outer rings in esri_json_to_geojson with the outer rings indexed by their boxes against
+testing every hole against every outer ring, for 1k clockwise square shells with 10 holes each.
+Run from the repository root:
+    python -m benchmarks.bench_hole_assignment
+"""
+import timeit
+
+import pygeoconv
+from pygeoconv import _esri_json
+
+
+def _rings(shells, holes):
+    rings = []
+    side = int(shells ** 0.5)
+    for i in range(shells):
+        x, y = i % side * 12, i // side * 12
+        rings.append([[x, y], [x, y + 10], [x + 10, y + 10], [x + 10, y], [x, y]])
+        for k in range(holes):
+            hx, hy = x + 0.5 + k * 0.9, y + 0.5 + k % 2 * 5
+            rings.append([[hx, hy], [hx + 0.5, hy], [hx + 0.5, hy + 0.5], [hx, hy + 0.5], [hx, hy]])
+    return rings
+
+
+def _linear(rings):
+    # Every hole tested against the outer rings from the last one, as without the index
+    str_tree = _esri_json.STRTree
+    _esri_json.STRTree = lambda boxes: None
+    try:
+        return pygeoconv.esri_json_to_geojson({'rings': rings})
+    finally:
+        _esri_json.STRTree = str_tree
+
+
+def main():
+    for shells in (100, 1000):
+        rings = _rings(shells, 10)
+        print(f'{shells} shells, {shells * 10} holes')
+        for mode, function in (('linear scan', lambda: _linear(rings)),
+                               ('indexed', lambda: pygeoconv.esri_json_to_geojson({'rings': rings}))):
+            seconds = min(timeit.repeat(function, number=1, repeat=3 if shells > 100 else 5))
+            print(f'    {mode:<12} {seconds * 1000:10.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Measure the cost of importing the PLY based WKT parser with and without the pregenerated LR tables.
+
+Every sample runs in a fresh interpreter so module caches and already built tables do not leak between runs.
+Run from the repository root:
+    python -m benchmarks.bench_import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+_SCRIPT = '''
+import sys, time, warnings
+warnings.simplefilter('ignore')
+if {disable_tables}:
+    sys.modules['pygeoconv._wkt_parsetab'] = None
+start = time.perf_counter()
+import pygeoconv._wkt_parser
+print(time.perf_counter() - start)
+'''
+
+
+def _sample(disable_tables):
+    # Byte code caching is forced on, import times without it are dominated by compiling the PLY sources
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    output = subprocess.check_output([sys.executable, '-c', _SCRIPT.format(disable_tables=disable_tables)], env=env)
+    return float(output)
+
+
+def main(samples=15):
+    _sample(False)  # make sure byte code is compiled before measuring
+    for name, disable_tables in (('runtime yacc()', True), ('pregenerated tables', False)):
+        timings = [_sample(disable_tables) for _ in range(samples)]
+        print(f'{name:<22} median {statistics.median(timings) * 1000:7.2f}ms   min {min(timings) * 1000:7.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
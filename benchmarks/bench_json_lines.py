@@ -0,0 +1,49 @@
+"""
+Compare converting a GeoJSONSeq file to Esri Json lines with iter_geojson_seq and write_esri_json_lines against a
+loop over the lines of the file calling json.loads, geojson_to_esri_json and json.dumps.
+Run from the repository root:
+    python -m benchmarks.bench_json_lines
+"""
+import json
+import math
+import tempfile
+import timeit
+
+import pygeoconv
+
+
+def _feature(i, n):
+    angles = [2 * math.pi * k / n for k in range(n)]
+    ring = [[round(i % 100 + 0.4 * math.cos(a), 6), round(i // 100 + 0.4 * math.sin(a), 6)] for a in angles]
+    return {'type': 'Feature', 'id': i, 'geometry': {'type': 'Polygon', 'coordinates': [ring + ring[:1]]},
+            'properties': {'name': f'parcel {i}', 'area': i * 1.5}}
+
+
+def _loop(source, target):
+    with open(source) as f, open(target, 'w') as out:
+        for line in f:
+            if line.strip():
+                out.write(json.dumps(pygeoconv.geojson_to_esri_json(json.loads(line)), separators=(',', ':')) + '\n')
+
+
+def _stream(source, target):
+    pygeoconv.write_esri_json_lines(pygeoconv.iter_geojson_seq(source), target, source='geojson')
+
+
+def main():
+    cases = [
+        ('100k features of 5 vertices', [_feature(i, 5) for i in range(100000)]),
+        ('20k features of 100 vertices', [_feature(i, 100) for i in range(20000)]),
+    ]
+    print(f'{"case":<32}{"loop":>10}{"stream":>10}{"speedup":>10}')
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = f'{tmp}/features.geojsons', f'{tmp}/features.jsonl'
+        for name, features in cases:
+            pygeoconv.write_geojson_seq(features, source)
+            loop = min(timeit.repeat(lambda: _loop(source, target), number=1, repeat=5))
+            stream = min(timeit.repeat(lambda: _stream(source, target), number=1, repeat=5))
+            print(f'{name:<32}{loop * 1000:>8.0f}ms{stream * 1000:>8.0f}ms{loop / stream:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
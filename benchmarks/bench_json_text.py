@@ -0,0 +1,56 @@
+"""
+Compare the *_str conversions with json.dumps of the dict conversions, for a small polygon, a polygon of 10k vertices
+with coordinates rounded to 6 decimals as in most WKT, and the same polygon with full precision coordinates.
+Run from the repository root:
+    python -m benchmarks.bench_json_text
+"""
+import json
+import math
+import timeit
+
+import pygeoconv
+
+
+def _polygon(n, digits=None):
+    ring = [[10 * math.cos(2 * math.pi * i / n), 10 * math.sin(2 * math.pi * i / n)] for i in range(n)]
+    if digits is not None:
+        ring = [[round(x, digits), round(y, digits)] for x, y in ring]
+    return {'type': 'Polygon', 'coordinates': [ring + ring[:1]]}
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _best(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    cases = [
+        ('polygon 5 vertices', _polygon(5, 6), 5000),
+        ('polygon 10k vertices, 6 decimals', _polygon(10000, 6), 5),
+        ('polygon 10k vertices, full', _polygon(10000), 5),
+    ]
+    print(f'{"case":<34}{"conversion":<24}{"dict+dumps":>12}{"str":>12}{"speedup":>10}')
+    for name, geojson, number in cases:
+        wkt = pygeoconv.geojson_to_wkt(geojson)
+        wkb = pygeoconv.geojson_to_wkb(geojson)
+        esri = pygeoconv.geojson_to_esri_json(geojson)
+        conversions = [
+            ('wkt_to_geojson', pygeoconv.wkt_to_geojson, pygeoconv.wkt_to_geojson_str, wkt),
+            ('wkt_to_esri_json', pygeoconv.wkt_to_esri_json, pygeoconv.wkt_to_esri_json_str, wkt),
+            ('wkb_to_geojson', pygeoconv.wkb_to_geojson, pygeoconv.wkb_to_geojson_str, wkb),
+            ('wkb_to_esri_json', pygeoconv.wkb_to_esri_json, pygeoconv.wkb_to_esri_json_str, wkb),
+            ('geojson_to_esri_json', pygeoconv.geojson_to_esri_json, pygeoconv.geojson_to_esri_json_str, geojson),
+            ('esri_json_to_geojson', pygeoconv.esri_json_to_geojson, pygeoconv.esri_json_to_geojson_str, esri),
+        ]
+        for conversion, function, text_function, value in conversions:
+            assert _dumps(function(value)) == text_function(value)
+            dumps = _best(lambda: _dumps(function(value)), number)
+            text = _best(lambda: text_function(value), number)
+            print(f'{name:<34}{conversion:<24}{dumps * 1000:>10.3f}ms{text * 1000:>10.3f}ms{dumps / text:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Compare converting a GeoJson FeatureCollection file to an Esri Json feature set with iter_geojson_file and
+EsriFeatureSetWriter against json.load, geojson_to_esri_json and json.dump of the whole feature set, for the time and
+the peak of Python allocations counted with tracemalloc.
+Run from the repository root:
+    python -m benchmarks.bench_json_writers
+"""
+import json
+import math
+import tempfile
+import timeit
+import tracemalloc
+
+import pygeoconv
+
+
+def _feature(i, n):
+    angles = [2 * math.pi * k / n for k in range(n)]
+    ring = [[round(i % 100 + 0.4 * math.cos(a), 6), round(i // 100 + 0.4 * math.sin(a), 6)] for a in angles]
+    return {'type': 'Feature', 'id': i, 'geometry': {'type': 'Polygon', 'coordinates': [ring + ring[:1]]},
+            'properties': {'name': f'parcel {i}', 'area': i * 1.5}}
+
+
+def _dump(source, target):
+    with open(source, 'rb') as f:
+        features = pygeoconv.geojson_to_esri_json(json.load(f))
+    feature_set = {'geometryType': 'esriGeometryPolygon', 'spatialReference': {'wkid': 4326}, 'features': features}
+    with open(target, 'w') as f:
+        json.dump(feature_set, f, separators=(',', ':'))
+
+
+def _stream(source, target):
+    with pygeoconv.EsriFeatureSetWriter(target, source='geojson') as writer:
+        writer.write_all(pygeoconv.iter_geojson_file(source))
+
+
+def _measure(function):
+    seconds = min(timeit.repeat(function, number=1, repeat=5))
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    cases = [
+        ('50k features of 20 vertices', [_feature(i, 20) for i in range(50000)]),
+        ('2k features of 1000 vertices', [_feature(i, 1000) for i in range(2000)]),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = f'{tmp}/collection.geojson', f'{tmp}/feature_set.json'
+        for name, features in cases:
+            with open(source, 'w') as f:
+                json.dump({'type': 'FeatureCollection', 'features': features}, f)
+            del features
+            print(name)
+            for mode, function in (('json.load and dump', lambda: _dump(source, target)),
+                                   ('streaming writer', lambda: _stream(source, target))):
+                seconds, peak = _measure(function)
+                print(f'  {mode:<20}{seconds * 1000:>9.0f}ms  peak {peak / 2 ** 20:>7.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare list output with coords='numpy' for wkt_to_geojson and esri_json_to_geojson.
+
+'list + asarray' is the list output followed by converting every ring to a NumPy array, which is what callers
+without the numpy mode have to do. Peak memory is measured with tracemalloc, which also tracks NumPy buffers.
+Run from the repository root:
+    python -m benchmarks.bench_numpy_coords
+"""
+import math
+import timeit
+import tracemalloc
+
+import numpy
+
+import pygeoconv
+
+
+def _ring(n, cx, cy, r):
+    # Clockwise circle, an outer ring in Esri orientation
+    return [[cx + r * math.cos(-2 * math.pi * i / n), cy + r * math.sin(-2 * math.pi * i / n)] for i in range(n)] + \
+        [[cx + r, cy]]
+
+
+def _with_asarray(convert):
+    def run():
+        geojson = convert()
+        geojson['coordinates'] = [numpy.asarray(ring, dtype=numpy.float64) for ring in geojson['coordinates']]
+        return geojson
+    return run
+
+
+def _measure(function):
+    seconds = min(timeit.repeat(function, number=1, repeat=5))
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return seconds, peak
+
+
+def main():
+    holes = [_ring(1000, -50 + 2 * i, 0, 0.5)[::-1] for i in range(50)]
+    rings = [_ring(200000, 0, 0, 100)] + holes
+    wkt = 'POLYGON (' + ', '.join('(' + ', '.join(f'{x} {y}' for x, y in ring) + ')' for ring in rings) + ')'
+    # Hole assignment of the Esri conversion tests every hole against the outer ring edge by edge, keep it to one ring
+    esri = {'rings': rings[:1], 'spatialReference': {'wkid': 4326}}
+    cases = [
+        ('wkt_to_geojson', {
+            'list': lambda: pygeoconv.wkt_to_geojson(wkt),
+            'list + asarray': _with_asarray(lambda: pygeoconv.wkt_to_geojson(wkt)),
+            'numpy': lambda: pygeoconv.wkt_to_geojson(wkt, coords='numpy'),
+        }),
+        ('esri_json_to_geojson', {
+            'list': lambda: pygeoconv.esri_json_to_geojson(esri),
+            'list + asarray': _with_asarray(lambda: pygeoconv.esri_json_to_geojson(esri)),
+            'numpy': lambda: pygeoconv.esri_json_to_geojson(esri, coords='numpy'),
+        }),
+    ]
+    print('WKT polygon with a 200k vertex ring and 50 holes of 1k vertices, Esri Json polygon with the 200k vertex ring')
+    for name, functions in cases:
+        for mode, function in functions.items():
+            seconds, peak = _measure(function)
+            print(f'{name:<22}{mode:<16}{seconds * 1000:>9.1f}ms  peak {peak / 2 ** 20:>7.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare list and NumPy array coordinates as input of geojson_to_wkt and geojson_to_esri_json.
+
+'tolist' converts the arrays back to lists before calling the converter, which is what callers had to do before
+arrays were accepted. Run from the repository root:
+    python -m benchmarks.bench_numpy_input
+"""
+import math
+import timeit
+
+import numpy
+
+import pygeoconv
+
+
+def _ring(n, cx, cy, r):
+    # Counter clockwise circle, the converters have to reverse it for Esri Json
+    return [[cx + r * math.cos(2 * math.pi * i / n), cy + r * math.sin(2 * math.pi * i / n)] for i in range(n)]
+
+
+def main():
+    rings = [_ring(200000, 0, 0, 100)] + [_ring(1000, -50 + 2 * i, 0, 0.5)[::-1] for i in range(50)]
+    lists = {'type': 'Polygon', 'coordinates': rings}
+    arrays = {'type': 'Polygon', 'coordinates': [numpy.array(ring, dtype=numpy.float64) for ring in rings]}
+
+    def tolist(function):
+        return lambda: function({'type': 'Polygon', 'coordinates': [ring.tolist() for ring in arrays['coordinates']]})
+
+    print('Polygon with an open 200k vertex ring and 50 holes of 1k vertices')
+    for name, function in (('geojson_to_wkt', pygeoconv.geojson_to_wkt),
+                           ('geojson_to_esri_json', pygeoconv.geojson_to_esri_json)):
+        for mode, run in (('list', lambda: function(lists)),
+                          ('tolist', tolist(function)),
+                          ('numpy', lambda: function(arrays))):
+            seconds = min(timeit.repeat(run, number=1, repeat=5))
+            print(f'{name:<22}{mode:<10}{seconds * 1000:>9.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
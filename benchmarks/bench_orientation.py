@@ -0,0 +1,55 @@
+"""
+Compare the ring orientation kernel shared by the GeoJson and Esri Json converters against the loops each converter
+had before, and against NumPy, on a list ring converted to an array for the test and on a ring that already is an
+array, for rings of 10 to 1M vertices.
+Run from the repository root:
+    python -m benchmarks.bench_orientation
+"""
+import math
+import timeit
+
+from pygeoconv._orientation import ring_is_clockwise
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _geojson_loop(ring):
+    total = 0
+    pt1 = ring[0]
+    for i in range(len(ring) - 1):
+        pt2 = ring[i + 1]
+        total += (pt2[0] - pt1[0]) * (pt2[1] + pt1[1])
+        pt1 = pt2
+    return total >= 0
+
+
+def _esri_loop(ring):
+    area = 0
+    for i in range(len(ring)):
+        j = (i + 1) % len(ring)
+        area += (ring[j][0] - ring[i][0]) * (ring[j][1] + ring[i][1])
+    return area >= 0
+
+
+def main():
+    for n in (10, 100, 1000, 10000, 100000, 1000000):
+        ring = [[math.cos(-2 * math.pi * k / n), math.sin(-2 * math.pi * k / n)] for k in range(n)]
+        ring.append(ring[0])
+        number = max(1, 100000 // n)
+        modes = [('geojson loop', lambda: _geojson_loop(ring)), ('esri loop', lambda: _esri_loop(ring)),
+                 ('kernel', lambda: ring_is_clockwise(ring))]
+        if numpy is not None:
+            array = numpy.array(ring)
+            modes += [('list to numpy', lambda: ring_is_clockwise(numpy.array(ring))),
+                      ('numpy array', lambda: ring_is_clockwise(array))]
+        print(f'{n} vertices')
+        for mode, function in modes:
+            seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+            print(f'    {mode:<14} {seconds * 1e6:12.1f} us')
+
+
+if __name__ == '__main__':
+    main()
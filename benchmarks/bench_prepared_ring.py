@@ -0,0 +1,63 @@
+"""
+Compare point in ring tests on a PreparedRing against the ray cast over every edge of the plain ring, and
+esri_json_to_geojson of one large shell with many holes with and without the shell prepared.
+Run from the repository root:
+    python -m benchmarks.bench_prepared_ring
+"""
+import math
+import random
+import timeit
+
+import pygeoconv
+from pygeoconv import _esri_json
+
+
+def _shell(n):
+    # Clockwise, as Esri Json outer rings are
+    ring = [[10 * math.cos(-2 * math.pi * k / n), 10 * math.sin(-2 * math.pi * k / n)] for k in range(n)]
+    return ring + ring[:1]
+
+
+def _holes(count):
+    rnd = random.Random(1)
+    holes = []
+    for _ in range(count):
+        angle, radius = rnd.uniform(0, 2 * math.pi), rnd.uniform(0, 9)
+        x, y = radius * math.cos(angle), radius * math.sin(angle)
+        holes.append([[x, y], [x + 0.01, y], [x + 0.01, y + 0.01], [x, y + 0.01], [x, y]])
+    return holes
+
+
+def _unprepared(rings):
+    minimum = _esri_json._PREPARE_MIN_VERTICES
+    _esri_json._PREPARE_MIN_VERTICES = math.inf
+    try:
+        return pygeoconv.esri_json_to_geojson({'rings': rings})
+    finally:
+        _esri_json._PREPARE_MIN_VERTICES = minimum
+
+
+def main():
+    rnd = random.Random(2)
+    for n in (100, 10000, 100000):
+        shell = _shell(n)
+        points = [[rnd.uniform(-11, 11), rnd.uniform(-11, 11)] for _ in range(1000)]
+        print(f'1000 points in a ring of {n} vertices')
+        prepared = pygeoconv.PreparedRing(shell)
+        plain = _esri_json._coordinates_contain_point
+        for mode, function in (('plain ring', lambda: [plain(shell, p) for p in points]),
+                               ('prepare', lambda: pygeoconv.PreparedRing(shell)),
+                               ('prepared', lambda: [prepared.contains_point(p) for p in points])):
+            seconds = min(timeit.repeat(function, number=1, repeat=3))
+            print(f'    {mode:<12} {seconds * 1000:10.1f} ms')
+    for n, count in ((10000, 1000), (50000, 5000)):
+        rings = [_shell(n)] + _holes(count)
+        print(f'shell of {n} vertices with {count} holes')
+        for mode, function in (('plain shell', lambda: _unprepared(rings)),
+                               ('prepared', lambda: pygeoconv.esri_json_to_geojson({'rings': rings}))):
+            seconds = min(timeit.repeat(function, number=1, repeat=3))
+            print(f'    {mode:<12} {seconds * 1000:10.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
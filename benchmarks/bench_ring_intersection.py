@@ -0,0 +1,36 @@
+"""
+Compare the sweep over edge intervals in _array_intersects_array against testing every edge of one ring against every
+edge of the other, for two rings that do not cross, the worst case of both, and for a small hole in a large shell.
+Run from the repository root:
+    python -m benchmarks.bench_ring_intersection
+"""
+import math
+import timeit
+
+from pygeoconv._esri_json import _array_intersects_array, _edges_intersect
+
+
+def _circle(n, cx, cy, radius):
+    ring = [[cx + radius * math.cos(2 * math.pi * k / n), cy + radius * math.sin(2 * math.pi * k / n)]
+            for k in range(n)]
+    return ring + ring[:1]
+
+
+def main():
+    cases = [(f'{n} and {n} vertices, nested', _circle(n, 0, 0, 10), _circle(n, 0.5, 0, 5))
+             for n in (100, 1000, 5000, 50000)]
+    cases.append(('50000 vertex shell, 20 vertex hole', _circle(50000, 0, 0, 10), _circle(20, 2, 3, 1)))
+    for name, a, b in cases:
+        print(name)
+        pairs = (len(a) - 1) * (len(b) - 1)
+        modes = [('sweep', lambda: _array_intersects_array(a, b))]
+        # Every pair at 50k x 50k vertices would take tens of minutes
+        if pairs <= 25000000:
+            modes.insert(0, ('every pair', lambda: _edges_intersect(a, b)))
+        for mode, function in modes:
+            seconds = min(timeit.repeat(function, number=1, repeat=3))
+            print(f'    {mode:<12} {seconds * 1000:10.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Compare the validation levels 'trust', 'fast' and 'strict' of geojson_to_esri_json and esri_json_to_geojson on closed
+and oriented input, as PostGIS writes it: a feature collection of small polygons, polygons with large rings and holes,
+and an Esri polygon of one large shell with many holes.
+Run from the repository root:
+    python -m benchmarks.bench_validation
+"""
+import math
+import timeit
+
+import pygeoconv
+
+
+def _ring(cx, cy, radius, n, clockwise):
+    sign = -1 if clockwise else 1
+    ring = [[round(cx + radius * math.cos(sign * 2 * math.pi * k / n), 6),
+             round(cy + radius * math.sin(sign * 2 * math.pi * k / n), 6)] for k in range(n)]
+    return ring + ring[:1]
+
+
+def _collection(features, vertices, holes):
+    result = []
+    for i in range(features):
+        cx, cy = i % 100 * 10, i // 100 * 10
+        rings = [_ring(cx, cy, 4, vertices, False)]
+        rings += [_ring(cx - 2 + h % 4, cy - 2 + h // 4, 0.3, vertices // 10, True) for h in range(holes)]
+        result.append({'type': 'Feature', 'id': i, 'geometry': {'type': 'Polygon', 'coordinates': rings},
+                       'properties': {'name': f'parcel {i}'}})
+    return {'type': 'FeatureCollection', 'features': result}
+
+
+def main():
+    shell = _ring(0, 0, 100, 50000, False)
+    holes = [_ring(-80 + h % 40 * 4, -40 + h // 40 * 4, 1, 50, True) for h in range(1000)]
+    cases = [
+        ('20k polygons of 20 vertices', _collection(20000, 20, 0)),
+        ('200 polygons of 5000 vertices with 8 holes', _collection(200, 5000, 8)),
+        ('a shell of 50k vertices with 1000 holes', {'type': 'Polygon', 'coordinates': [shell] + holes}),
+    ]
+    for name, geojson in cases:
+        esri = pygeoconv.geojson_to_esri_json(geojson)
+        if isinstance(esri, list):
+            esri = {'features': esri}
+        print(name)
+        for validation in ('trust', 'fast', 'strict'):
+            for function, value in (('geojson_to_esri_json', geojson), ('esri_json_to_geojson', esri)):
+                convert = getattr(pygeoconv, function)
+                seconds = min(timeit.repeat(lambda: convert(value, validation=validation), number=1, repeat=5))
+                print(f'    {function} {validation:<7} {seconds * 1000:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare WKB with WKT on the same geometries: reading to GeoJson, writing from GeoJson and the size of the encoding.
+Run from the repository root:
+    python -m benchmarks.bench_wkb
+"""
+import math
+import timeit
+
+import pygeoconv
+
+
+def _ring(n, cx, cy, r):
+    ring = [[cx + r * math.cos(2 * math.pi * i / n), cy + r * math.sin(2 * math.pi * i / n)] for i in range(n)]
+    return ring + [ring[0]]
+
+
+def _best(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    cases = [
+        ('point', {'type': 'Point', 'coordinates': [12.5, 55.7]}, 10000),
+        ('linestring 100k vertices', {'type': 'LineString', 'coordinates': _ring(100000, 0, 0, 10)[:-1]}, 3),
+        ('multipolygon 1k polygons / 3k rings', {'type': 'MultiPolygon', 'coordinates': [
+            [_ring(100, i, i, 1), _ring(20, i, i, 0.2)[::-1], _ring(20, i + 0.5, i, 0.2)[::-1]] for i in range(1000)]},
+         3),
+    ]
+    print(f'{"case":<38}{"wkt native":>12}{"wkt ply":>12}{"wkb":>12}{"write wkt":>12}{"write wkb":>12}'
+          f'{"wkt size":>11}{"wkb size":>11}')
+    for name, geojson, number in cases:
+        wkt = pygeoconv.geojson_to_wkt(geojson)
+        wkb = pygeoconv.geojson_to_wkb(geojson)
+        times = [
+            _best(lambda: pygeoconv.wkt_to_geojson(wkt), number),
+            _best(lambda: pygeoconv.wkt_to_geojson(wkt, engine='ply'), max(1, number // 10)),
+            _best(lambda: pygeoconv.wkb_to_geojson(wkb), number),
+            _best(lambda: pygeoconv.geojson_to_wkt(geojson), number),
+            _best(lambda: pygeoconv.geojson_to_wkb(geojson), number),
+        ]
+        print(f'{name:<38}' + ''.join(f'{seconds * 1000:>10.3f}ms' for seconds in times) +
+              f'{len(wkt) / 1024:>9.0f}KB{len(wkb) / 1024:>9.0f}KB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare parsing a file of WKT geometries, one per line, decoded to str with parsing it in place from an mmap through
+memoryview slices. Allocations are counted with tracemalloc, the pages of the mmap are not Python allocations.
+Run from the repository root:
+    python -m benchmarks.bench_wkt_bytes
+"""
+import math
+import mmap
+import tempfile
+import timeit
+import tracemalloc
+
+import pygeoconv
+
+
+def _polygon(n, cx, cy, r):
+    ring = [(round(cx + r * math.cos(2 * math.pi * i / n), 6), round(cy + r * math.sin(2 * math.pi * i / n), 6))
+            for i in range(n)]
+    return 'POLYGON ((' + ', '.join(f'{x} {y}' for x, y in ring + ring[:1]) + '))'
+
+
+def _decoded(path):
+    with open(path, encoding='ascii') as f:
+        text = f.read()
+    return sum(len(pygeoconv.wkt_to_geojson(line)['coordinates']) for line in text.splitlines())
+
+
+def _in_place(path):
+    count = 0
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)
+        start = 0
+        while start < len(data):
+            end = data.find(b'\n', start)
+            if end < 0:
+                end = len(data)
+            count += len(pygeoconv.wkt_to_geojson(view[start:end])['coordinates'])
+            start = end + 1
+        view.release()
+    return count
+
+
+def _measure(function):
+    seconds = min(timeit.repeat(function, number=1, repeat=3))
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    cases = [
+        ('20k polygons of 50 vertices', [_polygon(50, i % 100, i // 100, 0.4) for i in range(20000)]),
+        ('20 polygons of 50k vertices', [_polygon(50000, i, i, 10) for i in range(20)]),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, lines in cases:
+            path = f'{tmp}/data.wkt'
+            with open(path, 'w', encoding='ascii') as f:
+                f.write('\n'.join(lines))
+            size = sum(map(len, lines))
+            print(f'{name}, {size / 2 ** 20:.1f}MiB of WKT')
+            for mode, function in (('decoded str', lambda: _decoded(path)), ('mmap slices', lambda: _in_place(path))):
+                seconds, peak = _measure(function)
+                print(f'  {mode:<14}{seconds * 1000:>9.1f}ms  peak {peak / 2 ** 20:>7.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare the native WKT reader with the PLY reference parser.
+
+Run from the repository root:
+    python -m benchmarks.bench_wkt_engines
+"""
+import random
+import timeit
+
+from pygeoconv import _wkt
+
+
+def _coordinates(n):
+    return ', '.join(f'{random.uniform(-180, 180)} {random.uniform(-90, 90)}' for _ in range(n))
+
+
+def _cases():
+    random.seed(0)
+    point = 'POINT (495357.5879157982 6677582.037713626)'
+    linestring = f'LINESTRING ({_coordinates(100000)})'
+    polygons = ', '.join(f'(({_coordinates(20)}), ({_coordinates(10)}), ({_coordinates(10)}))' for _ in range(1000))
+    multipolygon = f'MULTIPOLYGON ({polygons})'
+    return [
+        ('point', point, 10000),
+        ('linestring 100k vertices', linestring, 1),
+        ('multipolygon 1k polygons / 3k rings', multipolygon, 1),
+    ]
+
+
+def main():
+    print(f"{'case':<40}{'ply':>12}{'native':>12}{'speedup':>10}")
+    for name, wkt, number in _cases():
+        assert _wkt.wkt_to_geojson(wkt, engine='native') == _wkt.wkt_to_geojson(wkt, engine='ply')
+        timings = {}
+        for engine in _wkt.ENGINES:
+            best = min(timeit.repeat(lambda: _wkt.wkt_to_geojson(wkt, engine=engine), number=number, repeat=3))
+            timings[engine] = best / number
+        print(f"{name:<40}{timings['ply'] * 1000:>10.3f}ms{timings['native'] * 1000:>10.3f}ms"
+              f"{timings['ply'] / timings['native']:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Compare iter_wkt_file with a loop calling wkt_to_geojson or wkt_to_esri_json on every line of a file, for files of
+small and of larger geometries.
+Run from the repository root:
+    python -m benchmarks.bench_wkt_file
+"""
+import math
+import tempfile
+import timeit
+
+import pygeoconv
+
+
+def _polygon(n, cx, cy, r):
+    ring = [(round(cx + r * math.cos(2 * math.pi * i / n), 6), round(cy + r * math.sin(2 * math.pi * i / n), 6))
+            for i in range(n)]
+    return 'POLYGON ((' + ', '.join(f'{x} {y}' for x, y in ring + ring[:1]) + '))'
+
+
+def _loop(path, convert):
+    with open(path) as f:
+        return [(line_number, convert(line)) for line_number, line in enumerate(f, 1)]
+
+
+def main():
+    cases = [
+        ('200k points', [f'POINT ({i * 0.001:.3f} {-i * 0.002:.3f})' for i in range(200000)]),
+        ('50k polygons of 10 vertices', [_polygon(10, i % 100, i // 100, 0.4) for i in range(50000)]),
+        ('5k polygons of 500 vertices', [_polygon(500, i % 100, i // 100, 0.4) for i in range(5000)]),
+    ]
+    print(f'{"case":<32}{"to":<10}{"loop":>10}{"iter_wkt_file":>16}{"speedup":>10}')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f'{tmp}/data.wkt'
+        for name, lines in cases:
+            with open(path, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            for to, convert in (('geojson', pygeoconv.wkt_to_geojson), ('esri', pygeoconv.wkt_to_esri_json)):
+                loop = min(timeit.repeat(lambda: _loop(path, convert), number=1, repeat=3))
+                streamed = min(timeit.repeat(lambda: list(pygeoconv.iter_wkt_file(path, to=to)), number=1, repeat=3))
+                print(f'{name:<32}{to:<10}{loop * 1000:>8.0f}ms{streamed * 1000:>14.0f}ms{loop / streamed:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
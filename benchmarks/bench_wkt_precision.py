@@ -0,0 +1,45 @@
+"""
+Time and output size of geojson_to_wkt on a 1M vertex ring with and without precision, for list and NumPy
+coordinates. 'str() per number' is the formatting geojson_to_wkt used before the batched formatter.
+Run from the repository root:
+    python -m benchmarks.bench_wkt_precision
+"""
+import random
+import timeit
+
+import pygeoconv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _str_per_number(ring):
+    return 'POLYGON ((' + ', '.join(' '.join(str(x) for x in item) for item in ring) + '))'
+
+
+def main():
+    rnd = random.Random(1)
+    ring = [[rnd.uniform(-180, 180), rnd.uniform(-90, 90)] for _ in range(1000000)]
+    ring.append(ring[0])
+    inputs = [('list', {'type': 'Polygon', 'coordinates': [ring]})]
+    if numpy is not None:
+        inputs.append(('numpy', {'type': 'Polygon', 'coordinates': [numpy.array(ring)]}))
+    options = [
+        ('default', {}),
+        ('decimals=6', {'precision': 6}),
+        ('significant=8', {'precision': 8, 'precision_mode': 'significant'}),
+    ]
+    print('Polygon with a 1M vertex ring of random lon/lat coordinates')
+    seconds = min(timeit.repeat(lambda: _str_per_number(ring), number=1, repeat=3))
+    print(f'{"list":<7}{"str() per number":<18}{seconds * 1000:>9.1f}ms')
+    for name, geojson in inputs:
+        for option, kwargs in options:
+            size = len(pygeoconv.geojson_to_wkt(geojson, **kwargs))
+            seconds = min(timeit.repeat(lambda: pygeoconv.geojson_to_wkt(geojson, **kwargs), number=1, repeat=3))
+            print(f'{name:<7}{option:<18}{seconds * 1000:>9.1f}ms  {size / 2 ** 20:>6.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Check that WKT parsing time grows linearly with the number of vertices.
+
+Parses LINESTRINGs of 10k, 100k and 1M vertices with both engines and fails if the time per vertex of the
+largest input is more than MAX_GROWTH times the time per vertex of the smallest one.
+Run from the repository root:
+    python -m benchmarks.bench_wkt_scaling
+"""
+import random
+import time
+
+from pygeoconv import _wkt
+
+SIZES = (10000, 100000, 1000000)
+MAX_GROWTH = 3.0
+
+
+def _linestring(n):
+    rnd = random.Random(n)
+    return 'LINESTRING (' + ', '.join(f'{rnd.uniform(-180, 180)} {rnd.uniform(-90, 90)}' for _ in range(n)) + ')'
+
+
+def _per_vertex(wkt, n, engine, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _wkt.wkt_to_geojson(wkt, engine=engine)
+        best = min(best, time.perf_counter() - start)
+    return best, best / n
+
+
+def main():
+    inputs = [(n, _linestring(n)) for n in SIZES]
+    for engine in _wkt.ENGINES:
+        per_vertex = []
+        for n, wkt in inputs:
+            total, vertex = _per_vertex(wkt, n, engine, repeat=3 if n < SIZES[-1] else 1)
+            per_vertex.append(vertex)
+            print(f'{engine:<8}{n:>10} vertices {total * 1000:>10.1f}ms {vertex * 1e9:>8.0f}ns/vertex')
+        growth = per_vertex[-1] / per_vertex[0]
+        print(f'{engine:<8}time per vertex grew {growth:.2f}x from {SIZES[0]} to {SIZES[-1]} vertices\n')
+        assert growth < MAX_GROWTH, f'{engine} parsing is not linear in the number of vertices'
+
+
+if __name__ == '__main__':
+    main()
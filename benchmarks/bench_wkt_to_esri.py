@@ -0,0 +1,57 @@
+"""
+Compare wkt_to_esri_json with the conversion through an intermediate GeoJson dict, which is what wkt_to_esri_json
+did before the native reader could build Esri Json directly. Allocations are counted with tracemalloc.
+Run from the repository root:
+    python -m benchmarks.bench_wkt_to_esri
+"""
+import math
+import timeit
+import tracemalloc
+
+import pygeoconv
+
+
+def _ring(n, cx, cy, r):
+    # Counterclockwise circle, the conversion has to reverse it
+    return [[round(cx + r * math.cos(2 * math.pi * i / n), 6), round(cy + r * math.sin(2 * math.pi * i / n), 6)]
+            for i in range(n)]
+
+
+def _text(ring):
+    return '(' + ', '.join(f'{x} {y}' for x, y in ring) + ')'
+
+
+def _via_geojson(wkt):
+    return pygeoconv.geojson_to_esri_json(pygeoconv.wkt_to_geojson(wkt))
+
+
+def _measure(function):
+    seconds = min(timeit.repeat(function, number=1, repeat=5))
+    tracemalloc.start()
+    result = function()
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, allocated, peak
+
+
+def main():
+    polygon = 'POLYGON (' + ', '.join(_text(ring) for ring in
+                                      [_ring(200000, 0, 0, 100)] + [_ring(1000, -50 + 2 * i, 0, 0.5)[::-1]
+                                                                    for i in range(50)]) + ')'
+    multipolygon = 'MULTIPOLYGON (' + ', '.join('(' + _text(_ring(100, i, i, 0.4)) + ')' for i in range(10000)) + ')'
+    cases = [
+        ('polygon, 200k vertex ring and 50 holes', polygon),
+        ('multipolygon, 10k polygons of 100 vertices', multipolygon),
+    ]
+    for name, wkt in cases:
+        print(name)
+        for mode, function in (('via geojson', lambda: _via_geojson(wkt)),
+                               ('direct', lambda: pygeoconv.wkt_to_esri_json(wkt))):
+            seconds, allocated, peak = _measure(function)
+            print(f'  {mode:<14}{seconds * 1000:>9.1f}ms  result {allocated / 2 ** 20:>7.1f}MiB'
+                  f'  peak {peak / 2 ** 20:>7.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
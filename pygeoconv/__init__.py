@@ -1,3 +1,8 @@
 from .pygeoconv import wkt_to_esri_json, wkt_to_geojson, esri_json_to_wkt, esri_json_to_geojson, \
-    geojson_to_wkt, geojson_to_esri_json
+    geojson_to_wkt, geojson_to_esri_json, iter_geojson_to_wkt, wkb_to_geojson, geojson_to_wkb, wkb_to_esri_json, \
+    esri_json_to_wkb, wkb_to_wkt, wkt_to_wkb, iter_wkt_file, iter_geojson_file, iter_geojson_seq, write_geojson_seq, \
+    iter_esri_json_lines, write_esri_json_lines, GeoJSONFeatureCollectionWriter, EsriFeatureSetWriter, \
+    wkt_to_esri_json_str, wkt_to_esri_json_bytes, wkt_to_geojson_str, wkt_to_geojson_bytes, esri_json_to_geojson_str, \
+    esri_json_to_geojson_bytes, geojson_to_esri_json_str, geojson_to_esri_json_bytes, wkb_to_geojson_str, \
+    wkb_to_geojson_bytes, wkb_to_esri_json_str, wkb_to_esri_json_bytes, PreparedRing, PreparedPolygon
 
@@ -1,28 +1,55 @@
+import math
+from operator import itemgetter
+
+from pygeoconv._index import STRTree, envelope
+from pygeoconv._orientation import ring_is_clockwise as _ring_is_clockwise
+from pygeoconv._validation import check_esri_json
 from pygeoconv.errors import EsriJsonParserError
 
+# Relative margin of the boxes of outer rings and edges, far above the rounding of the ring tests
+_BOX_MARGIN = 1e-9
+
+# Rings with fewer pairs of edges than this are compared edge by edge, the sweep does not pay off for them
+_SWEEP_MIN_PAIRS = 32
+
+# Outer rings with more vertices than this are prepared before they are tested against holes
+_PREPARE_MIN_VERTICES = 32
 
-def esri_json_to_geojson(arcgis: dict, id_attribute=None):
+# Box of rings with coordinates that are not finite, every finite point or box overlaps it
+_UNBOUNDED = (-math.inf, -math.inf, math.inf, math.inf)
+
+
+def esri_json_to_geojson(arcgis: dict, id_attribute=None, copy: bool = True, validation: str = 'fast'):
+    """
+    Without copy the output shares the position lists and the attributes dict of the input, which is changed in
+    place: rings are closed and reversed. Only for input that nothing else uses, and in which no ring list appears
+    twice. With validation 'trust' rings are taken as closed and holes as lying inside their outer ring without
+    crossing it, see group_rings. 'strict' checks the whole input first and converts it like 'fast'.
+    """
+    if validation == 'strict':
+        check_esri_json(arcgis)
+        validation = 'fast'
     geojson = dict()
     if 'features' in arcgis:
-        geojson = _convert_feature_set(arcgis, id_attribute)
+        geojson = _convert_feature_set(arcgis, id_attribute, copy, validation)
 
     elif "x" in arcgis and "y" in arcgis:
         geojson = convert_point(arcgis)
 
     elif 'points' in arcgis:
-        geojson = _convert_multipoint(arcgis)
+        geojson = _convert_multipoint(arcgis, copy)
 
     elif 'paths' in arcgis:
-        geojson = _convert_polyline(arcgis)
+        geojson = _convert_polyline(arcgis, copy)
 
     elif 'rings' in arcgis:
-        geojson = _convert_polygon(arcgis['rings'][:])
+        geojson = _convert_polygon(arcgis['rings'], copy, validation)
 
     elif all(key in arcgis for key in ['xmin', 'ymin', 'xmax', 'ymax']):
         geojson = _convert_extent(arcgis)
 
     elif 'geometry' in arcgis or 'attributes' in arcgis:
-        geojson = _convert_feature(arcgis, id_attribute)
+        geojson = _convert_feature(arcgis, id_attribute, copy, validation)
 
     if geojson.get('geometry') == {}:
         geojson.update({"geometry": None})
@@ -31,17 +58,22 @@ def esri_json_to_geojson(arcgis: dict, id_attribute=None):
     return geojson
 
 
-def _convert_feature_set(arcgis: dict, id_attribute: str):
+def _convert_feature_set(arcgis: dict, id_attribute: str, copy: bool, validation: str):
     geojson = {'type': 'FeatureCollection', 'features': []}
     for feature in arcgis['features']:
-        geojson['features'].append(esri_json_to_geojson(feature, id_attribute))
+        geojson['features'].append(esri_json_to_geojson(feature, id_attribute, copy, validation))
     return geojson
 
 
-def _convert_feature(arcgis: dict, id_attribute):
+def _convert_feature(arcgis: dict, id_attribute, copy: bool, validation: str):
+    if 'attributes' not in arcgis:
+        properties = {}
+    else:
+        properties = arcgis['attributes'].copy() if copy else arcgis['attributes']
     geojson = {'type': 'Feature',
-               'geometry': esri_json_to_geojson(arcgis['geometry']) if 'geometry' in arcgis else None,
-               'properties': arcgis['attributes'].copy() if 'attributes' in arcgis else {}}
+               'geometry': esri_json_to_geojson(arcgis['geometry'], copy=copy, validation=validation)
+               if 'geometry' in arcgis else None,
+               'properties': properties}
     if 'attributes' in arcgis:
         try:
             geojson['id'] = _get_id(arcgis['attributes'], id_attribute)
@@ -61,22 +93,53 @@ def convert_point(arcgis: dict):
     return geojson
 
 
-def _convert_multipoint(arcgis: dict):
-    return {'type': 'MultiPoint', 'coordinates': arcgis['points'][:]}
+def _convert_multipoint(arcgis: dict, copy: bool):
+    return {'type': 'MultiPoint', 'coordinates': arcgis['points'][:] if copy else arcgis['points']}
 
 
-def _convert_polyline(arcgis: dict):
+def _convert_polyline(arcgis: dict, copy: bool):
     geojson = {}
     if len(arcgis['paths']) == 1:
         geojson['type'] = 'LineString'
-        geojson['coordinates'] = arcgis['paths'][0][:]
+        geojson['coordinates'] = arcgis['paths'][0][:] if copy else arcgis['paths'][0]
     else:
         geojson['type'] = 'MultiLineString'
-        geojson['coordinates'] = arcgis['paths'][:]
+        geojson['coordinates'] = arcgis['paths'][:] if copy else arcgis['paths']
     return geojson
 
 
-def _convert_polygon(rings: list):
+def _convert_polygon(rings: list, copy: bool = True, validation: str = 'fast'):
+    # Outer rings are wound counterclockwise and holes clockwise for RFC 7946 compliance
+    polygons = group_rings(rings, copy=copy, trust=validation == 'trust')
+    if not copy:
+        # The rings are closed and reversed in place
+        outer_rings = [[_reverse(ring) if wind else ring for ring, wind in polygon] for polygon in polygons]
+    else:
+        outer_rings = [[ring[::-1] if wind else ring[:] for ring, wind in polygon] for polygon in polygons]
+
+    if len(outer_rings) == 1:
+        return {
+            'type': 'Polygon',
+            'coordinates': outer_rings[0]
+        }
+    else:
+        return {
+            'type': 'MultiPolygon',
+            'coordinates': outer_rings
+        }
+
+
+def group_rings(rings: list, copy: bool = True, trust: bool = False):
+    """
+    Closes the rings of an Esri Json polygon and groups them into polygons, each an outer ring followed by its
+    holes. The rings keep the orientation of the input and are only copied when they have to be closed. Each ring
+    is paired with a flag telling whether it has to be reversed for GeoJson winding, which is the case for all
+    rings except holes that are not inside any outer ring and become outer rings themselves. Without copy open rings
+    are closed in place.
+    With trust the rings are expected closed, and holes inside their outer ring without crossing it. Rings are not
+    closed or dropped when too short, a hole belongs to the only outer ring or to the first outer ring holding its
+    first point without testing the edges, and holes outside of all outer rings become outer rings.
+    """
     outer_rings = []
     holes = []
     x = 0
@@ -84,24 +147,40 @@ def _convert_polygon(rings: list):
     hole = None
 
     for r in range(len(rings)):
-        ring = _close_ring(rings[r][:])
-        if len(ring) < 4:
-            continue
+        if trust:
+            ring = rings[r]
+        else:
+            ring = _close_ring(rings[r], copy)
+            if len(ring) < 4:
+                continue
         if _ring_is_clockwise(ring):
-            polygon = [ring[::-1]]  # wind outer rings counterclockwise for RFC 7946 compliance
-            outer_rings.append(polygon)
+            outer_rings.append([(ring, True)])
         else:
-            holes.append(ring[::-1])  # wind inner rings clockwise for RFC 7946 compliance
+            holes.append(ring)
 
     uncontained_holes = []
+    # With several outer rings these are indexed by their boxes, and a hole is only tested against the outer rings
+    # whose box holds its first point or overlaps its box. The boxes have a margin for rounding in the ring tests.
+    index = STRTree([_ring_box(polygon[0][0], _BOX_MARGIN) for polygon in outer_rings]) \
+        if holes and len(outer_rings) > 1 else None
+
+    # Long outer rings are prepared at their first test against a hole, by position in outer_rings
+    prepared = {}
 
     while holes:
         hole = holes.pop()
         contained = False
-        for x in range(len(outer_rings) - 1, -1, -1):
-            outer_ring = outer_rings[x][0]
-            if _coordinates_contain_coordinates(outer_ring, hole):
-                outer_rings[x].append(hole)
+        for x in _candidates(outer_rings, index, hole[0][0], hole[0][1], hole[0][0], hole[0][1]):
+            if trust:
+                if len(outer_rings) == 1 or _ring_contains_point(outer_rings, x, prepared, hole[0]):
+                    outer_rings[x].append((hole, True))
+                    contained = True
+                    break
+                continue
+            outer_ring = _prepared_ring(outer_rings, x, prepared)
+            if outer_ring.contains(hole) if outer_ring is not None else \
+                    _coordinates_contain_coordinates(outer_rings[x][0][0], hole):
+                outer_rings[x].append((hole, True))
                 contained = True
                 break
         if not contained:
@@ -110,25 +189,156 @@ def _convert_polygon(rings: list):
     while uncontained_holes:
         hole = uncontained_holes.pop()
         intersects = False
-        for x in range(len(outer_rings) - 1, -1, -1):
-            outer_ring = outer_rings[x][0]
-            if _array_intersects_array(outer_ring, hole):
-                outer_rings[x].append(hole)
+        # Trusted holes outside of all outer rings do not cross them either
+        for x in () if trust else _candidates(outer_rings, index, *_ring_box(hole)):
+            outer_ring = _prepared_ring(outer_rings, x, prepared)
+            if outer_ring.intersects(hole) if outer_ring is not None else \
+                    _array_intersects_array(outer_rings[x][0][0], hole):
+                outer_rings[x].append((hole, True))
                 intersects = True
                 break
         if not intersects:
-            outer_rings.append([hole[::-1]])
-
-    if len(outer_rings) == 1:
-        return {
-            'type': 'Polygon',
-            'coordinates': outer_rings[0]
-        }
-    else:
-        return {
-            'type': 'MultiPolygon',
-            'coordinates': outer_rings
-        }
+            outer_rings.append([(hole, False)])
+
+    return outer_rings
+
+
+def _ring_box(ring: list, margin: float = 0.0):
+    # Min and max skip NaN but sum not, rings with coordinates that are not finite get a box that holds every point
+    if not math.isfinite(sum(position[0] for position in ring) + sum(position[1] for position in ring)):
+        return _UNBOUNDED
+    return envelope(ring, margin)
+
+
+def _candidates(outer_rings, index, minx, miny, maxx, maxy):
+    """
+    Positions of the outer rings to test against a hole, last first like a scan of all outer rings. Outer rings
+    added after the index was built, holes that became outer rings, are always tested. A hole with a first point or
+    a box that is not finite is tested against all outer rings.
+    """
+    if index is None or not (math.isfinite(minx) and math.isfinite(miny) and math.isfinite(maxx) and
+                             math.isfinite(maxy)):
+        return range(len(outer_rings) - 1, -1, -1)
+    found = index.query(minx, miny, maxx, maxy)
+    found.sort(reverse=True)
+    return list(range(len(outer_rings) - 1, index.size - 1, -1)) + found
+
+
+def _ring_contains_point(outer_rings, x, prepared, point):
+    outer_ring = _prepared_ring(outer_rings, x, prepared)
+    if outer_ring is not None:
+        return outer_ring.contains_point(point)
+    return _coordinates_contain_point(outer_rings[x][0][0], point)
+
+
+def _prepared_ring(outer_rings, x, prepared):
+    if x not in prepared:
+        ring = outer_rings[x][0][0]
+        prepared[x] = PreparedRing(ring) if len(ring) > _PREPARE_MIN_VERTICES else None
+    return prepared[x]
+
+
+class PreparedRing:
+    """
+    A ring prepared for repeated point in ring and ring intersection tests. The edges are sorted once into buckets of
+    equal height by the y range they span, a test only looks at the edges of the buckets its point or edge falls in.
+    The answers are the same as those of the tests on the plain ring used for Esri Json polygons: a point is inside
+    by ray casting, points on the boundary may fall on either side, and parallel edges never intersect.
+    """
+
+    def __init__(self, ring: list):
+        self.ring = ring
+        self._buckets = None
+        if len(ring) < 2:
+            return
+        # The edge from the last vertex back to the first only counts for points, it has no length in closed rings
+        self._closing_edge = (ring[-1], ring[0])
+        # Rings with coordinates that are not finite are tested like the plain ring, min and max skip NaN but sum not
+        if not math.isfinite(sum(position[0] for position in ring) + sum(position[1] for position in ring)):
+            return
+        minx, miny, maxx, maxy = envelope(ring)
+        pad = _BOX_MARGIN * max(abs(minx), abs(miny), abs(maxx), abs(maxy), maxx - minx, maxy - miny, 1.0)
+        if not math.isfinite(pad):
+            return
+        self._miny, self._maxy, self._pad = miny, maxy, pad
+        edges = _edge_boxes(ring, 0, pad)
+        # About one bucket per edge, fewer when long edges would be copied into too many buckets
+        count = len(edges)
+        while True:
+            self._scale = count / (maxy - miny) if maxy > miny else 0.0
+            self._last = count - 1
+            spans = [(self._bucket(edge[2]), self._bucket(edge[3])) for edge in edges]
+            if count == 1 or sum(hi - lo + 1 for lo, hi in spans) <= 4 * len(edges):
+                break
+            count = max(1, count // 4)
+        self._buckets = [[] for _ in range(count)]
+        for edge, (lo, hi) in zip(edges, spans):
+            for bucket in range(lo, hi + 1):
+                self._buckets[bucket].append(edge)
+
+    def _bucket(self, y):
+        bucket = int((y - self._miny) * self._scale)
+        return 0 if bucket < 0 else self._last if bucket > self._last else bucket
+
+    def contains_point(self, point) -> bool:
+        """
+        True if the point (x, y) is inside the ring.
+        """
+        if self._buckets is None:
+            return _coordinates_contain_point(self.ring, point)
+        x, y = point[0], point[1]
+        if not self._miny <= y <= self._maxy:
+            return False
+        contains = _edge_crosses_ray(self._closing_edge[0], self._closing_edge[1], x, y)
+        for edge in self._buckets[self._bucket(y)]:
+            if _edge_crosses_ray(edge[4], edge[5], x, y):
+                contains = not contains
+        return contains
+
+    def intersects(self, ring: list) -> bool:
+        """
+        True if an edge of the ring crosses or touches an edge of this ring.
+        """
+        if self._buckets is None:
+            return _array_intersects_array(self.ring, ring)
+        low, high = self._miny - self._pad, self._maxy + self._pad
+        for minx, maxx, miny, maxy, start, end, _ in _edge_boxes(ring, 1, self._pad):
+            if not (math.isfinite(minx) and math.isfinite(maxx) and math.isfinite(miny) and math.isfinite(maxy)):
+                return _array_intersects_array(self.ring, ring)
+            if maxy < low or miny > high:
+                continue
+            for bucket in range(self._bucket(miny), self._bucket(maxy) + 1):
+                for edge in self._buckets[bucket]:
+                    if edge[0] <= maxx and minx <= edge[1] and edge[2] <= maxy and miny <= edge[3] and \
+                            _edge_intersects_edge(edge[4], edge[5], start, end):
+                        return True
+        return False
+
+    def contains(self, ring: list) -> bool:
+        """
+        True if the first point of the ring is inside this ring and no edges of the two rings intersect.
+        """
+        return self.contains_point(ring[0]) and not self.intersects(ring)
+
+
+class PreparedPolygon:
+    """
+    A polygon prepared for repeated point in polygon tests, from a list of rings: the outer ring followed by its holes
+    like the coordinates of a GeoJson Polygon. The rings are kept as PreparedRing in rings.
+    """
+
+    def __init__(self, rings: list):
+        if not rings:
+            raise ValueError('A polygon needs an outer ring')
+        self.rings = [PreparedRing(ring) for ring in rings]
+
+    def contains_point(self, point) -> bool:
+        """
+        True if the point (x, y) is inside the outer ring and not inside any of the holes.
+        """
+        if not self.rings[0].contains_point(point):
+            return False
+        return not any(hole.contains_point(point) for hole in self.rings[1:])
 
 
 def _convert_extent(arcgis: dict):
@@ -165,7 +375,36 @@ def _coordinates_contain_point(coordinates: list, point: list):
     return contains
 
 
+def _edge_crosses_ray(start: list, end: list, x, y):
+    # The test of _coordinates_contain_point for one edge and the ray from (x, y) towards positive x
+    return ((start[1] <= y < end[1]) or (end[1] <= y < start[1])) and \
+        (x < (end[0] - start[0]) * (y - start[1]) / (end[1] - start[1]) + start[0])
+
+
 def _array_intersects_array(a: list, b: list):
+    """
+    True if an edge of a crosses or touches an edge of b, parallel edges never count. Short rings are compared edge by
+    edge, longer ones with a sweep over the x intervals of their edges that only compares edges whose boxes overlap,
+    and stops at the first crossing.
+    """
+    # Coordinates that are not finite make the boxes meaningless, these rings are compared edge by edge. Min and max
+    # skip NaN but sum not.
+    if (len(a) - 1) * (len(b) - 1) > _SWEEP_MIN_PAIRS and math.isfinite(
+            sum(position[0] for position in a) + sum(position[1] for position in a) +
+            sum(position[0] for position in b) + sum(position[1] for position in b)):
+        box_a, box_b = envelope(a), envelope(b)
+        pad = _BOX_MARGIN * max(max(map(abs, box_a)), max(map(abs, box_b)), box_a[2] - box_a[0], box_a[3] - box_a[1],
+                                box_b[2] - box_b[0], box_b[3] - box_b[1], 1.0)
+        if math.isfinite(pad):
+            # Boxes of edges are grown by pad each, so edges of the two rings are compared up to 2 * pad apart
+            if box_a[0] - box_b[2] > 2 * pad or box_b[0] - box_a[2] > 2 * pad or box_a[1] - box_b[3] > 2 * pad or \
+                    box_b[1] - box_a[3] > 2 * pad:
+                return False
+            return _sweep_intersects(a, b, pad)
+    return _edges_intersect(a, b)
+
+
+def _edges_intersect(a: list, b: list):
     for i in range(len(a) - 1):
         for j in range(len(b) - 1):
             if _edge_intersects_edge(a[i], a[i + 1], b[j], b[j + 1]):
@@ -173,6 +412,47 @@ def _array_intersects_array(a: list, b: list):
     return False
 
 
+def _edge_boxes(ring: list, side: int, pad: float):
+    # (minx, maxx, miny, maxy, start, end, side) of each edge, the box grown by pad for rounding in the edge test
+    boxes = []
+    for i in range(len(ring) - 1):
+        start, end = ring[i], ring[i + 1]
+        if start[0] <= end[0]:
+            minx, maxx = start[0], end[0]
+        else:
+            minx, maxx = end[0], start[0]
+        if start[1] <= end[1]:
+            miny, maxy = start[1], end[1]
+        else:
+            miny, maxy = end[1], start[1]
+        boxes.append((minx - pad, maxx + pad, miny - pad, maxy + pad, start, end, side))
+    return boxes
+
+
+def _sweep_intersects(a: list, b: list, pad: float):
+    # The edges of both rings ordered by their left end. Each ring keeps the edges whose x interval still reaches the
+    # current one, an edge is tested against the edges of the other ring in there, those ending before it are dropped.
+    active = [[], []]
+    for minx, maxx, miny, maxy, start, end, side in sorted(_edge_boxes(a, 0, pad) + _edge_boxes(b, 1, pad),
+                                                           key=itemgetter(0)):
+        kept = []
+        for edge in active[1 - side]:
+            if edge[1] < minx:
+                continue
+            kept.append(edge)
+            if edge[2] <= maxy and miny <= edge[3]:
+                # The edges in the order of the edge by edge test, the edge of a first
+                if side:
+                    crosses = _edge_intersects_edge(edge[4], edge[5], start, end)
+                else:
+                    crosses = _edge_intersects_edge(start, end, edge[4], edge[5])
+                if crosses:
+                    return True
+        active[1 - side] = kept
+        active[side].append((minx, maxx, miny, maxy, start, end, side))
+    return False
+
+
 def _edge_intersects_edge(a1: list, a2: list, b1: list, b2: list):
     ua_t = (b2[0] - b1[0]) * (a1[1] - b1[1]) - (b2[1] - b1[1]) * (a1[0] - b1[0])
     ub_t = (a2[0] - a1[0]) * (a1[1] - b1[1]) - (a2[1] - a1[1]) * (a1[0] - b1[0])
@@ -195,15 +475,16 @@ def _coordinates_contain_coordinates(outer: list, inner: list):
     return False
 
 
-def _close_ring(ring: list):
+def _close_ring(ring: list, copy: bool = True):
+    # With copy rings of the input are never changed, an open ring is closed in a copy
     if ring[0] != ring[-1]:
-        ring.append(ring[0])
+        if not copy:
+            ring.append(ring[0])
+            return ring
+        return ring + [ring[0]]
     return ring
 
 
-def _ring_is_clockwise(ring: list):
-    area = 0
-    for i in range(len(ring)):
-        j = (i + 1) % len(ring)
-        area += (ring[j][0] - ring[i][0]) * (ring[j][1] + ring[i][1])
-    return area >= 0
+def _reverse(ring: list):
+    ring.reverse()
+    return ring
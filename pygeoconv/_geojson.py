@@ -1,7 +1,16 @@
+from pygeoconv._numpy import import_numpy, is_array
+from pygeoconv._orientation import ring_is_clockwise as _ring_is_clockwise
+from pygeoconv._validation import check_geojson
 from pygeoconv.errors import GeojsonParserError
 
 
-def geojson_to_arcgis(geojson, id_attr='OBJECTID', wkid: int = 4326):
+def geojson_to_arcgis(geojson, id_attr='OBJECTID', wkid: int = 4326, copy: bool = True, validation: str = 'fast'):
+    """
+    Without copy the output shares the position lists and the properties dict of the input, which is changed in
+    place: rings are closed and reoriented, and the id of a feature is added to its properties. Only for input that
+    nothing else uses. With validation 'trust' rings are taken as closed and wound as RFC 7946 asks, every ring is
+    reversed without testing its orientation. 'strict' checks the whole input first and converts it like 'fast'.
+    """
     result = {}
     geojson_type = geojson.get("type")
     if not geojson_type or geojson_type not in (
@@ -10,104 +19,157 @@ def geojson_to_arcgis(geojson, id_attr='OBJECTID', wkid: int = 4326):
             'GeometryCollection'):
         raise GeojsonParserError(f"Unable to parse Geojson, unknown object type {geojson}")
     try:
+        if validation == 'strict':
+            check_geojson(geojson)
+            validation = 'fast'
         if geojson_type == 'Point':
-            result = _convert_point(geojson, wkid)
+            result = _convert_point(geojson, wkid, copy)
         elif geojson_type == 'MultiPoint':
-            result = _convert_multi_point(geojson, wkid)
+            result = _convert_multi_point(geojson, wkid, copy)
         elif geojson_type == 'LineString':
-            result = _convert_linestring(geojson, wkid)
+            result = _convert_linestring(geojson, wkid, copy)
         elif geojson_type == 'MultiLineString':
-            result = _convert_multi_linestring(geojson, wkid)
+            result = _convert_multi_linestring(geojson, wkid, copy)
         elif geojson_type == 'Polygon':
-            result = _convert_polygon(geojson, wkid)
+            result = _convert_polygon(geojson, wkid, copy, validation)
         elif geojson_type == 'MultiPolygon':
-            result = _convert_multi_polygon(geojson, wkid)
+            result = _convert_multi_polygon(geojson, wkid, copy, validation)
         elif geojson_type == 'Feature':
-            result = _convert_feature(geojson, id_attr, wkid)
+            result = _convert_feature(geojson, id_attr, wkid, copy, validation)
         elif geojson_type == 'FeatureCollection':
-            result = _convert_feature_collection(geojson, id_attr, wkid)
+            result = _convert_feature_collection(geojson, id_attr, wkid, copy, validation)
         elif geojson_type == 'GeometryCollection':
-            result = _convert_geometry_collection(geojson, id_attr, wkid)
+            result = _convert_geometry_collection(geojson, id_attr, wkid, copy, validation)
         return result
     except Exception as e:
         raise GeojsonParserError(f"Unable to parse Geojson: {e}")
 
 
-def _convert_point(geojson: dict, wkid: int):
+def _convert_point(geojson: dict, wkid: int, copy: bool):
     spatial_reference = {'wkid': wkid}
-    result = {'x': geojson['coordinates'][0], 'y': geojson['coordinates'][1]}
-    if len(geojson['coordinates']) > 2:
-        result['z'] = geojson['coordinates'][2]
+    coordinates = _positions(geojson['coordinates'], copy)
+    result = {'x': coordinates[0], 'y': coordinates[1]}
+    if len(coordinates) > 2:
+        result['z'] = coordinates[2]
     result['spatialReference'] = spatial_reference
     return result
 
 
-def _convert_multi_point(geojson: dict, wkid: int):
+def _convert_multi_point(geojson: dict, wkid: int, copy: bool):
     spatial_reference = {'wkid': wkid}
-    result = {'points': geojson['coordinates'][:]}
+    result = {'points': _positions(geojson['coordinates'], copy)}
     if len(geojson['coordinates'][0]) > 2:
         result['hasZ'] = True
     result['spatialReference'] = spatial_reference
     return result
 
 
-def _convert_linestring(geojson: dict, wkid: int):
+def _convert_linestring(geojson: dict, wkid: int, copy: bool):
     spatial_reference = {'wkid': wkid}
-    result = {'paths': [geojson['coordinates'][:]]}
+    result = {'paths': [_positions(geojson['coordinates'], copy)]}
     if len(geojson['coordinates'][0]) > 2:
         result['hasZ'] = True
     result['spatialReference'] = spatial_reference
     return result
 
 
-def _convert_multi_linestring(geojson: dict, wkid: int):
+def _convert_multi_linestring(geojson: dict, wkid: int, copy: bool):
     spatial_reference = {'wkid': wkid}
-    result = {'paths': geojson['coordinates'][:]}
+    result = {'paths': [_positions(path, copy) for path in geojson['coordinates']]}
     if len(geojson['coordinates'][0][0]) > 2:
         result['hasZ'] = True
     result['spatialReference'] = spatial_reference
     return result
 
 
-def _convert_polygon(geojson: dict, wkid: int):
+def _convert_polygon(geojson: dict, wkid: int, copy: bool, validation: str):
     spatial_reference = {'wkid': wkid}
-    result = {'rings': _orient_rings(geojson['coordinates'][:])}
+    if validation == 'trust':
+        result = {'rings': _reverse_rings(geojson['coordinates'], copy)}
+    else:
+        result = {'rings': _orient_rings(geojson['coordinates'], copy=copy)}
     if len(geojson['coordinates'][0][0]) > 2:
         result['hasZ'] = True
     result['spatialReference'] = spatial_reference
     return result
 
 
-def _convert_multi_polygon(geojson: dict, wkid: int):
+def _convert_multi_polygon(geojson: dict, wkid: int, copy: bool, validation: str):
     spatial_reference = {'wkid': wkid}
-    result = {'rings': _flatten_multi_polygon_rings(geojson['coordinates'][:])}
+    result = {'rings': _flatten_multi_polygon_rings(geojson['coordinates'], copy, validation)}
     if len(geojson['coordinates'][0][0][0]) > 2:
         result['hasZ'] = True
     result['spatialReference'] = spatial_reference
     return result
 
 
-def _convert_feature(geojson: dict, id_attribute: str, wkid: int):
+def _convert_feature(geojson: dict, id_attribute: str, wkid: int, copy: bool, validation: str):
     result = {}
     if geojson.get("geometry"):
-        result['geometry'] = geojson_to_arcgis(geojson['geometry'], id_attribute, wkid)
-    result['attributes'] = _shallow_clone(geojson['properties']) if geojson['properties'] else {}
+        result['geometry'] = geojson_to_arcgis(geojson['geometry'], id_attribute, wkid, copy, validation)
+    if not geojson['properties']:
+        result['attributes'] = {}
+    else:
+        result['attributes'] = _shallow_clone(geojson['properties']) if copy else geojson['properties']
     if 'id' in geojson:
         result['attributes'][id_attribute] = geojson['id']
     return result
 
 
-def _convert_feature_collection(geojson: dict, id_attribute: str, wkid: int):
+def _convert_feature_collection(geojson: dict, id_attribute: str, wkid: int, copy: bool, validation: str):
     result = []
     for feature in geojson['features']:
-        result.append(geojson_to_arcgis(feature, id_attribute, wkid))
+        result.append(geojson_to_arcgis(feature, id_attribute, wkid, copy, validation))
     return result
 
 
-def _convert_geometry_collection(geojson: dict, id_attribute: str, wkid: int):
+def _convert_geometry_collection(geojson: dict, id_attribute: str, wkid: int, copy: bool, validation: str):
     result = []
     for geometry in geojson['geometries']:
-        result.append(geojson_to_arcgis(geometry, id_attribute, wkid))
+        result.append(geojson_to_arcgis(geometry, id_attribute, wkid, copy, validation))
+    return result
+
+
+def coordinates_to_arcgis(geojson_type: str, coordinates, wkid: int):
+    """
+    Converts the coordinates of a GeoJson geometry to an Esri Json geometry, for coordinates that are owned by the
+    caller such as freshly parsed WKT. The coordinate lists are used in the output as they are and rings are closed
+    and oriented in place. The output is the same as geojson_to_arcgis gives for the geometry.
+    """
+    spatial_reference = {'wkid': wkid}
+    if geojson_type == 'Point':
+        result = {'x': coordinates[0], 'y': coordinates[1]}
+        if len(coordinates) > 2:
+            result['z'] = coordinates[2]
+    elif geojson_type == 'MultiPoint':
+        result = {'points': coordinates}
+        if len(coordinates[0]) > 2:
+            result['hasZ'] = True
+    elif geojson_type == 'LineString':
+        result = {'paths': [coordinates]}
+        if len(coordinates[0]) > 2:
+            result['hasZ'] = True
+    elif geojson_type == 'MultiLineString':
+        result = {'paths': coordinates}
+        if len(coordinates[0][0]) > 2:
+            result['hasZ'] = True
+    elif geojson_type == 'Polygon':
+        has_z = len(coordinates[0][0]) > 2
+        result = {'rings': _orient_rings(coordinates, copy=False)}
+        if has_z:
+            result['hasZ'] = True
+    elif geojson_type == 'MultiPolygon':
+        has_z = len(coordinates[0][0][0]) > 2
+        rings = []
+        for polygon in coordinates:
+            # Same ring order as _flatten_multi_polygon_rings
+            rings.extend(reversed(_orient_rings(polygon, copy=False)))
+        result = {'rings': rings}
+        if has_z:
+            result['hasZ'] = True
+    else:
+        raise GeojsonParserError(f"Unable to parse Geojson, unknown object type {geojson_type}")
+    result['spatialReference'] = spatial_reference
     return result
 
 
@@ -118,44 +180,66 @@ def _shallow_clone(obj):
     return target
 
 
-def _flatten_multi_polygon_rings(rings):
+def _positions(coordinates, copy: bool = True):
+    # Esri Json output holds plain lists, NumPy arrays are converted in a single call
+    if is_array(coordinates):
+        return coordinates.tolist()
+    return coordinates[:] if copy else coordinates
+
+
+def _to_list(ring):
+    if is_array(ring):
+        return ring.tolist()
+    return ring
+
+
+def _flatten_multi_polygon_rings(rings, copy: bool = True, validation: str = 'fast'):
+    # The rings _orient_rings returns are not referenced anywhere else, they are not copied again
     output = []
     for i in range(len(rings)):
-        polygon = _orient_rings(rings[i])
-        for x in range(len(polygon) - 1, -1, -1):
-            ring = polygon[x][:]
-            output.append(ring)
+        if validation == 'trust':
+            output.extend(reversed(_reverse_rings(rings[i], copy)))
+        else:
+            output.extend(reversed(_orient_rings(rings[i], copy=copy)))
     return output
 
 
-def _orient_rings(poly):
+def _reverse_rings(poly, copy: bool = True):
+    # Closed rings in RFC 7946 winding, outer rings counterclockwise and holes clockwise, all of them are reversed
+    return [_to_list(ring[::-1] if copy else _reverse_ring(ring)) for ring in poly]
+
+
+def _orient_rings(poly, copy: bool = True):
+    # Without copy the rings are closed and reversed in place, only for rings that nothing else references
     output = []
-    polygon = poly[:]
-    outer_ring = _close_ring(polygon.pop(0)[:])
+    polygon = list(poly)
+    outer_ring = polygon.pop(0)
+    outer_ring = _close_ring(outer_ring[:] if copy else outer_ring)
     if len(outer_ring) >= 4:
         if not _ring_is_clockwise(outer_ring):
-            outer_ring.reverse()
-        output.append(outer_ring)
+            outer_ring = _reverse_ring(outer_ring)
+        output.append(_to_list(outer_ring))
         for i in range(len(polygon)):
-            hole = _close_ring(polygon[i][:])
+            hole = _close_ring(polygon[i][:] if copy else polygon[i])
             if len(hole) >= 4:
                 if _ring_is_clockwise(hole):
-                    hole.reverse()
-                output.append(hole)
+                    hole = _reverse_ring(hole)
+                output.append(_to_list(hole))
     return output
 
 
-def _ring_is_clockwise(ring_to_test):
-    total = 0
-    pt1 = ring_to_test[0]
-    for i in range(len(ring_to_test) - 1):
-        pt2 = ring_to_test[i + 1]
-        total += (pt2[0] - pt1[0]) * (pt2[1] + pt1[1])
-        pt1 = pt2
-    return total >= 0
+def _reverse_ring(ring):
+    if is_array(ring):
+        return ring[::-1]
+    ring.reverse()
+    return ring
 
 
 def _close_ring(coordinates):
+    if is_array(coordinates):
+        if not (coordinates[0] == coordinates[-1]).all():
+            coordinates = import_numpy().concatenate((coordinates, coordinates[:1]))
+        return coordinates
     if not _points_equal(coordinates[0], coordinates[-1]):
         coordinates.append(coordinates[0])
     return coordinates
@@ -0,0 +1,90 @@
+"""
+Static bounding box index for the rings of a polygon.
+
+The boxes are packed into a tree with the Sort-Tile-Recursive algorithm: they are sorted by the x of their centers,
+cut into vertical slabs, sorted by y within a slab and grouped into nodes of a fixed capacity, level by level up to
+a single root. A query only descends into nodes whose box it overlaps, so a point or a box is matched against
+about log(n) nodes instead of every box.
+"""
+import math
+
+NODE_CAPACITY = 16
+
+
+def envelope(positions, margin: float = 0.0):
+    """
+    Returns the bounding box (minx, miny, maxx, maxy) of positions, grown by margin times its largest extent on
+    each side. Used with a margin a box holds every point that rounding in a ring test could place inside.
+    """
+    xs = [position[0] for position in positions]
+    ys = [position[1] for position in positions]
+    minx, miny, maxx, maxy = min(xs), min(ys), max(xs), max(ys)
+    if margin:
+        pad = margin * max(maxx - minx, maxy - miny, abs(minx), abs(miny), abs(maxx), abs(maxy), 1.0)
+        return minx - pad, miny - pad, maxx + pad, maxy + pad
+    return minx, miny, maxx, maxy
+
+
+def _union(entries):
+    return (min(entry[0][0] for entry in entries), min(entry[0][1] for entry in entries),
+            max(entry[0][2] for entry in entries), max(entry[0][3] for entry in entries))
+
+
+def _center_x(entry):
+    box = entry[0]
+    return box[0] + box[2]
+
+
+def _center_y(entry):
+    box = entry[0]
+    return box[1] + box[3]
+
+
+def _pack(entries, capacity):
+    # One level of the tree, the entries grouped into nodes of up to capacity entries
+    nodes = math.ceil(len(entries) / capacity)
+    slab_size = capacity * math.ceil(nodes / math.ceil(math.sqrt(nodes)))
+    entries = sorted(entries, key=_center_x)
+    level = []
+    for start in range(0, len(entries), slab_size):
+        slab = sorted(entries[start:start + slab_size], key=_center_y)
+        for group in range(0, len(slab), capacity):
+            children = slab[group:group + capacity]
+            level.append((_union(children), children))
+    return level
+
+
+class STRTree:
+    """
+    Index of a fixed list of boxes (minx, miny, maxx, maxy). Queries return the positions of the matching boxes in
+    that list, in no particular order.
+    """
+
+    def __init__(self, boxes, node_capacity: int = NODE_CAPACITY):
+        # Leaves hold the position of their box, nodes the list of their children
+        level = [(box, i) for i, box in enumerate(boxes)]
+        while len(level) > node_capacity:
+            level = _pack(level, node_capacity)
+        self._root = level
+        self.size = len(boxes)
+
+    def query(self, minx, miny, maxx, maxy):
+        """
+        Returns the positions of the boxes that overlap the box, touching included.
+        """
+        found = []
+        stack = [self._root]
+        while stack:
+            for box, child in stack.pop():
+                if box[0] <= maxx and minx <= box[2] and box[1] <= maxy and miny <= box[3]:
+                    if isinstance(child, list):
+                        stack.append(child)
+                    else:
+                        found.append(child)
+        return found
+
+    def query_point(self, x, y):
+        """
+        Returns the positions of the boxes that hold the point, on their border included.
+        """
+        return self.query(x, y, x, y)
@@ -0,0 +1,93 @@
+"""
+Block buffered file input and output shared by the readers and writers of WKT and JSON files.
+"""
+import io
+import os
+from contextlib import contextmanager
+
+# Files are read and written in blocks of this many bytes or characters
+BLOCK_SIZE = 1 << 20
+
+ERRORS = ('raise', 'skip')
+
+
+def validate_block_size(block_size: int):
+    if block_size < 1:
+        raise ValueError(f"block_size must be at least 1, got {block_size}")
+
+
+def validate_errors(errors: str):
+    if errors not in ERRORS:
+        raise ValueError(f"Unknown error handling {errors!r}, expected one of {ERRORS}")
+
+
+def is_path(path_or_fp):
+    return isinstance(path_or_fp, (str, bytes, os.PathLike))
+
+
+@contextmanager
+def open_file(path_or_fp, mode: str = 'rb'):
+    """
+    Opens a path with the given mode, binary reading by default. A file object is used as it is and left open.
+    """
+    if is_path(path_or_fp):
+        with open(path_or_fp, mode) as fp:
+            yield fp
+    else:
+        yield path_or_fp
+
+
+def iter_blocks(fp, block_size: int = BLOCK_SIZE, separator: str = '\n'):
+    """
+    Yields (block, end) where block[:end] holds complete records of fp, records end with the separator. The
+    incomplete last record of a block is carried over to the next block, a record longer than a block is collected
+    until its end has been read. Blocks are bytes, or str for files opened in text mode.
+    """
+    pending = []
+    while True:
+        data = fp.read(block_size)
+        if not data:
+            break
+        sep = separator if isinstance(data, str) else separator.encode('ascii')
+        if pending and sep in data:
+            pending.append(data)
+            data = data[:0].join(pending)
+            pending = []
+        end = data.rfind(sep)
+        if end < 0:
+            pending.append(data)
+            continue
+        if end + 1 < len(data):
+            pending.append(data[end + 1:])
+        yield data, end
+    if pending:
+        data = pending[0][:0].join(pending)
+        yield data, len(data)
+
+
+class BlockWriter:
+    """
+    Collects text and writes it to a file object or a socket in blocks of about block_size characters. Binary files
+    and sockets get the text encoded as UTF-8. Call flush to write what is left.
+    """
+
+    def __init__(self, fp, block_size: int = BLOCK_SIZE):
+        # Sockets have sendall instead of write, socket is not imported only to check the type
+        self._write = fp.sendall if hasattr(fp, 'sendall') else fp.write
+        self._binary = not isinstance(fp, io.TextIOBase)
+        self._block_size = block_size
+        self._parts = []
+        self._size = 0
+
+    def write(self, text: str):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._block_size:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            text = ''.join(self._parts)
+            self._write(text.encode('utf-8') if self._binary else text)
+            self._parts = []
+            self._size = 0
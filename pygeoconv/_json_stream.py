@@ -0,0 +1,415 @@
+"""
+Incremental reading and writing of large JSON documents.
+
+The text of a document is read from a file in blocks and its values are decoded one at a time with the raw_decode of
+the standard json decoder, so a FeatureCollection can be walked feature by feature. Only the text of the value being
+decoded is held in memory, which is proportional to the largest feature and not to the file.
+
+Line delimited files, GeoJSONSeq (RFC 8142) and Esri Json with one feature per line, are read and written line by
+line through block buffers and converted on the fly. FeatureCollections and Esri Json feature sets are written a
+feature at a time the same way, with the header and the footer written around the features.
+"""
+import codecs
+import json
+import re
+
+from pygeoconv._esri_json import esri_json_to_geojson
+from pygeoconv._geojson import geojson_to_arcgis
+from pygeoconv._io import BLOCK_SIZE, BlockWriter, is_path, iter_blocks, open_file, validate_block_size, \
+    validate_errors
+from pygeoconv._numpy import is_array
+from pygeoconv.errors import EsriJsonParserError, GeojsonParserError
+
+FORMATS = ('geojson', 'esri')
+
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+# Record separator that starts every text of a JSON text sequence, the RS variant of GeoJSONSeq
+_RS = '\x1e'
+
+# A value cut off at the end of the text fails to decode with an unterminated string, or with an error a few
+# characters before the end, inside a number, a literal or an escape sequence
+_TRUNCATED_TAIL = 8
+
+
+class JsonStream:
+    """
+    The text of a JSON document read from a file object in blocks, bytes are decoded as UTF-8. Only the unread part
+    of the text is kept.
+    """
+
+    def __init__(self, fp, block_size: int = BLOCK_SIZE):
+        self._fp = fp
+        self._block_size = block_size
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._text = ''
+        self._pos = 0
+        # Position of the start of self._text in the document, for error messages
+        self._offset = 0
+        self._eof = False
+
+    def _read(self, size):
+        if self._eof:
+            return False
+        data = self._fp.read(size)
+        self._eof = not data
+        text = self._decoder.decode(data, final=self._eof) if isinstance(data, bytes) else data
+        self._offset += self._pos
+        self._text = self._text[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def position(self):
+        return self._offset + self._pos
+
+    def peek(self):
+        """
+        Returns the next character that is not whitespace without consuming it, '' at the end of the document.
+        """
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._text, self._pos).end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._read(self._block_size):
+                return ''
+
+    def expect(self, characters: str):
+        character = self.peek()
+        if not character or character not in characters:
+            expected = ' or '.join(repr(c) for c in characters)
+            raise ValueError(f"Expecting {expected} at character {self.position()}, got {character!r}")
+        self._pos += 1
+        return character
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._truncated(e) or not self._read(max(self._block_size, len(self._text) - self._pos)):
+                    raise ValueError(f"{e.msg} at character {self._offset + e.pos}") from None
+                # Each retry at least doubles the text of the value, a large value is decoded a few times at most
+                continue
+            if end == len(self._text) and self._text[end - 1].isdigit() and self._read(self._block_size):
+                # A number at the end of the text may continue in the next block
+                continue
+            self._pos = end
+            return value
+
+    def _truncated(self, error):
+        return error.msg.startswith('Unterminated string') or error.pos >= len(self._text) - _TRUNCATED_TAIL
+
+
+def _iter_features(stream: JsonStream):
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expecting a property name at character {stream.position()}")
+        stream.expect(':')
+        if key == 'features':
+            stream.expect('[')
+            if stream.peek() != ']':
+                while True:
+                    if stream.peek() != '{':
+                        raise ValueError(f"Expecting a feature object at character {stream.position()}")
+                    yield stream.value()
+                    if stream.expect(',]') == ']':
+                        break
+            else:
+                stream.expect(']')
+        else:
+            value = stream.value()
+            if key == 'type' and value != 'FeatureCollection':
+                raise ValueError(f"Expecting a FeatureCollection, got an object of type {value!r}")
+        if stream.expect(',}') == '}':
+            break
+    if stream.peek():
+        raise ValueError(f"Extra data at character {stream.position()}")
+
+
+def _iter_geojson_file(path_or_fp, to, wkid, id_attr, block_size):
+    with open_file(path_or_fp) as fp:
+        features = _iter_features(JsonStream(fp, block_size))
+        while True:
+            try:
+                feature = next(features)
+            except StopIteration:
+                return
+            except ValueError as e:
+                raise GeojsonParserError(f"Unable to parse Geojson: {e}") from None
+            if to == 'esri':
+                # The feature was just parsed, nothing else references it
+                feature = geojson_to_arcgis(feature, id_attr=id_attr, wkid=wkid, copy=False)
+            yield feature
+
+
+def iter_geojson_file(path_or_fp, to: str = 'geojson', wkid: int = 4326, id_attr: str = 'OBJECTID',
+                      block_size: int = BLOCK_SIZE):
+    # Arguments are checked here and not in the generator, so invalid ones raise before the file is read
+    _validate_format(to)
+    validate_block_size(block_size)
+    return _iter_geojson_file(path_or_fp, to, wkid, id_attr, block_size)
+
+
+def _validate_format(value):
+    if value not in FORMATS:
+        raise ValueError(f"Unknown format {value!r}, expected one of {FORMATS}")
+
+
+def _array_default(value):
+    # GeoJson with NumPy coordinates is written like the same GeoJson with lists
+    if is_array(value):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(separators=(',', ':'), default=_array_default)
+
+
+def _iter_lines(path_or_fp, convert, error, name, errors, block_size):
+    """
+    Yields the converted records of a file with one JSON text per line. A record separator at the start of a line is
+    skipped, so both variants of GeoJSONSeq are read. Blank lines are skipped.
+    """
+    with open_file(path_or_fp) as fp:
+        line_number = 0
+        for block, end in iter_blocks(fp, block_size):
+            text = block[:end]
+            if not isinstance(text, str):
+                try:
+                    text = text.decode('utf-8-sig' if line_number == 0 else 'utf-8')
+                except UnicodeDecodeError as e:
+                    raise error(f"Unable to parse {name} after line {line_number}: {e}") from None
+            for line in text.split('\n'):
+                line_number += 1
+                line = line.lstrip(_RS)
+                if not line or line.isspace():
+                    continue
+                try:
+                    record = convert(json.loads(line))
+                except Exception as e:
+                    if errors == 'skip':
+                        continue
+                    raise error(f"Unable to parse {name} on line {line_number}: {e}") from e
+                yield record
+
+
+def _write_lines(records, path_or_fp, convert, prefix, block_size):
+    count = 0
+    with open_file(path_or_fp, 'wb') as fp:
+        writer = BlockWriter(fp, block_size)
+        for record in records:
+            writer.write(prefix + _ENCODER.encode(convert(record)) + '\n')
+            count += 1
+        writer.flush()
+    return count
+
+
+def _unchanged(record):
+    return record
+
+
+def iter_geojson_seq(path_or_fp, to: str = 'geojson', wkid: int = 4326, id_attr: str = 'OBJECTID',
+                     errors: str = 'raise', block_size: int = BLOCK_SIZE):
+    _validate_format(to)
+    validate_errors(errors)
+    validate_block_size(block_size)
+    if to == 'esri':
+        def convert(geojson):
+            return geojson_to_arcgis(geojson, id_attr=id_attr, wkid=wkid, copy=False)
+    else:
+        convert = _unchanged
+    return _iter_lines(path_or_fp, convert, GeojsonParserError, 'Geojson', errors, block_size)
+
+
+def iter_esri_json_lines(path_or_fp, to: str = 'esri', id_attr: str = None, errors: str = 'raise',
+                         block_size: int = BLOCK_SIZE):
+    _validate_format(to)
+    validate_errors(errors)
+    validate_block_size(block_size)
+    if to == 'geojson':
+        def convert(arcgis):
+            return esri_json_to_geojson(arcgis, id_attribute=id_attr, copy=False)
+    else:
+        convert = _unchanged
+    return _iter_lines(path_or_fp, convert, EsriJsonParserError, 'Esri Json', errors, block_size)
+
+
+def write_geojson_seq(records, path_or_fp, rs: bool = False, source: str = 'geojson', id_attr: str = None,
+                      block_size: int = BLOCK_SIZE) -> int:
+    _validate_format(source)
+    validate_block_size(block_size)
+    if source == 'esri':
+        def convert(arcgis):
+            return esri_json_to_geojson(arcgis, id_attribute=id_attr)
+    else:
+        convert = _unchanged
+    return _write_lines(records, path_or_fp, convert, _RS if rs else '', block_size)
+
+
+def write_esri_json_lines(records, path_or_fp, source: str = 'esri', wkid: int = 4326, id_attr: str = 'OBJECTID',
+                          block_size: int = BLOCK_SIZE) -> int:
+    _validate_format(source)
+    validate_block_size(block_size)
+    if source == 'geojson':
+        def convert(geojson):
+            return geojson_to_arcgis(geojson, id_attr=id_attr, wkid=wkid)
+    else:
+        convert = _unchanged
+    return _write_lines(records, path_or_fp, convert, '', block_size)
+
+
+# Esri geometry type of an Esri Json geometry, found by the key that holds its coordinates
+_GEOMETRY_TYPES = (('x', 'esriGeometryPoint'), ('points', 'esriGeometryMultipoint'),
+                   ('paths', 'esriGeometryPolyline'), ('rings', 'esriGeometryPolygon'),
+                   ('xmin', 'esriGeometryEnvelope'))
+
+
+def _geometry_type(geometry):
+    if geometry:
+        for key, geometry_type in _GEOMETRY_TYPES:
+            if key in geometry:
+                return geometry_type
+    return None
+
+
+class _CollectionWriter:
+    """
+    Writes the features of a Json collection one at a time. The header is written with the first feature, or on close
+    for an empty collection, and the footer on close. A path is opened and closed by the writer, a file object or a
+    socket is left open.
+    """
+    _footer = ']}'
+
+    def __init__(self, path_or_fp, block_size: int):
+        if path_or_fp is None:
+            raise TypeError("Unable to write to None")
+        validate_block_size(block_size)
+        self._own = is_path(path_or_fp)
+        self._fp = open(path_or_fp, 'wb') if self._own else path_or_fp
+        self._writer = BlockWriter(self._fp, block_size)
+        self._closed = False
+        self.count = 0
+
+    def _convert(self, feature):
+        return feature
+
+    def _header(self):
+        return self._start
+
+    def write(self, feature: dict):
+        if self._closed:
+            raise ValueError("Unable to write to a closed writer")
+        feature = self._convert(feature)
+        text = _ENCODER.encode(feature)
+        if self.count:
+            self._writer.write(',' + text)
+        else:
+            self._writer.write(self._header() + text)
+        self.count += 1
+
+    def write_all(self, features) -> int:
+        """
+        Writes the features of an iterable and returns the number written.
+        """
+        count = self.count
+        for feature in features:
+            self.write(feature)
+        return self.count - count
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._writer.write((self._header() if not self.count else '') + self._footer)
+            self._writer.flush()
+            if hasattr(self._fp, 'flush'):
+                self._fp.flush()
+        finally:
+            if self._own:
+                self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        # A collection left by an error is not completed, so it is not mistaken for a whole one
+        self._closed = True
+        if self._own:
+            self._fp.close()
+
+
+class GeoJSONFeatureCollectionWriter(_CollectionWriter):
+    """
+    Writes GeoJson features one at a time as a compact FeatureCollection, Esri Json features are converted like
+    esri_json_to_geojson does. The text is written in blocks of about block_size characters, close writes the rest and
+    the end of the collection. Used as a context manager, the collection is closed unless an error is raised.
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode, or a socket
+    source: Optional str, 'geojson' (default) or 'esri', the format of the features
+    id_attr: Optional str, attribute used as id of Esri Json features
+    block_size: Optional int
+    """
+    _start = '{"type":"FeatureCollection","features":['
+
+    def __init__(self, path_or_fp, source: str = 'geojson', id_attr: str = None, block_size: int = BLOCK_SIZE):
+        _validate_format(source)
+        super().__init__(path_or_fp, block_size)
+        self._source = source
+        self._id_attr = id_attr
+
+    def _convert(self, feature):
+        if self._source == 'esri':
+            return esri_json_to_geojson(feature, id_attribute=self._id_attr)
+        return feature
+
+
+class EsriFeatureSetWriter(_CollectionWriter):
+    """
+    Writes Esri Json features one at a time as a compact feature set, GeoJson features are converted like
+    geojson_to_esri_json does. The header is written with the first feature, unless it is given the geometry type is
+    that of the first feature and left out if it has no geometry. Features of another geometry type raise a
+    ValueError. Written and closed like GeoJSONFeatureCollectionWriter.
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode, or a socket
+    geometry_type: Optional str, for example 'esriGeometryPolygon'
+    wkid: Optional int, spatial reference of the feature set and of converted GeoJson
+    source: Optional str, 'esri' (default) or 'geojson', the format of the features
+    id_attr: Optional str, attribute the id of a GeoJson feature is written to
+    block_size: Optional int
+    """
+
+    def __init__(self, path_or_fp, geometry_type: str = None, wkid: int = 4326, source: str = 'esri',
+                 id_attr: str = 'OBJECTID', block_size: int = BLOCK_SIZE):
+        _validate_format(source)
+        super().__init__(path_or_fp, block_size)
+        self.geometry_type = geometry_type
+        self._wkid = wkid
+        self._source = source
+        self._id_attr = id_attr
+
+    def _convert(self, feature):
+        if self._source == 'geojson':
+            feature = geojson_to_arcgis(feature, id_attr=self._id_attr, wkid=self._wkid)
+        geometry_type = _geometry_type(feature.get('geometry'))
+        if geometry_type is not None:
+            if self.geometry_type is None:
+                self.geometry_type = geometry_type
+            elif geometry_type != self.geometry_type:
+                raise ValueError(f"Unable to write a feature of geometry type {geometry_type} to a feature set of "
+                                 f"geometry type {self.geometry_type}")
+        return feature
+
+    def _header(self):
+        header = {'spatialReference': {'wkid': self._wkid}, 'features': []}
+        if self.geometry_type is not None:
+            header = {'geometryType': self.geometry_type, **header}
+        # The encoded header ends with the empty list of features, "[]}", the features are written in its place
+        return _ENCODER.encode(header)[:-2]
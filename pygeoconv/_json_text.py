@@ -0,0 +1,92 @@
+"""
+Conversions straight to JSON text.
+
+The text is the same as json.dumps gives for the dict of the conversion with separators=(',', ':'). WKT is read to
+text without the dicts and lists in between, the numbers of a coordinate run are copied from the WKT when they are
+written the way json writes them. WKB positions are kept as the tuples struct unpacks, json writes them as arrays.
+Dict input is converted as before, the output shares its positions with the input, and encoded with the coordinates
+taken out, these are encoded without the checks for circular references.
+"""
+import json
+
+from pygeoconv._esri_json import esri_json_to_geojson
+from pygeoconv._geojson import geojson_to_arcgis
+from pygeoconv._wkb import WkbReader
+from pygeoconv.errors import WkbParserError
+
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+encode_coordinates = json.JSONEncoder(separators=(',', ':'), check_circular=False).encode
+
+# Members holding the coordinates of GeoJson and Esri Json geometries
+_COORDINATE_MEMBERS = frozenset(('coordinates', 'points', 'paths', 'rings'))
+
+# Members holding geometries, features or lists of these, which are taken apart as well
+_NESTED_MEMBERS = frozenset(('geometry', 'geometries', 'features'))
+
+
+def encode(value) -> str:
+    """
+    Encodes the output of a conversion, a geometry, a feature or a list of these, like json.dumps with compact
+    separators. Attributes and properties are encoded as a whole.
+    """
+    if isinstance(value, list):
+        return '[' + ','.join([encode(item) for item in value]) + ']'
+    if not isinstance(value, dict):
+        return _ENCODER.encode(value)
+    parts = []
+    for key, item in value.items():
+        if key in _COORDINATE_MEMBERS:
+            text = encode_coordinates(item)
+        elif key in _NESTED_MEMBERS and isinstance(item, (dict, list)):
+            text = encode(item)
+        else:
+            text = _ENCODER.encode(item)
+        parts.append(_ENCODER.encode(key) + ':' + text)
+    return '{' + ','.join(parts) + '}'
+
+
+def wkt_to_geojson_text(wkt, engine: str = 'native') -> str:
+    from pygeoconv._wkt import wkt_to_geojson
+    if engine == 'native':
+        from pygeoconv._wkt_reader import read_wkt_json
+        try:
+            return read_wkt_json(wkt)
+        except Exception:
+            # Invalid input takes the dict route, which raises the errors of wkt_to_geojson
+            pass
+    return encode(wkt_to_geojson(wkt, engine=engine))
+
+
+def wkt_to_esri_json_text(wkt, wkid: int = 4326, engine: str = 'native') -> str:
+    from pygeoconv._wkt import wkt_to_arcgis
+    if engine == 'native':
+        from pygeoconv._wkt_reader import read_wkt_esri_json
+        try:
+            return read_wkt_esri_json(wkt, wkid)
+        except Exception:
+            pass
+    return encode(wkt_to_arcgis(wkt, wkid=wkid, engine=engine))
+
+
+def _read_wkb(wkb):
+    try:
+        return WkbReader(wkb, tuples=True).read()
+    except Exception as e:
+        raise WkbParserError(f"Unable to parse WKB: {e}")
+
+
+def wkb_to_geojson_text(wkb) -> str:
+    return encode(_read_wkb(wkb))
+
+
+def wkb_to_esri_json_text(wkb, wkid: int = 4326) -> str:
+    return encode(geojson_to_arcgis(_read_wkb(wkb), wkid=wkid, copy=False))
+
+
+def geojson_to_esri_json_text(geojson: dict, wkid: int = 4326, id_attr: str = 'OBJECTID') -> str:
+    return encode(geojson_to_arcgis(geojson, id_attr=id_attr, wkid=wkid))
+
+
+def esri_json_to_geojson_text(esri_json: dict, id_attr: str = None) -> str:
+    return encode(esri_json_to_geojson(esri_json, id_attribute=id_attr))
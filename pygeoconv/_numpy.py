@@ -0,0 +1,73 @@
+"""
+Optional NumPy support. NumPy is never imported unless a caller asks for array output or passes arrays in, so the
+package keeps working without it.
+"""
+import sys
+
+COORDINATES = ('list', 'numpy')
+
+# Nesting depth of the coordinate arrays below the 'coordinates' member of each GeoJson geometry type
+COORDINATE_DEPTHS = {
+    'Point': 0,
+    'LineString': 1,
+    'MultiPoint': 1,
+    'Polygon': 2,
+    'MultiLineString': 2,
+    'MultiPolygon': 3,
+}
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for coords='numpy', install it with pip install pygeoconv[numpy]") \
+            from None
+    return numpy
+
+
+def validate_coords(coords: str):
+    if coords not in COORDINATES:
+        raise ValueError(f"Unknown coordinate output {coords!r}, expected one of {COORDINATES}")
+
+
+def is_array(value):
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def coordinates_to_arrays(coordinates, depth: int):
+    """
+    Converts the position lists of a GeoJson coordinates member to float64 arrays, a single position becomes an
+    array of shape (dims,) and a list of positions an array of shape (N, dims). Empty coordinates are kept as is.
+    """
+    if depth == 0 or depth == 1:
+        if is_array(coordinates) or len(coordinates) == 0:
+            return coordinates
+        numpy = import_numpy()
+        array = numpy.array(coordinates, dtype=numpy.float64)
+        if array.ndim != depth + 1:
+            raise ValueError('Unable to build a coordinate array from positions with mixed dimensions')
+        return array
+    return [coordinates_to_arrays(item, depth - 1) for item in coordinates]
+
+
+def geojson_to_arrays(geojson):
+    """
+    Replaces the coordinates of a GeoJson geometry, Feature or FeatureCollection with NumPy arrays. Only the
+    containers holding the coordinates are replaced, the dicts are updated in place.
+    """
+    if geojson is None:
+        return geojson
+    geojson_type = geojson.get('type')
+    if geojson_type in COORDINATE_DEPTHS:
+        geojson['coordinates'] = coordinates_to_arrays(geojson['coordinates'], COORDINATE_DEPTHS[geojson_type])
+    elif geojson_type == 'GeometryCollection':
+        for geometry in geojson['geometries']:
+            geojson_to_arrays(geometry)
+    elif geojson_type == 'Feature':
+        geojson_to_arrays(geojson.get('geometry'))
+    elif geojson_type == 'FeatureCollection':
+        for feature in geojson['features']:
+            geojson_to_arrays(feature)
+    return geojson
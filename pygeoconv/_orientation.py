@@ -0,0 +1,46 @@
+"""
+Ring orientation shared by the GeoJson and Esri Json converters.
+
+The orientation is the sign of the shoelace sum over the edges of a closed ring, twice the signed area with the sign
+flipped, so it is positive for clockwise rings. NumPy arrays are summed vectorized. Lists and tuples are summed in a
+Python loop: building an array from them costs more than the loop itself at every ring size (see
+benchmarks/bench_orientation.py), so they are never converted.
+"""
+from itertools import islice
+
+from pygeoconv._numpy import is_array
+
+
+def shoelace_sum(ring) -> float:
+    """
+    Returns the sum of (x2 - x1) * (y2 + y1) over the edges of the ring, in the order of the ring. The ring is expected
+    to be closed, the edge from the last position back to the first is not added.
+    """
+    if is_array(ring):
+        x = ring[:, 0]
+        y = ring[:, 1]
+        return float(((x[1:] - x[:-1]) * (y[1:] + y[:-1])).sum())
+    total = 0
+    x1, y1 = ring[0][0], ring[0][1]
+    try:
+        # Unpacking is the fastest way to get at the coordinates, for rings that only have x and y
+        for x2, y2 in islice(ring, 1, None):
+            total += (x2 - x1) * (y2 + y1)
+            x1 = x2
+            y1 = y2
+        return total
+    except ValueError:
+        pass
+    total = 0
+    x1, y1 = ring[0][0], ring[0][1]
+    for position in islice(ring, 1, None):
+        x2 = position[0]
+        y2 = position[1]
+        total += (x2 - x1) * (y2 + y1)
+        x1 = x2
+        y1 = y2
+    return total
+
+
+def ring_is_clockwise(ring) -> bool:
+    return shoelace_sum(ring) >= 0
@@ -0,0 +1,115 @@
+"""
+Validation levels of the GeoJson and Esri Json conversions.
+
+'fast' is the default and checks what the conversion needs: rings are closed, oriented and assigned to their outer
+ring by geometric tests, rings that are too short are dropped. 'trust' skips these passes for input that is known to
+be valid. 'strict' checks the input before converting it as 'fast' does: every coordinate is a finite number,
+every position has at least x and y, paths have two positions and rings four once closed.
+"""
+import math
+import numbers
+
+from pygeoconv._numpy import COORDINATE_DEPTHS, import_numpy, is_array
+from pygeoconv.errors import EsriJsonParserError, GeojsonParserError
+
+VALIDATIONS = ('trust', 'fast', 'strict')
+
+
+def validate_validation(validation: str):
+    if validation not in VALIDATIONS:
+        raise ValueError(f"Unknown validation {validation!r}, expected one of {VALIDATIONS}")
+
+
+def _check_position(position, error):
+    if is_array(position):
+        position = position.tolist()
+    if not isinstance(position, (list, tuple)) or len(position) < 2:
+        raise error(f"Invalid position {position!r}, at least x and y are required")
+    for value in position:
+        # Plain floats and ints first, x - x is NaN for NaN and infinity
+        value_type = type(value)
+        if value_type is float:
+            if value - value == 0.0:
+                continue
+        elif value_type is int:
+            continue
+        elif value_type is not bool and isinstance(value, numbers.Real) and math.isfinite(value):
+            continue
+        raise error(f"Invalid coordinate {value!r} in position {position}")
+
+
+def _check_positions(positions, minimum: int, name: str, error, ring: bool = False):
+    # Arrays are checked as a whole, their positions are only looked at one by one to report an error
+    if not is_array(positions) or positions.ndim != 2 or positions.shape[1] < 2 or \
+            positions.dtype.kind not in 'iuf' or not import_numpy().isfinite(positions).all():
+        for position in positions:
+            _check_position(position, error)
+    # An open ring is closed by the conversion, which adds a position
+    size = len(positions) + (ring and len(positions) > 0 and list(positions[0]) != list(positions[-1]))
+    if size < minimum:
+        raise error(f"Invalid {name} with {size} positions, at least {minimum} are required")
+
+
+def _check_coordinates(coordinates, depth: int, geojson_type: str):
+    if len(coordinates) == 0:
+        return
+    if depth == 0:
+        _check_position(coordinates, GeojsonParserError)
+    elif depth == 1:
+        if geojson_type == 'LineString':
+            _check_positions(coordinates, 2, 'LineString', GeojsonParserError)
+        else:
+            _check_positions(coordinates, 0, geojson_type, GeojsonParserError)
+    elif geojson_type == 'MultiLineString':
+        for path in coordinates:
+            _check_positions(path, 2, 'LineString', GeojsonParserError)
+    elif geojson_type == 'Polygon':
+        for ring in coordinates:
+            _check_positions(ring, 4, 'ring', GeojsonParserError, ring=True)
+    else:
+        for polygon in coordinates:
+            _check_coordinates(polygon, depth - 1, 'Polygon')
+
+
+def check_geojson(geojson):
+    """
+    Raises a GeojsonParserError for GeoJson that the 'strict' level rejects.
+    """
+    geojson_type = geojson.get('type')
+    if geojson_type in COORDINATE_DEPTHS:
+        if 'coordinates' not in geojson:
+            raise GeojsonParserError(f"Missing coordinates of {geojson_type}")
+        _check_coordinates(geojson['coordinates'], COORDINATE_DEPTHS[geojson_type], geojson_type)
+    elif geojson_type == 'GeometryCollection':
+        for geometry in geojson['geometries']:
+            check_geojson(geometry)
+    elif geojson_type == 'Feature':
+        if geojson.get('geometry'):
+            check_geojson(geojson['geometry'])
+    elif geojson_type == 'FeatureCollection':
+        for feature in geojson['features']:
+            check_geojson(feature)
+
+
+def check_esri_json(arcgis: dict):
+    """
+    Raises an EsriJsonParserError for Esri Json that the 'strict' level rejects.
+    """
+    if 'features' in arcgis:
+        for feature in arcgis['features']:
+            check_esri_json(feature)
+    elif 'x' in arcgis and 'y' in arcgis:
+        # A point with x 'NaN' or None is the empty point
+        if arcgis['x'] not in ('NaN', None):
+            _check_position([arcgis[key] for key in ('x', 'y', 'z') if arcgis.get(key) is not None],
+                            EsriJsonParserError)
+    elif 'points' in arcgis:
+        _check_positions(arcgis['points'], 0, 'multipoint', EsriJsonParserError)
+    elif 'paths' in arcgis:
+        for path in arcgis['paths']:
+            _check_positions(path, 2, 'path', EsriJsonParserError)
+    elif 'rings' in arcgis:
+        for ring in arcgis['rings']:
+            _check_positions(ring, 4, 'ring', EsriJsonParserError, ring=True)
+    elif 'geometry' in arcgis and arcgis['geometry']:
+        check_esri_json(arcgis['geometry'])
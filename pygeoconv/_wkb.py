@@ -0,0 +1,290 @@
+"""
+Reader and writer for WKB, the binary form of WKT.
+
+Both the ISO flavour (Z, M and ZM as type codes 1000, 2000 and 3000 above the base type) and the extended flavour of
+PostGIS (Z, M and SRID as flags in the high bits of the type) are read. The coordinates of a ring, path or point list
+are unpacked in one pass over a memoryview of the buffer, without copying it.
+"""
+import struct
+
+from pygeoconv._numpy import COORDINATE_DEPTHS, import_numpy, is_array, validate_coords
+from pygeoconv.errors import WkbParserError
+
+BYTE_ORDERS = {'little': '<', 'big': '>'}
+
+_WKB_Z = 0x80000000
+_WKB_M = 0x40000000
+_WKB_SRID = 0x20000000
+
+_TYPES = {
+    1: 'Point',
+    2: 'LineString',
+    3: 'Polygon',
+    4: 'MultiPoint',
+    5: 'MultiLineString',
+    6: 'MultiPolygon',
+    7: 'GeometryCollection',
+}
+_CODES = {geometry_type: code for code, geometry_type in _TYPES.items()}
+
+# Member geometry type of each multi geometry
+_MEMBERS = {
+    'MultiPoint': 'Point',
+    'MultiLineString': 'LineString',
+    'MultiPolygon': 'Polygon',
+}
+
+# Same properties as the WKT readers give Z, M and ZM geometries
+_PROPERTIES = {
+    (True, False): {'z': True},
+    (False, True): {'m': True},
+    (True, True): {'z': True, 'm': True},
+}
+
+_HEADERS = {endian: struct.Struct(endian + 'BI') for endian in BYTE_ORDERS.values()}
+_UINT32 = {endian: struct.Struct(endian + 'I') for endian in BYTE_ORDERS.values()}
+_POSITIONS = {(endian, dimensions): struct.Struct(endian + 'd' * dimensions)
+              for endian in BYTE_ORDERS.values() for dimensions in (2, 3, 4)}
+
+_NAN = float('nan')
+
+
+def to_buffer(wkb):
+    """
+    Returns a memoryview of WKB given as bytes, bytearray or memoryview. Hex WKB, as a str or as ASCII bytes, is
+    decoded first. A WKB buffer starts with its byte order 0 or 1, hex WKB with the character '0'.
+    """
+    if isinstance(wkb, str):
+        return memoryview(bytes.fromhex(wkb))
+    view = memoryview(wkb).cast('B')
+    if len(view) and view[0] == ord('0'):
+        return memoryview(bytes.fromhex(bytes(view).decode('ascii')))
+    return view
+
+
+class WkbReader:
+    """
+    Parses a single WKB geometry. A reader holds the position in the buffer, create a new one per geometry. With
+    tuples the positions of rings, paths and point lists are the tuples struct unpacks, for output that is encoded
+    to JSON right away.
+    """
+
+    def __init__(self, wkb, coords: str = 'list', tuples: bool = False):
+        self._view = to_buffer(wkb)
+        self._numpy = import_numpy() if coords == 'numpy' else None
+        self._tuples = tuples
+        self._pos = 0
+
+    def read(self):
+        geometry = self._geometry()
+        if self._pos != len(self._view):
+            raise ValueError(f"Unexpected data after the geometry at byte {self._pos}")
+        return geometry
+
+    def _unpack(self, unpacker):
+        try:
+            values = unpacker.unpack_from(self._view, self._pos)
+        except struct.error:
+            raise ValueError(f"Unexpected end of WKB at byte {self._pos}") from None
+        self._pos += unpacker.size
+        return values
+
+    def _header(self):
+        if self._pos >= len(self._view):
+            raise ValueError(f"Unexpected end of WKB at byte {self._pos}")
+        byte_order = self._view[self._pos]
+        if byte_order > 1:
+            raise ValueError(f"Invalid byte order {byte_order} at byte {self._pos}")
+        endian = '<' if byte_order else '>'
+        code = self._unpack(_HEADERS[endian])[1]
+        has_z = bool(code & _WKB_Z)
+        has_m = bool(code & _WKB_M)
+        if code & _WKB_SRID:
+            # GeoJson has no spatial reference, the SRID is skipped
+            self._unpack(_UINT32[endian])
+        code &= 0x0FFFFFFF
+        dimensions, code = divmod(code, 1000)
+        if code not in _TYPES or dimensions > 3:
+            raise ValueError(f"Unknown geometry type {code + 1000 * dimensions}")
+        has_z = has_z or dimensions in (1, 3)
+        has_m = has_m or dimensions in (2, 3)
+        return _TYPES[code], endian, has_z, has_m
+
+    def _geometry(self, expected: str = None):
+        geometry_type, endian, has_z, has_m = self._header()
+        if expected is not None and geometry_type != expected:
+            raise ValueError(f"Expected a {expected} member, got a {geometry_type}")
+        dimensions = 2 + has_z + has_m
+        if geometry_type == 'Point':
+            value = list(self._unpack(_POSITIONS[endian, dimensions]))
+            if all(number != number for number in value):
+                # Empty points are written with NaN coordinates
+                value = []
+            elif self._numpy is not None:
+                value = self._numpy.array(value, dtype=self._numpy.float64)
+            member = 'coordinates'
+        elif geometry_type == 'LineString':
+            value = self._positions(endian, dimensions)
+            member = 'coordinates'
+        elif geometry_type == 'Polygon':
+            value = [self._positions(endian, dimensions) for _ in range(self._count(endian))]
+            member = 'coordinates'
+        elif geometry_type == 'GeometryCollection':
+            value = [self._geometry() for _ in range(self._count(endian))]
+            member = 'geometries'
+        else:
+            value = [self._geometry(_MEMBERS[geometry_type])['coordinates'] for _ in range(self._count(endian))]
+            member = 'coordinates'
+            if geometry_type == 'MultiPoint':
+                value = [position for position in value if len(position)]
+                if self._numpy is not None and value:
+                    value = self._numpy.array(value, dtype=self._numpy.float64)
+        geometry = {'type': geometry_type, member: value}
+        if has_z or has_m:
+            geometry['properties'] = dict(_PROPERTIES[has_z, has_m])
+        return geometry
+
+    def _count(self, endian):
+        return self._unpack(_UINT32[endian])[0]
+
+    def _positions(self, endian, dimensions):
+        count = self._count(endian)
+        size = count * dimensions * 8
+        if self._pos + size > len(self._view):
+            raise ValueError(f"Unexpected end of WKB at byte {self._pos}")
+        buffer = self._view[self._pos:self._pos + size]
+        self._pos += size
+        if self._numpy is not None:
+            if count == 0:
+                return []
+            numpy = self._numpy
+            return numpy.frombuffer(buffer, dtype=endian + 'f8').reshape(-1, dimensions).astype(numpy.float64)
+        positions = _POSITIONS[endian, dimensions].iter_unpack(buffer)
+        return list(positions) if self._tuples else list(map(list, positions))
+
+
+def wkb_to_geojson(wkb, coords: str = 'list') -> dict:
+    validate_coords(coords)
+    try:
+        return WkbReader(wkb, coords=coords).read()
+    except ImportError:
+        raise
+    except Exception as e:
+        raise WkbParserError(f"Unable to parse WKB: {e}")
+
+
+def _geometry_dimensions(geojson):
+    """
+    Returns (has_z, has_m) of a GeoJson geometry. Like the WKT writer this is taken from the length of the first
+    position, where three values are Z unless the geometry has the property m. Empty geometries use their z and m
+    properties and collections fall back to their first member.
+    """
+    properties = geojson.get('properties') or {}
+    if geojson['type'] == 'GeometryCollection':
+        if 'z' in properties or 'm' in properties:
+            return bool(properties.get('z')), bool(properties.get('m'))
+        for geometry in geojson['geometries']:
+            return _geometry_dimensions(geometry)
+        return False, False
+    if geojson['type'] not in COORDINATE_DEPTHS:
+        return False, False
+    position = geojson.get('coordinates', [])
+    for _ in range(COORDINATE_DEPTHS[geojson['type']]):
+        if len(position) == 0:
+            break
+        position = position[0]
+    if len(position) == 0:
+        return bool(properties.get('z')), bool(properties.get('m'))
+    if len(position) == 3:
+        return (False, True) if properties.get('m') == True else (True, False)
+    return len(position) == 4, len(position) == 4
+
+
+class WkbWriter:
+    """
+    Writes GeoJson geometries as WKB, ISO WKB by default or extended WKB with an optional SRID. The parts are
+    collected in a list and joined once.
+    """
+
+    def __init__(self, byte_order: str = 'little', extended: bool = False, srid: int = None):
+        if byte_order not in BYTE_ORDERS:
+            raise ValueError(f"Unknown byte order {byte_order!r}, expected one of {tuple(BYTE_ORDERS)}")
+        if srid is not None and not extended:
+            raise ValueError("An SRID can only be written to extended WKB, set extended=True")
+        self._endian = BYTE_ORDERS[byte_order]
+        self._byte_order = b'\x01' if byte_order == 'little' else b'\x00'
+        self._extended = extended
+        self._srid = srid
+        self._parts = []
+
+    def write(self, geojson):
+        self._parts = []
+        self._geometry(geojson, _geometry_dimensions(geojson), self._srid)
+        return b''.join(self._parts)
+
+    def _header(self, geometry_type, dimensions, srid=None):
+        has_z, has_m = dimensions
+        code = _CODES[geometry_type]
+        if self._extended:
+            code |= (_WKB_Z if has_z else 0) | (_WKB_M if has_m else 0) | (_WKB_SRID if srid is not None else 0)
+        else:
+            code += 1000 * has_z + 2000 * has_m
+        self._parts.append(self._byte_order)
+        self._parts.append(_UINT32[self._endian].pack(code))
+        if srid is not None:
+            self._parts.append(_UINT32[self._endian].pack(srid))
+
+    def _count(self, count):
+        self._parts.append(_UINT32[self._endian].pack(count))
+
+    def _geometry(self, geojson, dimensions, srid=None):
+        geometry_type = geojson['type']
+        if geometry_type not in _CODES:
+            raise ValueError('Unknown Type: ' + geometry_type)
+        self._header(geometry_type, dimensions, srid)
+        if geometry_type == 'GeometryCollection':
+            self._count(len(geojson['geometries']))
+            for geometry in geojson['geometries']:
+                self._geometry(geometry, _geometry_dimensions(geometry))
+            return
+        coordinates = geojson.get('coordinates', [])
+        if geometry_type == 'Point':
+            if len(coordinates) == 0:
+                coordinates = [_NAN] * (2 + sum(dimensions))
+            self._parts.append(self._pack([coordinates], dimensions))
+        elif geometry_type == 'LineString':
+            self._positions(coordinates, dimensions)
+        elif geometry_type == 'Polygon':
+            self._count(len(coordinates))
+            for ring in coordinates:
+                self._positions(ring, dimensions)
+        else:
+            member = _MEMBERS[geometry_type]
+            self._count(len(coordinates))
+            for member_coordinates in coordinates:
+                self._geometry({'type': member, 'coordinates': member_coordinates}, dimensions)
+
+    def _positions(self, positions, dimensions):
+        self._count(len(positions))
+        if len(positions):
+            self._parts.append(self._pack(positions, dimensions))
+
+    def _pack(self, positions, dimensions):
+        size = 2 + sum(dimensions)
+        if is_array(positions):
+            numpy = import_numpy()
+            if positions.ndim != 2 or positions.shape[1] != size:
+                raise ValueError(f"Expected positions with {size} values, got an array of shape {positions.shape}")
+            return numpy.ascontiguousarray(positions, dtype=self._endian + 'f8').tobytes()
+        values = [value for position in positions for value in position]
+        if len(values) != len(positions) * size:
+            raise ValueError(f"Expected positions with {size} values, got positions of mixed dimensions")
+        return struct.pack(self._endian + 'd' * len(values), *values)
+
+
+def geojson_to_wkb(geojson, byte_order: str = 'little', extended: bool = False, srid: int = None,
+                   as_hex: bool = False):
+    wkb = WkbWriter(byte_order=byte_order, extended=extended, srid=srid).write(geojson)
+    if as_hex:
+        return wkb.hex().upper()
+    return wkb
@@ -1,157 +1,402 @@
-from pygeoconv._wkt_parser import wkt_parser
-from pygeoconv.errors import WktParserError
+import re
+from itertools import islice
 
+from pygeoconv._esri_json import esri_json_to_geojson, group_rings
+from pygeoconv._geojson import geojson_to_arcgis
+from pygeoconv._io import BLOCK_SIZE, iter_blocks, open_file, validate_block_size, validate_errors
+from pygeoconv._numpy import geojson_to_arrays, is_array, validate_coords
+from pygeoconv.errors import GeojsonParserError, WktParserError
 
-def _array_to_ring(arr):
-    parts = []
-    for item in arr:
-        parts.append(' '.join(str(x) for x in item))
-    return '(' + ', '.join(parts) + ')'
+ENGINES = ('native', 'ply')
 
 
-def _point_to_wkt_point(geojson):
-    ret = 'POINT '
-    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0:
-        ret += 'EMPTY'
-        return ret
-    elif len(geojson['coordinates']) == 3:
-        if 'properties' in geojson and geojson['properties'].get('m') == True:
-            ret += 'M '
-        else:
-            ret += 'Z '
-    elif len(geojson['coordinates']) == 4:
-        ret += 'ZM '
-    ret += '(' + ' '.join(str(x) for x in geojson['coordinates']) + ')'
-    return ret
-
-
-def _line_string_to_wkt_line_string(geojson):
-    ret = 'LINESTRING '
-    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0 or len(geojson['coordinates'][0]) == 0:
-        ret += 'EMPTY'
-        return ret
-    elif len(geojson['coordinates'][0]) == 3:
-        if 'properties' in geojson and geojson['properties'].get('m') == True:
-            ret += 'M '
-        else:
-            ret += 'Z '
-    elif len(geojson['coordinates'][0]) == 4:
-        ret += 'ZM '
-    ret += _array_to_ring(geojson['coordinates'])
-    return ret
-
-
-def _polygon_to_wkt_polygon(geojson):
-    ret = 'POLYGON '
-    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0 or len(geojson['coordinates'][0]) == 0:
-        ret += 'EMPTY'
-        return ret
-    elif len(geojson['coordinates'][0][0]) == 3:
-        if 'properties' in geojson and geojson['properties'].get('m') == True:
-            ret += 'M '
-        else:
-            ret += 'Z '
-    elif len(geojson['coordinates'][0][0]) == 4:
-        ret += 'ZM '
-    ret += '('
-    parts = []
-    for item in geojson['coordinates']:
-        parts.append(_array_to_ring(item))
-    ret += ', '.join(parts)
-    ret += ')'
-    return ret
-
-
-def _multi_point_to_wkt_multi_point(geojson):
-    ret = 'MULTIPOINT '
-    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0 or len(geojson['coordinates'][0]) == 0:
-        ret += 'EMPTY'
-        return ret
-    elif len(geojson['coordinates'][0]) == 3:
-        if 'properties' in geojson and geojson['properties'].get('m') == True:
-            ret += 'M '
+PRECISION_MODES = ('decimals', 'significant')
+
+# Number of positions formatted into one piece of text, bounds the size of the pieces yielded for long rings
+_RING_BLOCK = 4096
+
+CHUNK_SIZE = 65536
+
+FILE_OUTPUTS = ('geojson', 'esri')
+
+# Fixed decimals are written with trailing zeros, these are trimmed from every number of a formatted block in two
+# passes, the zeros and then a decimal point left at the end. Every number written with decimals has a decimal point,
+# so the zeros of its integer part are never trimmed. A number rounded to zero keeps its sign, '-0' is written as '0'.
+# The patterns start with a literal character, which keeps the scans over long blocks fast.
+_TRAILING_ZEROS_RE = re.compile(r'0+(?=[ ,]|$)')
+_TRAILING_POINT_RE = re.compile(r'\.(?=[ ,]|$)')
+_NEGATIVE_ZERO_RE = re.compile(r'-0(?![^ ,])(?<![^ ,]-0)')
+
+
+class _PositionFormats(dict):
+    # Format strings for positions by their number of values, built on first use
+
+    def __init__(self, number):
+        super().__init__()
+        self.number = number
+
+    def __missing__(self, dimensions):
+        value = self[dimensions] = ' '.join([self.number] * dimensions)
+        return value
+
+
+class Formatter:
+    """
+    Formats positions as WKT text. The numbers of a whole block of positions are formatted with a single %-format
+    call. Without precision numbers are written as str() writes them, with precision they are rounded to a number of
+    decimals or significant digits and trailing zeros are trimmed.
+    """
+
+    def __init__(self, precision: int = None, precision_mode: str = 'decimals'):
+        if precision_mode not in PRECISION_MODES:
+            raise ValueError(f"Unknown precision mode {precision_mode!r}, expected one of {PRECISION_MODES}")
+        minimum = 0 if precision_mode == 'decimals' else 1
+        if precision is not None and (not isinstance(precision, int) or isinstance(precision, bool) or
+                                      precision < minimum):
+            raise ValueError(f"Precision must be None or an int of at least {minimum}, got {precision!r}")
+        self._trim = precision is not None and precision_mode == 'decimals' and precision > 0
+        self._clean = precision is not None
+        if precision is None:
+            number = '%s'
+        elif precision_mode == 'decimals':
+            number = f'%.{precision}f'
         else:
-            ret += 'Z '
-    elif len(geojson['coordinates'][0]) == 4:
-        ret += 'ZM '
-    ret += _array_to_ring(geojson['coordinates'])
-    return ret
-
-
-def _multi_line_string_to_wkt_multi_line_string(geojson):
-    ret = 'MULTILINESTRING '
-    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0 or len(geojson['coordinates'][0]) == 0:
-        ret += 'EMPTY'
-        return ret
-    elif len(geojson['coordinates'][0][0]) == 3:
-        if 'properties' in geojson and geojson['properties'].get('m') == True:
-            ret += 'M '
+            number = f'%.{precision}g'
+        self._formats = _PositionFormats(number)
+
+    def positions(self, positions):
+        if is_array(positions):
+            rows, dimensions = positions.shape
+            text = ', '.join([self._formats[dimensions]] * rows) % tuple(positions.ravel().tolist())
         else:
-            ret += 'Z '
-    elif len(geojson['coordinates'][0][0]) == 4:
-        ret += 'ZM '
-    ret += '('
-    parts = []
-    for item in geojson['coordinates']:
-        parts.append(_array_to_ring(item))
-    ret += ', '.join(parts)
-    ret += ')'
-    return ret
-
-
-def _multi_polygon_to_wkt_multi_polygon(geojson):
-    ret = 'MULTIPOLYGON '
-    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0 or len(geojson['coordinates'][0]) == 0:
-        ret += 'EMPTY'
-        return ret
-    elif len(geojson['coordinates'][0][0][0]) == 3:
+            formats = self._formats
+            text = ', '.join([formats[len(position)] for position in positions]) % \
+                tuple([value for position in positions for value in position])
+        if self._trim:
+            text = _TRAILING_POINT_RE.sub('', _TRAILING_ZEROS_RE.sub('', text))
+        if self._clean:
+            text = _NEGATIVE_ZERO_RE.sub('0', text)
+        return text
+
+    def position(self, position):
+        return self.positions([position])
+
+
+_FORMATTER = Formatter()
+
+
+def get_formatter(precision: int = None, precision_mode: str = 'decimals'):
+    if precision is None and precision_mode == 'decimals':
+        return _FORMATTER
+    return Formatter(precision, precision_mode)
+
+
+def _array_to_ring(arr, formatter=_FORMATTER):
+    return ''.join(_iter_ring(arr, formatter))
+
+
+def _iter_ring(arr, formatter):
+    if is_array(arr):
+        blocks = (arr[start:start + _RING_BLOCK] for start in range(0, len(arr), _RING_BLOCK))
+    else:
+        # Also takes iterators, such as reversed rings of the Esri Json writer
+        iterator = iter(arr)
+        blocks = iter(lambda: list(islice(iterator, _RING_BLOCK)), [])
+    prefix = '('
+    for block in blocks:
+        yield prefix + formatter.positions(block)
+        prefix = ', '
+    yield ')' if prefix == ', ' else '()'
+
+
+def _dimensions(geojson, position):
+    if len(position) == 3:
         if 'properties' in geojson and geojson['properties'].get('m') == True:
-            ret += 'M '
+            return 'M '
+        return 'Z '
+    elif len(position) == 4:
+        return 'ZM '
+    return ''
+
+
+def _is_empty(geojson):
+    return 'coordinates' not in geojson or len(geojson['coordinates']) == 0 or len(geojson['coordinates'][0]) == 0
+
+
+def _iter_rings(rings, formatter):
+    separator = '('
+    for ring in rings:
+        # Rings of up to one block are formatted in one go, without a generator per ring
+        if len(ring) <= _RING_BLOCK:
+            yield separator + '(' + formatter.positions(ring) + ')'
         else:
-            ret += 'Z '
-    elif len(geojson['coordinates'][0][0][0]) == 4:
-        ret += 'ZM '
-    ret += '('
-    inner = []
-    for item in geojson['coordinates']:
-        it = '('
-        parts = []
-        for subitem in item:
-            parts.append(_array_to_ring(subitem))
-        it += ', '.join(parts)
-        it += ')'
-        inner.append(it)
-    ret += ', '.join(inner)
-    ret += ')'
-    return ret
-
-
-def geojson_to_wkt(geojson):
-    if geojson['type'] == 'Point':
-        return _point_to_wkt_point(geojson)
-    elif geojson['type'] == 'LineString':
-        return _line_string_to_wkt_line_string(geojson)
-    elif geojson['type'] == 'Polygon':
-        return _polygon_to_wkt_polygon(geojson)
-    elif geojson['type'] == 'MultiPoint':
-        return _multi_point_to_wkt_multi_point(geojson)
-    elif geojson['type'] == 'MultiLineString':
-        return _multi_line_string_to_wkt_multi_line_string(geojson)
-    elif geojson['type'] == 'MultiPolygon':
-        return _multi_polygon_to_wkt_multi_polygon(geojson)
-    elif geojson['type'] == 'GeometryCollection':
-        ret = 'GEOMETRYCOLLECTION'
-        parts = []
-        for item in geojson['geometries']:
-            parts.append(geojson_to_wkt(item))
-        return ret + '(' + ', '.join(parts) + ')'
-    else:
+            yield separator
+            yield from _iter_ring(ring, formatter)
+        separator = ', '
+    yield ')' if separator == ', ' else '()'
+
+
+def _iter_wkt_point(geojson, formatter):
+    if 'coordinates' not in geojson or len(geojson['coordinates']) == 0:
+        yield 'POINT EMPTY'
+        return
+    coordinates = geojson['coordinates']
+    if is_array(coordinates):
+        coordinates = coordinates.tolist()
+    yield 'POINT ' + _dimensions(geojson, coordinates) + '(' + formatter.position(coordinates) + ')'
+
+
+def _iter_wkt_line_string(geojson, formatter, name='LINESTRING'):
+    if _is_empty(geojson):
+        yield name + ' EMPTY'
+        return
+    yield name + ' ' + _dimensions(geojson, geojson['coordinates'][0])
+    yield from _iter_ring(geojson['coordinates'], formatter)
+
+
+def _iter_wkt_multi_point(geojson, formatter):
+    return _iter_wkt_line_string(geojson, formatter, name='MULTIPOINT')
+
+
+def _iter_wkt_polygon(geojson, formatter, name='POLYGON'):
+    if _is_empty(geojson):
+        yield name + ' EMPTY'
+        return
+    yield name + ' ' + _dimensions(geojson, geojson['coordinates'][0][0])
+    yield from _iter_rings(geojson['coordinates'], formatter)
+
+
+def _iter_wkt_multi_line_string(geojson, formatter):
+    return _iter_wkt_polygon(geojson, formatter, name='MULTILINESTRING')
+
+
+def _iter_wkt_multi_polygon(geojson, formatter):
+    if _is_empty(geojson):
+        yield 'MULTIPOLYGON EMPTY'
+        return
+    yield 'MULTIPOLYGON ' + _dimensions(geojson, geojson['coordinates'][0][0][0]) + '('
+    for i, polygon in enumerate(geojson['coordinates']):
+        if i:
+            yield ', '
+        yield from _iter_rings(polygon, formatter)
+    yield ')'
+
+
+def _iter_wkt_geometry_collection(geojson, formatter):
+    yield 'GEOMETRYCOLLECTION('
+    for i, geometry in enumerate(geojson['geometries']):
+        if i:
+            yield ', '
+        yield from iter_wkt(geometry, formatter)
+    yield ')'
+
+
+_WRITERS = {
+    'Point': _iter_wkt_point,
+    'LineString': _iter_wkt_line_string,
+    'Polygon': _iter_wkt_polygon,
+    'MultiPoint': _iter_wkt_multi_point,
+    'MultiLineString': _iter_wkt_multi_line_string,
+    'MultiPolygon': _iter_wkt_multi_polygon,
+    'GeometryCollection': _iter_wkt_geometry_collection,
+}
+
+
+def iter_wkt(geojson, formatter=_FORMATTER):
+    """
+    Yields the WKT of a GeoJson geometry in pieces. Rings are formatted in blocks of _RING_BLOCK positions, so no
+    piece holds more than one block of a ring.
+    """
+    writer = _WRITERS.get(geojson['type'])
+    if writer is None:
         raise ValueError('Unknown Type: ' + geojson['type'])
+    return writer(geojson, formatter)
+
+
+def _chunks(parts, chunk_size):
+    buffer = []
+    length = 0
+    for part in parts:
+        buffer.append(part)
+        length += len(part)
+        if length >= chunk_size:
+            yield ''.join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_geojson_to_wkt(geojson, chunk_size: int = CHUNK_SIZE, precision: int = None,
+                        precision_mode: str = 'decimals'):
+    """
+    Yields the WKT of a GeoJson geometry in chunks of about chunk_size characters, a chunk only exceeds it by the
+    size of the last piece added to it.
+    """
+    return _chunks(iter_wkt(geojson, get_formatter(precision, precision_mode)), chunk_size)
+
+
+def geojson_to_wkt(geojson, out=None, precision: int = None, precision_mode: str = 'decimals'):
+    formatter = get_formatter(precision, precision_mode)
+    if out is None:
+        return ''.join(iter_wkt(geojson, formatter))
+    for chunk in _chunks(iter_wkt(geojson, formatter), CHUNK_SIZE):
+        out.write(chunk)
+
+
+def _esri_tag(position):
+    # Esri Json has no M only flag, three values are written as Z like geojson_to_wkt does without properties
+    if len(position) == 3:
+        return 'Z '
+    elif len(position) == 4:
+        return 'ZM '
+    return ''
 
 
-def wkt_to_geojson(wkt: str) -> dict:
+def _esri_points_to_wkt(points, formatter):
+    if len(points) == 0 or len(points[0]) == 0:
+        return 'MULTIPOINT EMPTY'
+    return 'MULTIPOINT ' + _esri_tag(points[0]) + _array_to_ring(points, formatter)
+
+
+def _esri_paths_to_wkt(paths, formatter):
+    if len(paths) == 1:
+        path = paths[0]
+        if len(path) == 0 or len(path[0]) == 0:
+            return 'LINESTRING EMPTY'
+        return 'LINESTRING ' + _esri_tag(path[0]) + _array_to_ring(path, formatter)
+    if len(paths) == 0 or len(paths[0]) == 0:
+        return 'MULTILINESTRING EMPTY'
+    return 'MULTILINESTRING ' + _esri_tag(paths[0][0]) + \
+        '(' + ', '.join(_array_to_ring(path, formatter) for path in paths) + ')'
+
+
+def _esri_polygon_to_wkt(polygon, formatter):
+    # Rings are written backwards where GeoJson winding reverses them, without a reversed copy
+    return '(' + ', '.join(_array_to_ring(reversed(ring) if wind else ring, formatter) for ring, wind in polygon) + ')'
+
+
+def _esri_rings_to_wkt(rings, formatter):
+    polygons = group_rings(rings)
+    if len(polygons) == 1:
+        # Closed rings start and end with the same position, so the first position is the same in either direction
+        return 'POLYGON ' + _esri_tag(polygons[0][0][0][0]) + _esri_polygon_to_wkt(polygons[0], formatter)
+    if len(polygons) == 0:
+        return 'MULTIPOLYGON EMPTY'
+    return 'MULTIPOLYGON ' + _esri_tag(polygons[0][0][0][0]) + \
+        '(' + ', '.join(_esri_polygon_to_wkt(polygon, formatter) for polygon in polygons) + ')'
+
+
+def esri_json_to_wkt(arcgis: dict, precision: int = None, precision_mode: str = 'decimals'):
+    """
+    Converts Esri Json to WKT. Multipoints, polylines and polygons are written straight from their points, paths
+    and rings, everything else is converted through GeoJson. The output is the same as converting to GeoJson first.
+    """
+    formatter = get_formatter(precision, precision_mode)
+    if 'features' not in arcgis and not ('x' in arcgis and 'y' in arcgis):
+        if 'points' in arcgis:
+            return _esri_points_to_wkt(arcgis['points'], formatter)
+        elif 'paths' in arcgis:
+            return _esri_paths_to_wkt(arcgis['paths'], formatter)
+        elif 'rings' in arcgis:
+            return _esri_rings_to_wkt(arcgis['rings'], formatter)
+    return ''.join(iter_wkt(esri_json_to_geojson(arcgis), formatter))
+
+
+def wkt_to_geojson(wkt: str, engine: str = 'native', coords: str = 'list') -> dict:
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown WKT engine {engine!r}, expected one of {ENGINES}")
+    validate_coords(coords)
+    # The parsers are imported on first use so that processes which never parse WKT do not pay for building them
     try:
-        parsed = wkt_parser.parse(wkt)
+        if engine == 'ply':
+            from pygeoconv._wkt_parser import thread_parser
+            parser, lexer = thread_parser()
+            if not isinstance(wkt, str):
+                # The PLY lexer only scans str, bytes-like input is decoded first
+                wkt = str(wkt, 'ascii')
+            parsed = parser.parse(wkt, lexer=lexer)
+            if coords == 'numpy':
+                parsed = geojson_to_arrays(parsed)
+        else:
+            from pygeoconv._wkt_reader import read_wkt
+            parsed = read_wkt(wkt, coords=coords)
         return parsed
+    except ImportError:
+        raise
     except Exception as e:
         raise WktParserError(f"Unable to parse WKT string: {e}")
+
+
+def wkt_to_arcgis(wkt: str, wkid: int = 4326, engine: str = 'native'):
+    if engine == 'native':
+        # The native reader builds the Esri geometries while parsing, without a GeoJson copy of the coordinates
+        from pygeoconv._wkt_reader import read_wkt_esri
+        try:
+            return read_wkt_esri(wkt, wkid)
+        except Exception:
+            # Invalid input and geometries the Esri conversion rejects take the GeoJson route, which raises the
+            # errors of the two separate conversions
+            pass
+    return geojson_to_arcgis(wkt_to_geojson(wkt, engine=engine), wkid=wkid, copy=False)
+
+
+def _iter_wkt_lines(fp, to, wkid, errors, block_size):
+    from pygeoconv._wkt_reader import EsriWktReader, WktReader
+    line_number = 0
+    for block, end in iter_blocks(fp, block_size):
+        # One reader per block, it is moved from line to line and parses each of them in place
+        reader = WktReader(block) if to == 'geojson' else EsriWktReader(block, wkid)
+        newline = '\n' if isinstance(block, str) else b'\n'
+        start = 0
+        while True:
+            stop = block.find(newline, start, end)
+            if stop < 0:
+                stop = end
+            line_number += 1
+            try:
+                reader.seek(start, stop)
+                geometry = None if reader.at_end() else reader.read()
+            except Exception as e:
+                geometry = _line_error(block[start:stop], to, wkid, errors, line_number, e)
+            if geometry is not None:
+                yield line_number, geometry
+            if stop == end:
+                break
+            start = stop + 1
+
+
+def _line_error(line, to, wkid, errors, line_number, error):
+    if to == 'esri':
+        # Same as wkt_to_arcgis, geometries the direct conversion rejects take the GeoJson route. WKT that does not
+        # parse is reported with the error of the reader, a failed conversion with the error of geojson_to_arcgis.
+        from pygeoconv._wkt_reader import read_wkt
+        try:
+            geojson = read_wkt(line)
+        except Exception:
+            geojson = None
+        if geojson is not None:
+            try:
+                return geojson_to_arcgis(geojson, wkid=wkid, copy=False)
+            except Exception as e:
+                if errors == 'skip':
+                    return None
+                raise GeojsonParserError(f"Unable to convert the geometry on line {line_number}: {e}") from e
+    if errors == 'skip':
+        return None
+    raise WktParserError(f"Unable to parse WKT string on line {line_number}: {error}") from error
+
+
+def _iter_wkt_file(path_or_fp, to, wkid, errors, block_size):
+    with open_file(path_or_fp) as fp:
+        yield from _iter_wkt_lines(fp, to, wkid, errors, block_size)
+
+
+def iter_wkt_file(path_or_fp, to: str = 'geojson', wkid: int = 4326, errors: str = 'raise',
+                  block_size: int = BLOCK_SIZE):
+    # Arguments are checked here and not in the generator, so invalid ones raise before the first line is read
+    if to not in FILE_OUTPUTS:
+        raise ValueError(f"Unknown output {to!r}, expected one of {FILE_OUTPUTS}")
+    validate_errors(errors)
+    validate_block_size(block_size)
+    return _iter_wkt_file(path_or_fp, to, wkid, errors, block_size)
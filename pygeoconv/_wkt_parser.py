@@ -1,6 +1,14 @@
 # Lexer tokens
+import copy
+import os
+import sys
+import threading
+import types
+import warnings
+import zlib
+
 from pygeoconv.ply.lex import lex
-from pygeoconv.ply.yacc import yacc
+from pygeoconv.ply.yacc import LRParser, yacc
 
 tokens = (
     'LPAREN',
@@ -133,13 +141,16 @@ def p_coordinate(p):
     p[0] = [x for x in p[1:]]
 
 
+# The list productions below extend the list built for the left operand in place. Concatenating would copy the
+# accumulated list on every comma and make parsing quadratic in the number of elements.
 def p_ptarray(p):
     '''ptarray : ptarray COMMA coordinate
                | coordinate'''
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_ring_list(p):
@@ -148,7 +159,8 @@ def p_ring_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_ring(p):
@@ -198,7 +210,8 @@ def p_polygon_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_polygon_untagged(p):
@@ -212,7 +225,8 @@ def p_point_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_linestring(p):
@@ -357,7 +371,8 @@ def p_geometry_collection(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_geometrycollection(p):
@@ -392,5 +407,90 @@ def p_error(p):
         raise SyntaxError("Syntax error at EOF")
 
 
+# The LR tables are generated from the p_ functions above and shipped in _wkt_parsetab so that importing the parser
+# does not run PLY's grammar reflection and LALR construction. Regenerate them after changing the grammar with
+#     python -m pygeoconv._wkt_parser
+
+TABLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_wkt_parsetab.py')
+
+
+class _TableProduction:
+    """
+    Production restored from the generated tables, holds the attributes LRParser uses when reducing.
+    """
+
+    def __init__(self, str, name, len, func):
+        self.str = str
+        self.name = name
+        self.len = len
+        self.func = func
+        self.callable = globals()[func] if func else None
+
+    def __str__(self):
+        return self.str
+
+
+def grammar_signature():
+    """
+    Checksum over the tokens and the grammar rules of the p_ functions in declaration order.
+    """
+    rules = sorted((value.__code__.co_firstlineno, name, value.__doc__) for name, value in globals().items()
+                   if name.startswith('p_') and name != 'p_error' and isinstance(value, types.FunctionType))
+    text = ' '.join(tokens) + ''.join(f'\n{name}: {doc}' for _, name, doc in rules)
+    return format(zlib.crc32(text.encode('utf-8')), '08x')
+
+
+def write_tables(path=TABLES_FILE):
+    parser = yacc(module=sys.modules[__name__])
+    with open(path, 'w') as f:
+        f.write('# Generated from the grammar in _wkt_parser.py by running python -m pygeoconv._wkt_parser\n')
+        f.write('# Do not edit by hand.\n\n')
+        f.write(f'signature = {grammar_signature()!r}\n\n')
+        f.write('productions = [\n')
+        for p in parser.productions:
+            f.write(f'    ({p.str!r}, {p.name!r}, {p.len!r}, {p.func!r}),\n')
+        f.write(']\n\n')
+        for name, table in (('action', parser.action), ('goto', parser.goto)):
+            f.write(f'{name} = {{\n')
+            for state in sorted(table):
+                f.write(f'    {state!r}: {table[state]!r},\n')
+            f.write('}\n\n')
+
+
+def _load_parser():
+    try:
+        from pygeoconv import _wkt_parsetab as tables
+    except ImportError:
+        tables = None
+    if tables is None or tables.signature != grammar_signature():
+        warnings.warn('WKT parser tables are missing or out of date, building them at runtime. '
+                      'Regenerate them with python -m pygeoconv._wkt_parser', RuntimeWarning)
+        return yacc(module=sys.modules[__name__])
+    lrtab = types.SimpleNamespace(lr_productions=[_TableProduction(*p) for p in tables.productions],
+                                  lr_action=tables.action,
+                                  lr_goto=tables.goto)
+    return LRParser(lrtab, p_error)
+
+
 wkt_lexer = lex()
-wkt_parser = yacc()
\ No newline at end of file
+wkt_parser = _load_parser()
+
+_thread_state = threading.local()
+
+
+def thread_parser():
+    """
+    Returns a (parser, lexer) pair owned by the calling thread. LRParser keeps its parse stacks on the instance and
+    the lexer keeps its input and position, so the module level wkt_parser and wkt_lexer must not be shared between
+    threads. The copies share the read only LR tables and lexer regexes.
+    """
+    try:
+        return _thread_state.parser, _thread_state.lexer
+    except AttributeError:
+        _thread_state.parser = copy.copy(wkt_parser)
+        _thread_state.lexer = wkt_lexer.clone()
+        return _thread_state.parser, _thread_state.lexer
+
+
+if __name__ == '__main__':
+    write_tables()
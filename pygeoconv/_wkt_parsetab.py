@@ -0,0 +1,409 @@
+# Generated from the grammar in _wkt_parser.py by running python -m pygeoconv._wkt_parser
+# Do not edit by hand.
+
+signature = 'f6689b3d'
+
+productions = [
+    ("S' -> expressions", "S'", 1, None),
+    ('expressions -> point', 'expressions', 1, 'p_expressions'),
+    ('expressions -> linestring', 'expressions', 1, 'p_expressions'),
+    ('expressions -> polygon', 'expressions', 1, 'p_expressions'),
+    ('expressions -> multipoint', 'expressions', 1, 'p_expressions'),
+    ('expressions -> multilinestring', 'expressions', 1, 'p_expressions'),
+    ('expressions -> multipolygon', 'expressions', 1, 'p_expressions'),
+    ('expressions -> geometrycollection', 'expressions', 1, 'p_expressions'),
+    ('coordinate -> DOUBLE_TOK DOUBLE_TOK', 'coordinate', 2, 'p_coordinate'),
+    ('coordinate -> DOUBLE_TOK DOUBLE_TOK DOUBLE_TOK', 'coordinate', 3, 'p_coordinate'),
+    ('coordinate -> DOUBLE_TOK DOUBLE_TOK DOUBLE_TOK DOUBLE_TOK', 'coordinate', 4, 'p_coordinate'),
+    ('ptarray -> ptarray COMMA coordinate', 'ptarray', 3, 'p_ptarray'),
+    ('ptarray -> coordinate', 'ptarray', 1, 'p_ptarray'),
+    ('ring_list -> ring_list COMMA ring', 'ring_list', 3, 'p_ring_list'),
+    ('ring_list -> ring', 'ring_list', 1, 'p_ring_list'),
+    ('ring -> LPAREN ptarray RPAREN', 'ring', 3, 'p_ring'),
+    ('point -> POINT LPAREN coordinate RPAREN', 'point', 4, 'p_point'),
+    ('point -> POINT Z LPAREN coordinate RPAREN', 'point', 5, 'p_point_dimensions'),
+    ('point -> POINT ZM LPAREN coordinate RPAREN', 'point', 5, 'p_point_dimensions'),
+    ('point -> POINT M LPAREN coordinate RPAREN', 'point', 5, 'p_point_dimensions'),
+    ('point -> POINT EMPTY', 'point', 2, 'p_point_empty'),
+    ('point_untagged -> coordinate', 'point_untagged', 1, 'p_point_untagged'),
+    ('point_untagged -> LPAREN coordinate RPAREN', 'point_untagged', 3, 'p_point_untagged'),
+    ('polygon_list -> polygon_list COMMA polygon_untagged', 'polygon_list', 3, 'p_polygon_list'),
+    ('polygon_list -> polygon_untagged', 'polygon_list', 1, 'p_polygon_list'),
+    ('polygon_untagged -> LPAREN ring_list RPAREN', 'polygon_untagged', 3, 'p_polygon_untagged'),
+    ('point_list -> point_list COMMA point_untagged', 'point_list', 3, 'p_point_list'),
+    ('point_list -> point_untagged', 'point_list', 1, 'p_point_list'),
+    ('linestring -> LINESTRING LPAREN point_list RPAREN', 'linestring', 4, 'p_linestring'),
+    ('linestring -> LINESTRING Z LPAREN point_list RPAREN', 'linestring', 5, 'p_linestring_dimensions'),
+    ('linestring -> LINESTRING M LPAREN point_list RPAREN', 'linestring', 5, 'p_linestring_dimensions'),
+    ('linestring -> LINESTRING ZM LPAREN point_list RPAREN', 'linestring', 5, 'p_linestring_dimensions'),
+    ('linestring -> LINESTRING EMPTY', 'linestring', 2, 'p_linestring_empty'),
+    ('polygon -> POLYGON LPAREN ring_list RPAREN', 'polygon', 4, 'p_polygon'),
+    ('polygon -> POLYGON Z LPAREN ring_list RPAREN', 'polygon', 5, 'p_polygon_dimensions'),
+    ('polygon -> POLYGON M LPAREN ring_list RPAREN', 'polygon', 5, 'p_polygon_dimensions'),
+    ('polygon -> POLYGON ZM LPAREN ring_list RPAREN', 'polygon', 5, 'p_polygon_dimensions'),
+    ('polygon -> POLYGON EMPTY', 'polygon', 2, 'p_polygon_empty'),
+    ('multipoint -> MULTIPOINT LPAREN point_list RPAREN', 'multipoint', 4, 'p_multipoint'),
+    ('multipoint -> MULTIPOINT Z LPAREN point_list RPAREN', 'multipoint', 5, 'p_multipoint_dimensions'),
+    ('multipoint -> MULTIPOINT M LPAREN point_list RPAREN', 'multipoint', 5, 'p_multipoint_dimensions'),
+    ('multipoint -> MULTIPOINT ZM LPAREN point_list RPAREN', 'multipoint', 5, 'p_multipoint_dimensions'),
+    ('multipoint -> MULTIPOINT EMPTY', 'multipoint', 2, 'p_multipoint_empty'),
+    ('multilinestring -> MULTILINESTRING LPAREN ring_list RPAREN', 'multilinestring', 4, 'p_multilinestring'),
+    ('multilinestring -> MULTILINESTRING Z LPAREN ring_list RPAREN', 'multilinestring', 5, 'p_multilinestring_dimensions'),
+    ('multilinestring -> MULTILINESTRING M LPAREN ring_list RPAREN', 'multilinestring', 5, 'p_multilinestring_dimensions'),
+    ('multilinestring -> MULTILINESTRING ZM LPAREN ring_list RPAREN', 'multilinestring', 5, 'p_multilinestring_dimensions'),
+    ('multilinestring -> MULTILINESTRING EMPTY', 'multilinestring', 2, 'p_multilinestring_empty'),
+    ('multipolygon -> MULTIPOLYGON LPAREN polygon_list RPAREN', 'multipolygon', 4, 'p_multipolygon'),
+    ('multipolygon -> MULTIPOLYGON Z LPAREN polygon_list RPAREN', 'multipolygon', 5, 'p_multipolygon_dimensions'),
+    ('multipolygon -> MULTIPOLYGON M LPAREN polygon_list RPAREN', 'multipolygon', 5, 'p_multipolygon_dimensions'),
+    ('multipolygon -> MULTIPOLYGON ZM LPAREN polygon_list RPAREN', 'multipolygon', 5, 'p_multipolygon_dimensions'),
+    ('multipolygon -> MULTIPOLYGON EMPTY', 'multipolygon', 2, 'p_multipolygon_empty'),
+    ('geometry -> point', 'geometry', 1, 'p_geometry'),
+    ('geometry -> linestring', 'geometry', 1, 'p_geometry'),
+    ('geometry -> polygon', 'geometry', 1, 'p_geometry'),
+    ('geometry -> multipoint', 'geometry', 1, 'p_geometry'),
+    ('geometry -> multilinestring', 'geometry', 1, 'p_geometry'),
+    ('geometry -> multipolygon', 'geometry', 1, 'p_geometry'),
+    ('geometry -> geometrycollection', 'geometry', 1, 'p_geometry'),
+    ('geometry_collection -> geometry_collection COMMA geometry', 'geometry_collection', 3, 'p_geometry_collection'),
+    ('geometry_collection -> geometry', 'geometry_collection', 1, 'p_geometry_collection'),
+    ('geometrycollection -> GEOMETRYCOLLECTION LPAREN geometry_collection RPAREN', 'geometrycollection', 4, 'p_geometrycollection'),
+    ('geometrycollection -> GEOMETRYCOLLECTION Z LPAREN geometry_collection RPAREN', 'geometrycollection', 5, 'p_geometry_collection_dimensions'),
+    ('geometrycollection -> GEOMETRYCOLLECTION M LPAREN geometry_collection RPAREN', 'geometrycollection', 5, 'p_geometry_collection_dimensions'),
+    ('geometrycollection -> GEOMETRYCOLLECTION ZM LPAREN geometry_collection RPAREN', 'geometrycollection', 5, 'p_geometry_collection_dimensions'),
+    ('geometrycollection -> GEOMETRYCOLLECTION EMPTY', 'geometrycollection', 2, 'p_geometry_collection_empty'),
+]
+
+action = {
+    0: {'POINT': 9, 'LINESTRING': 10, 'POLYGON': 11, 'MULTIPOINT': 12, 'MULTILINESTRING': 13, 'MULTIPOLYGON': 14, 'GEOMETRYCOLLECTION': 15},
+    1: {'$end': 0},
+    2: {'$end': -1},
+    3: {'$end': -2},
+    4: {'$end': -3},
+    5: {'$end': -4},
+    6: {'$end': -5},
+    7: {'$end': -6},
+    8: {'$end': -7},
+    9: {'LPAREN': 16, 'Z': 17, 'ZM': 18, 'M': 19, 'EMPTY': 20},
+    10: {'LPAREN': 21, 'Z': 22, 'M': 23, 'ZM': 24, 'EMPTY': 25},
+    11: {'LPAREN': 26, 'Z': 27, 'M': 28, 'ZM': 29, 'EMPTY': 30},
+    12: {'LPAREN': 31, 'Z': 32, 'M': 33, 'ZM': 34, 'EMPTY': 35},
+    13: {'LPAREN': 36, 'Z': 37, 'M': 38, 'ZM': 39, 'EMPTY': 40},
+    14: {'LPAREN': 41, 'Z': 42, 'M': 43, 'ZM': 44, 'EMPTY': 45},
+    15: {'LPAREN': 46, 'Z': 47, 'M': 48, 'ZM': 49, 'EMPTY': 50},
+    16: {'DOUBLE_TOK': 52},
+    17: {'LPAREN': 53},
+    18: {'LPAREN': 54},
+    19: {'LPAREN': 55},
+    20: {'$end': -20, 'RPAREN': -20, 'COMMA': -20},
+    21: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    22: {'LPAREN': 60},
+    23: {'LPAREN': 61},
+    24: {'LPAREN': 62},
+    25: {'$end': -32, 'RPAREN': -32, 'COMMA': -32},
+    26: {'LPAREN': 63},
+    27: {'LPAREN': 66},
+    28: {'LPAREN': 67},
+    29: {'LPAREN': 68},
+    30: {'$end': -37, 'RPAREN': -37, 'COMMA': -37},
+    31: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    32: {'LPAREN': 70},
+    33: {'LPAREN': 71},
+    34: {'LPAREN': 72},
+    35: {'$end': -42, 'RPAREN': -42, 'COMMA': -42},
+    36: {'LPAREN': 63},
+    37: {'LPAREN': 74},
+    38: {'LPAREN': 75},
+    39: {'LPAREN': 76},
+    40: {'$end': -47, 'RPAREN': -47, 'COMMA': -47},
+    41: {'LPAREN': 77},
+    42: {'LPAREN': 80},
+    43: {'LPAREN': 81},
+    44: {'LPAREN': 82},
+    45: {'$end': -52, 'RPAREN': -52, 'COMMA': -52},
+    46: {'POINT': 9, 'LINESTRING': 10, 'POLYGON': 11, 'MULTIPOINT': 12, 'MULTILINESTRING': 13, 'MULTIPOLYGON': 14, 'GEOMETRYCOLLECTION': 15},
+    47: {'LPAREN': 92},
+    48: {'LPAREN': 93},
+    49: {'LPAREN': 94},
+    50: {'$end': -66, 'RPAREN': -66, 'COMMA': -66},
+    51: {'RPAREN': 95},
+    52: {'DOUBLE_TOK': 96},
+    53: {'DOUBLE_TOK': 52},
+    54: {'DOUBLE_TOK': 52},
+    55: {'DOUBLE_TOK': 52},
+    56: {'DOUBLE_TOK': 52},
+    57: {'RPAREN': 101, 'COMMA': 102},
+    58: {'RPAREN': -27, 'COMMA': -27},
+    59: {'RPAREN': -21, 'COMMA': -21},
+    60: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    61: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    62: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    63: {'DOUBLE_TOK': 52},
+    64: {'RPAREN': 108, 'COMMA': 109},
+    65: {'RPAREN': -14, 'COMMA': -14},
+    66: {'LPAREN': 63},
+    67: {'LPAREN': 63},
+    68: {'LPAREN': 63},
+    69: {'RPAREN': 113, 'COMMA': 102},
+    70: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    71: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    72: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    73: {'RPAREN': 117, 'COMMA': 109},
+    74: {'LPAREN': 63},
+    75: {'LPAREN': 63},
+    76: {'LPAREN': 63},
+    77: {'LPAREN': 63},
+    78: {'RPAREN': 122, 'COMMA': 123},
+    79: {'RPAREN': -24, 'COMMA': -24},
+    80: {'LPAREN': 77},
+    81: {'LPAREN': 77},
+    82: {'LPAREN': 77},
+    83: {'RPAREN': 127, 'COMMA': 128},
+    84: {'RPAREN': -61, 'COMMA': -61},
+    85: {'RPAREN': -53, 'COMMA': -53},
+    86: {'RPAREN': -54, 'COMMA': -54},
+    87: {'RPAREN': -55, 'COMMA': -55},
+    88: {'RPAREN': -56, 'COMMA': -56},
+    89: {'RPAREN': -57, 'COMMA': -57},
+    90: {'RPAREN': -58, 'COMMA': -58},
+    91: {'RPAREN': -59, 'COMMA': -59},
+    92: {'POINT': 9, 'LINESTRING': 10, 'POLYGON': 11, 'MULTIPOINT': 12, 'MULTILINESTRING': 13, 'MULTIPOLYGON': 14, 'GEOMETRYCOLLECTION': 15},
+    93: {'POINT': 9, 'LINESTRING': 10, 'POLYGON': 11, 'MULTIPOINT': 12, 'MULTILINESTRING': 13, 'MULTIPOLYGON': 14, 'GEOMETRYCOLLECTION': 15},
+    94: {'POINT': 9, 'LINESTRING': 10, 'POLYGON': 11, 'MULTIPOINT': 12, 'MULTILINESTRING': 13, 'MULTIPOLYGON': 14, 'GEOMETRYCOLLECTION': 15},
+    95: {'$end': -16, 'RPAREN': -16, 'COMMA': -16},
+    96: {'RPAREN': -8, 'COMMA': -8, 'DOUBLE_TOK': 132},
+    97: {'RPAREN': 133},
+    98: {'RPAREN': 134},
+    99: {'RPAREN': 135},
+    100: {'RPAREN': 136},
+    101: {'$end': -28, 'RPAREN': -28, 'COMMA': -28},
+    102: {'LPAREN': 56, 'DOUBLE_TOK': 52},
+    103: {'RPAREN': 138, 'COMMA': 102},
+    104: {'RPAREN': 139, 'COMMA': 102},
+    105: {'RPAREN': 140, 'COMMA': 102},
+    106: {'RPAREN': 141, 'COMMA': 142},
+    107: {'RPAREN': -12, 'COMMA': -12},
+    108: {'$end': -33, 'RPAREN': -33, 'COMMA': -33},
+    109: {'LPAREN': 63},
+    110: {'RPAREN': 144, 'COMMA': 109},
+    111: {'RPAREN': 145, 'COMMA': 109},
+    112: {'RPAREN': 146, 'COMMA': 109},
+    113: {'$end': -38, 'RPAREN': -38, 'COMMA': -38},
+    114: {'RPAREN': 147, 'COMMA': 102},
+    115: {'RPAREN': 148, 'COMMA': 102},
+    116: {'RPAREN': 149, 'COMMA': 102},
+    117: {'$end': -43, 'RPAREN': -43, 'COMMA': -43},
+    118: {'RPAREN': 150, 'COMMA': 109},
+    119: {'RPAREN': 151, 'COMMA': 109},
+    120: {'RPAREN': 152, 'COMMA': 109},
+    121: {'RPAREN': 153, 'COMMA': 109},
+    122: {'$end': -48, 'RPAREN': -48, 'COMMA': -48},
+    123: {'LPAREN': 77},
+    124: {'RPAREN': 155, 'COMMA': 123},
+    125: {'RPAREN': 156, 'COMMA': 123},
+    126: {'RPAREN': 157, 'COMMA': 123},
+    127: {'$end': -62, 'RPAREN': -62, 'COMMA': -62},
+    128: {'POINT': 9, 'LINESTRING': 10, 'POLYGON': 11, 'MULTIPOINT': 12, 'MULTILINESTRING': 13, 'MULTIPOLYGON': 14, 'GEOMETRYCOLLECTION': 15},
+    129: {'RPAREN': 159, 'COMMA': 128},
+    130: {'RPAREN': 160, 'COMMA': 128},
+    131: {'RPAREN': 161, 'COMMA': 128},
+    132: {'RPAREN': -9, 'COMMA': -9, 'DOUBLE_TOK': 162},
+    133: {'$end': -17, 'RPAREN': -17, 'COMMA': -17},
+    134: {'$end': -18, 'RPAREN': -18, 'COMMA': -18},
+    135: {'$end': -19, 'RPAREN': -19, 'COMMA': -19},
+    136: {'RPAREN': -22, 'COMMA': -22},
+    137: {'RPAREN': -26, 'COMMA': -26},
+    138: {'$end': -29, 'RPAREN': -29, 'COMMA': -29},
+    139: {'$end': -30, 'RPAREN': -30, 'COMMA': -30},
+    140: {'$end': -31, 'RPAREN': -31, 'COMMA': -31},
+    141: {'RPAREN': -15, 'COMMA': -15},
+    142: {'DOUBLE_TOK': 52},
+    143: {'RPAREN': -13, 'COMMA': -13},
+    144: {'$end': -34, 'RPAREN': -34, 'COMMA': -34},
+    145: {'$end': -35, 'RPAREN': -35, 'COMMA': -35},
+    146: {'$end': -36, 'RPAREN': -36, 'COMMA': -36},
+    147: {'$end': -39, 'RPAREN': -39, 'COMMA': -39},
+    148: {'$end': -40, 'RPAREN': -40, 'COMMA': -40},
+    149: {'$end': -41, 'RPAREN': -41, 'COMMA': -41},
+    150: {'$end': -44, 'RPAREN': -44, 'COMMA': -44},
+    151: {'$end': -45, 'RPAREN': -45, 'COMMA': -45},
+    152: {'$end': -46, 'RPAREN': -46, 'COMMA': -46},
+    153: {'RPAREN': -25, 'COMMA': -25},
+    154: {'RPAREN': -23, 'COMMA': -23},
+    155: {'$end': -49, 'RPAREN': -49, 'COMMA': -49},
+    156: {'$end': -50, 'RPAREN': -50, 'COMMA': -50},
+    157: {'$end': -51, 'RPAREN': -51, 'COMMA': -51},
+    158: {'RPAREN': -60, 'COMMA': -60},
+    159: {'$end': -63, 'RPAREN': -63, 'COMMA': -63},
+    160: {'$end': -64, 'RPAREN': -64, 'COMMA': -64},
+    161: {'$end': -65, 'RPAREN': -65, 'COMMA': -65},
+    162: {'RPAREN': -10, 'COMMA': -10},
+    163: {'RPAREN': -11, 'COMMA': -11},
+}
+
+goto = {
+    0: {'expressions': 1, 'point': 2, 'linestring': 3, 'polygon': 4, 'multipoint': 5, 'multilinestring': 6, 'multipolygon': 7, 'geometrycollection': 8},
+    1: {},
+    2: {},
+    3: {},
+    4: {},
+    5: {},
+    6: {},
+    7: {},
+    8: {},
+    9: {},
+    10: {},
+    11: {},
+    12: {},
+    13: {},
+    14: {},
+    15: {},
+    16: {'coordinate': 51},
+    17: {},
+    18: {},
+    19: {},
+    20: {},
+    21: {'point_list': 57, 'point_untagged': 58, 'coordinate': 59},
+    22: {},
+    23: {},
+    24: {},
+    25: {},
+    26: {'ring_list': 64, 'ring': 65},
+    27: {},
+    28: {},
+    29: {},
+    30: {},
+    31: {'point_list': 69, 'point_untagged': 58, 'coordinate': 59},
+    32: {},
+    33: {},
+    34: {},
+    35: {},
+    36: {'ring_list': 73, 'ring': 65},
+    37: {},
+    38: {},
+    39: {},
+    40: {},
+    41: {'polygon_list': 78, 'polygon_untagged': 79},
+    42: {},
+    43: {},
+    44: {},
+    45: {},
+    46: {'geometry_collection': 83, 'geometry': 84, 'point': 85, 'linestring': 86, 'polygon': 87, 'multipoint': 88, 'multilinestring': 89, 'multipolygon': 90, 'geometrycollection': 91},
+    47: {},
+    48: {},
+    49: {},
+    50: {},
+    51: {},
+    52: {},
+    53: {'coordinate': 97},
+    54: {'coordinate': 98},
+    55: {'coordinate': 99},
+    56: {'coordinate': 100},
+    57: {},
+    58: {},
+    59: {},
+    60: {'point_list': 103, 'point_untagged': 58, 'coordinate': 59},
+    61: {'point_list': 104, 'point_untagged': 58, 'coordinate': 59},
+    62: {'point_list': 105, 'point_untagged': 58, 'coordinate': 59},
+    63: {'ptarray': 106, 'coordinate': 107},
+    64: {},
+    65: {},
+    66: {'ring_list': 110, 'ring': 65},
+    67: {'ring_list': 111, 'ring': 65},
+    68: {'ring_list': 112, 'ring': 65},
+    69: {},
+    70: {'point_list': 114, 'point_untagged': 58, 'coordinate': 59},
+    71: {'point_list': 115, 'point_untagged': 58, 'coordinate': 59},
+    72: {'point_list': 116, 'point_untagged': 58, 'coordinate': 59},
+    73: {},
+    74: {'ring_list': 118, 'ring': 65},
+    75: {'ring_list': 119, 'ring': 65},
+    76: {'ring_list': 120, 'ring': 65},
+    77: {'ring_list': 121, 'ring': 65},
+    78: {},
+    79: {},
+    80: {'polygon_list': 124, 'polygon_untagged': 79},
+    81: {'polygon_list': 125, 'polygon_untagged': 79},
+    82: {'polygon_list': 126, 'polygon_untagged': 79},
+    83: {},
+    84: {},
+    85: {},
+    86: {},
+    87: {},
+    88: {},
+    89: {},
+    90: {},
+    91: {},
+    92: {'geometry_collection': 129, 'geometry': 84, 'point': 85, 'linestring': 86, 'polygon': 87, 'multipoint': 88, 'multilinestring': 89, 'multipolygon': 90, 'geometrycollection': 91},
+    93: {'geometry_collection': 130, 'geometry': 84, 'point': 85, 'linestring': 86, 'polygon': 87, 'multipoint': 88, 'multilinestring': 89, 'multipolygon': 90, 'geometrycollection': 91},
+    94: {'geometry_collection': 131, 'geometry': 84, 'point': 85, 'linestring': 86, 'polygon': 87, 'multipoint': 88, 'multilinestring': 89, 'multipolygon': 90, 'geometrycollection': 91},
+    95: {},
+    96: {},
+    97: {},
+    98: {},
+    99: {},
+    100: {},
+    101: {},
+    102: {'point_untagged': 137, 'coordinate': 59},
+    103: {},
+    104: {},
+    105: {},
+    106: {},
+    107: {},
+    108: {},
+    109: {'ring': 143},
+    110: {},
+    111: {},
+    112: {},
+    113: {},
+    114: {},
+    115: {},
+    116: {},
+    117: {},
+    118: {},
+    119: {},
+    120: {},
+    121: {},
+    122: {},
+    123: {'polygon_untagged': 154},
+    124: {},
+    125: {},
+    126: {},
+    127: {},
+    128: {'geometry': 158, 'point': 85, 'linestring': 86, 'polygon': 87, 'multipoint': 88, 'multilinestring': 89, 'multipolygon': 90, 'geometrycollection': 91},
+    129: {},
+    130: {},
+    131: {},
+    132: {},
+    133: {},
+    134: {},
+    135: {},
+    136: {},
+    137: {},
+    138: {},
+    139: {},
+    140: {},
+    141: {},
+    142: {'coordinate': 163},
+    143: {},
+    144: {},
+    145: {},
+    146: {},
+    147: {},
+    148: {},
+    149: {},
+    150: {},
+    151: {},
+    152: {},
+    153: {},
+    154: {},
+    155: {},
+    156: {},
+    157: {},
+    158: {},
+    159: {},
+    160: {},
+    161: {},
+    162: {},
+    163: {},
+}
+
@@ -0,0 +1,512 @@
+"""
+Hand written recursive descent reader for WKT.
+
+Accepts the same grammar as the PLY parser in _wkt_parser and produces identical GeoJson dicts, but scans the
+input with a single compiled regular expression and builds the result directly instead of going through the
+generic LR parsing machinery. The JSON readers write the same output straight to JSON text.
+"""
+import re
+
+from pygeoconv._geojson import _close_ring, _points_equal, _reverse_ring, _ring_is_clockwise, coordinates_to_arcgis
+from pygeoconv._json_text import encode, encode_coordinates
+from pygeoconv._numpy import COORDINATE_DEPTHS, coordinates_to_arrays, import_numpy
+
+# Token alternatives are listed in the same order as the rules of the PLY lexer so both engines split the
+# input into the same tokens.
+_TOKEN_PATTERN = (
+    r'[ \t\r\n]*(?:'
+    r'(\()'
+    r'|(\))'
+    r'|(-?[0-9]+(?![.eE0-9]))'
+    r'|(-?[0-9]+(?:\.[0-9]+)?(?:[eE][\-+]?[0-9]+)?)'
+    r'|(POINT|LINESTRING|POLYGON|MULTIPOINT|MULTILINESTRING|MULTIPOLYGON|GEOMETRYCOLLECTION)'
+    r'|(,)'
+    r'|(EMPTY|ZM|M|Z)'
+    r'|(.)'
+    r')?'
+)
+
+# Coordinate runs, 'x y, x y, ...' up to a closing parenthesis, are matched as a whole and their numbers converted
+# in one pass. Numbers in a run must be separated by whitespace or commas, so the run splits into the same numbers
+# as the token scanner. Runs with mixed dimensions or unusual spacing do not match and are parsed token by token.
+_NUMBER = r'-?[0-9]+(?:\.[0-9]+)?(?:[eE][\-+]?[0-9]+)?'
+
+
+# Numbers written exactly as json writes the value the reader converts them to: integers without leading zeros, and
+# floats in the fixed notation of repr between 1e-4 and 1e16 without trailing zeros. Up to 15 significant digits
+# identify a double, so repr gives back the same digits. The lookahead limits the digits and the point to 16, the
+# one at the end makes a chunk of a run end with a whole number.
+_JSON_NUMBER = (r'(?:-?(?=[0-9.]{3,16}(?![0-9.]))'
+                r'(?:[1-9][0-9]*\.(?:0|[0-9]*[1-9])|0\.(?:0|0{0,3}[1-9](?:[0-9]*[1-9])?))'
+                r'|0|-?[1-9][0-9]*)(?![.eE0-9])')
+
+
+def _run_patterns(dimensions, number=_NUMBER):
+    # Repetitions are bounded and the run is matched in chunks, an unbounded repeat makes the regex engine keep
+    # backtracking state for every coordinate of the run.
+    coordinate = r'[ \t\r\n]+'.join([number] * dimensions)
+    separated = r'[ \t\r\n]*,[ \t\r\n]*' + coordinate
+    return r'[ \t\r\n]*' + coordinate + '(?:' + separated + '){0,255}', '(?:' + separated + '){1,256}'
+
+
+class _Syntax:
+    """
+    The compiled expressions and separators of the reader for one kind of input, str or bytes. The bytes patterns
+    are the str patterns encoded as ASCII, so bytes input splits into exactly the same tokens.
+    """
+
+    def __init__(self, kind):
+        encode = (lambda value: value) if kind is str else (lambda value: value.encode('ascii'))
+        self.token_re = re.compile(encode(_TOKEN_PATTERN), re.DOTALL)
+        self.runs = self._runs(encode, _NUMBER)
+        self.json_runs = self._runs(encode, _JSON_NUMBER)
+        self.run_end_re = re.compile(encode(r'[ \t\r\n]*\)'))
+        self.typed_number_re = re.compile(encode(r'(-?[0-9]+(?![.eE0-9]))|(' + _NUMBER + ')'))
+        self.comma, self.space, self.point, self.lower_e, self.upper_e = map(encode, (',', ' ', '.', 'e', 'E'))
+
+    @staticmethod
+    def _runs(encode, number):
+        return tuple((dimensions,) + tuple(re.compile(encode(pattern)) for pattern in _run_patterns(dimensions, number))
+                     for dimensions in (2, 3, 4))
+
+
+_TEXT = _Syntax(str)
+_BYTES = _Syntax(bytes)
+
+_LPAREN = 1
+_RPAREN = 2
+_INT = 3
+_FLOAT = 4
+_GEOMETRY = 5
+_COMMA = 6
+_MODIFIER = 7
+_ILLEGAL = 8
+
+_TOKEN_NAMES = {_LPAREN: 'LPAREN', _RPAREN: 'RPAREN', _INT: 'DOUBLE_TOK', _FLOAT: 'DOUBLE_TOK', _COMMA: 'COMMA'}
+
+# Properties of the modifier tokens, EMPTY has none
+_DIMENSIONS = {
+    'EMPTY': None,
+    'Z': {'z': True},
+    'M': {'m': True},
+    'ZM': {'z': True, 'm': True},
+}
+_DIMENSIONS.update({keyword.encode('ascii'): value for keyword, value in _DIMENSIONS.items()})
+
+
+class WktReader:
+    """
+    Parses a single WKT string. A reader holds the scanning state of one call, create a new one per string.
+
+    ASCII WKT can also be given as bytes, bytearray, memoryview or mmap. It is scanned in place with bytes
+    expressions, only the numbers and keywords of the tokens and the bounded chunks of coordinate runs are copied.
+
+    The geometry can also be a part text[start:end] of a longer text, and seek moves the reader to the next part
+    without creating a new reader.
+    """
+
+    def __init__(self, text, coords: str = 'list', start: int = 0, end: int = None):
+        if isinstance(text, str):
+            self._syntax = _TEXT
+        else:
+            self._syntax = _BYTES
+            if isinstance(text, memoryview):
+                text = text.cast('B')
+        # Slices of bytearray and memoryview are mutable views or copies the number conversion does not accept
+        self._copy_runs = not isinstance(text[0:0], (str, bytes))
+        self._text = text
+        self._numpy = import_numpy() if coords == 'numpy' else None
+        self.seek(start, end)
+
+    def seek(self, start: int, end: int = None):
+        self._end = len(self._text) if end is None else end
+        self._pos = start
+        self._start = start
+        self._kind = None
+        self._value = None
+        self._next()
+
+    def at_end(self):
+        """
+        True when only whitespace is left, for a new part this means it is blank.
+        """
+        return self._kind is None
+
+    def read(self):
+        geometry = self._geometry()
+        if self._kind is not None:
+            self._error()
+        return geometry
+
+    def _next(self):
+        self._start = self._pos
+        match = self._syntax.token_re.match(self._text, self._pos, self._end)
+        self._pos = match.end()
+        kind = match.lastindex
+        if kind == _INT:
+            self._value = int(match.group(kind))
+        elif kind == _FLOAT:
+            self._value = float(match.group(kind))
+        elif kind == _ILLEGAL:
+            raise SyntaxError(f"Unexpected character '{_decode(match.group(kind))}' at position {match.start(kind)}")
+        elif kind is not None:
+            # Tokens of bytes input stay bytes, the keyword tables hold bytes keys as well
+            self._value = match.group(kind)
+        self._kind = kind
+
+    def _error(self):
+        if self._kind is None:
+            raise SyntaxError("Syntax error at EOF")
+        value = _decode(self._value)
+        token_type = _TOKEN_NAMES.get(self._kind, value)
+        raise SyntaxError(f"Syntax error at token {token_type} ({value})")
+
+    def _expect(self, kind):
+        if self._kind != kind:
+            self._error()
+        self._next()
+
+    def _geometry(self):
+        if self._kind != _GEOMETRY:
+            self._error()
+        geometry_type, member, body = _GEOMETRIES[self._value]
+        self._next()
+        properties = None
+        if self._kind == _MODIFIER:
+            dimensions = _DIMENSIONS[self._value]
+            self._next()
+            if dimensions is None:
+                return self._build(geometry_type, member, [], None)
+            properties = dict(dimensions)
+        self._expect(_LPAREN)
+        value = body(self)
+        self._expect(_RPAREN)
+        return self._build(geometry_type, member, value, properties)
+
+    def _build(self, geometry_type, member, value, properties):
+        if self._numpy is not None and geometry_type in COORDINATE_DEPTHS:
+            value = coordinates_to_arrays(value, COORDINATE_DEPTHS[geometry_type])
+        geometry = {'type': geometry_type, member: value}
+        if properties is not None:
+            geometry['properties'] = properties
+        return geometry
+
+    def _coordinate(self):
+        coordinate = []
+        while self._kind == _INT or self._kind == _FLOAT:
+            coordinate.append(self._value)
+            self._next()
+            if len(coordinate) == 4:
+                break
+        if len(coordinate) < 2:
+            self._error()
+        return coordinate
+
+    def _coordinate_run(self):
+        if self._kind != _INT and self._kind != _FLOAT:
+            return None
+        run = self._match_run(self._syntax.runs)
+        if run is None:
+            return None
+        dimensions, start, ends = run
+        if self._numpy is not None:
+            text = self._run(start, ends[-1]).replace(self._syntax.comma, self._syntax.space)
+            return self._numpy.fromstring(text, dtype=self._numpy.float64, sep=' ').reshape(-1, dimensions)
+        return self._run_positions(dimensions, start, ends)
+
+    def _match_run(self, runs):
+        """
+        Matches a coordinate run at the current token with the first of the run expressions that reaches the closing
+        parenthesis and moves past it. Returns the dimensions, the start and the ends of the chunks of the run, or None
+        when no expression matches.
+        """
+        text = self._text
+        end = self._end
+        for dimensions, first_re, more_re in runs:
+            match = first_re.match(text, self._start, end)
+            if not match:
+                continue
+            ends = [match.end()]
+            match = more_re.match(text, ends[-1], end)
+            while match:
+                ends.append(match.end())
+                match = more_re.match(text, ends[-1], end)
+            if not self._syntax.run_end_re.match(text, ends[-1], end):
+                continue
+            start = self._start
+            self._pos = ends[-1]
+            self._next()
+            return dimensions, start, ends
+        return None
+
+    def _run_positions(self, dimensions, start, ends):
+        # Numbers are converted chunk by chunk so only the strings of one chunk exist at a time
+        syntax = self._syntax
+        values = _numbers(self._run(start, ends[0]), syntax)
+        for i in range(1, len(ends)):
+            values += _numbers(self._run(ends[i - 1], ends[i]), syntax)
+        return [values[i:i + dimensions] for i in range(0, len(values), dimensions)]
+
+    def _run(self, start, end):
+        if self._copy_runs:
+            return bytes(self._text[start:end])
+        return self._text[start:end]
+
+    def _ptarray(self):
+        coordinates = self._coordinate_run()
+        if coordinates is not None:
+            return coordinates
+        coordinates = [self._coordinate()]
+        while self._kind == _COMMA:
+            self._next()
+            coordinates.append(self._coordinate())
+        return coordinates
+
+    def _ring(self):
+        self._expect(_LPAREN)
+        ring = self._ptarray()
+        self._expect(_RPAREN)
+        return ring
+
+    def _ring_list(self):
+        rings = [self._ring()]
+        while self._kind == _COMMA:
+            self._next()
+            rings.append(self._ring())
+        return rings
+
+    def _point_untagged(self):
+        if self._kind == _LPAREN:
+            self._next()
+            coordinate = self._coordinate()
+            self._expect(_RPAREN)
+            return coordinate
+        return self._coordinate()
+
+    def _point_list(self):
+        points = self._coordinate_run()
+        if points is not None:
+            return points
+        points = [self._point_untagged()]
+        while self._kind == _COMMA:
+            self._next()
+            points.append(self._point_untagged())
+        return points
+
+    def _polygon_list(self):
+        polygons = []
+        while True:
+            self._expect(_LPAREN)
+            polygons.append(self._ring_list())
+            self._expect(_RPAREN)
+            if self._kind != _COMMA:
+                return polygons
+            self._next()
+
+    def _geometry_list(self):
+        geometries = [self._geometry()]
+        while self._kind == _COMMA:
+            self._next()
+            geometries.append(self._geometry())
+        return geometries
+
+
+class EsriWktReader(WktReader):
+    """
+    Parses a single WKT string straight to Esri Json. Every geometry is converted as soon as it is parsed, the
+    coordinate lists built by the reader go into the output without copying and polygon rings are oriented in place.
+    """
+
+    def __init__(self, text, wkid: int, start: int = 0, end: int = None):
+        self._wkid = wkid
+        super().__init__(text, start=start, end=end)
+
+    def _build(self, geometry_type, member, value, properties):
+        if geometry_type == 'GeometryCollection':
+            return value
+        return coordinates_to_arcgis(geometry_type, value, self._wkid)
+
+
+class _JsonRun:
+    """
+    A coordinate run of numbers written as json writes them, as the JSON text of its list of positions. The positions
+    are only converted to numbers when they are needed.
+    """
+    __slots__ = ('text', 'dimensions', '_reader', '_start', '_ends')
+
+    def __init__(self, text, dimensions, reader, start, ends):
+        self.text = text
+        self.dimensions = dimensions
+        self._reader = reader
+        self._start = start
+        self._ends = ends
+
+    def positions(self):
+        return self._reader._run_positions(self.dimensions, self._start, self._ends)
+
+
+class JsonWktReader(WktReader):
+    """
+    Parses a single WKT string straight to GeoJson text, the same text as json.dumps with compact separators gives
+    for the dict of WktReader. Coordinate runs of numbers written as json writes them are copied with a few string
+    operations, without converting them.
+    """
+
+    def _coordinate_run(self):
+        if self._kind != _INT and self._kind != _FLOAT:
+            return None
+        run = self._match_run(self._syntax.json_runs)
+        if run is None:
+            return super()._coordinate_run()
+        dimensions, start, ends = run
+        chunks = []
+        for chunk_start, chunk_end in zip([start] + ends, ends):
+            chunk = self._run(chunk_start, chunk_end)
+            if not isinstance(chunk, str):
+                chunk = chunk.decode('ascii')
+            # Every separator becomes a single space and every comma ' , '
+            chunks.append(' '.join(chunk.replace(',', ' , ').split()))
+        text = '[[' + ' '.join(chunks).replace(' , ', '],[').replace(' ', ',') + ']]'
+        return _JsonRun(text, dimensions, self, start, ends)
+
+    def _build(self, geometry_type, member, value, properties):
+        if geometry_type == 'GeometryCollection':
+            text = '[' + ','.join(value) + ']'
+        else:
+            text = _json_coordinates(value, COORDINATE_DEPTHS[geometry_type])
+        text = '{"type":"' + geometry_type + '","' + member + '":' + text
+        if properties is not None:
+            text += ',"properties":{' + ','.join(['"' + key + '":true' for key in properties]) + '}'
+        return text + '}'
+
+
+class EsriJsonWktReader(JsonWktReader):
+    """
+    Parses a single WKT string straight to Esri Json text, the same text as json.dumps with compact separators gives
+    for the dict of EsriWktReader. Only the rings of polygons are converted to numbers, to close and orient them.
+    """
+
+    def __init__(self, text, wkid: int, start: int = 0, end: int = None):
+        self._spatial_reference = ',"spatialReference":{"wkid":' + encode(wkid) + '}}'
+        super().__init__(text, start=start, end=end)
+
+    def _build(self, geometry_type, member, value, properties):
+        if geometry_type == 'GeometryCollection':
+            return '[' + ','.join(value) + ']'
+        if geometry_type == 'Point':
+            text = '{"x":' + encode_coordinates(value[0]) + ',"y":' + encode_coordinates(value[1])
+            if len(value) > 2:
+                text += ',"z":' + encode_coordinates(value[2])
+            return text + self._spatial_reference
+        if geometry_type == 'MultiPoint':
+            text = '{"points":' + _json_coordinates(value, 1)
+            has_z = _dimensions(value) > 2
+        elif geometry_type == 'LineString':
+            text = '{"paths":[' + _json_coordinates(value, 1) + ']'
+            has_z = _dimensions(value) > 2
+        elif geometry_type == 'MultiLineString':
+            text = '{"paths":' + _json_coordinates(value, 2)
+            has_z = _dimensions(value[0]) > 2
+        elif geometry_type == 'Polygon':
+            has_z = _dimensions(value[0]) > 2
+            text = '{"rings":[' + ','.join(_oriented_rings(value)) + ']'
+        else:
+            has_z = _dimensions(value[0][0]) > 2
+            rings = []
+            for polygon in value:
+                # Same ring order as coordinates_to_arcgis
+                rings.extend(reversed(_oriented_rings(polygon)))
+            text = '{"rings":[' + ','.join(rings) + ']'
+        if has_z:
+            text += ',"hasZ":true'
+        return text + self._spatial_reference
+
+
+def _dimensions(positions):
+    # Dimensions of the first position of a list of positions
+    if isinstance(positions, _JsonRun):
+        return positions.dimensions
+    return len(positions[0])
+
+
+def _json_coordinates(value, depth):
+    if isinstance(value, _JsonRun):
+        return value.text
+    if depth <= 1:
+        return encode_coordinates(value)
+    return '[' + ','.join([_json_coordinates(item, depth - 1) for item in value]) + ']'
+
+
+def _oriented_rings(rings):
+    """
+    Closes and orients the rings of a polygon like coordinates_to_arcgis does and returns their JSON texts. Rings
+    of a run are closed and reversed as text.
+    """
+    output = []
+    for i, ring in enumerate(rings):
+        positions = ring.positions() if isinstance(ring, _JsonRun) else ring
+        closed = _points_equal(positions[0], positions[-1])
+        if len(positions) + (not closed) < 4:
+            if i == 0:
+                # Holes are dropped with an outer ring that is too short
+                return []
+            continue
+        _close_ring(positions)
+        reverse = _ring_is_clockwise(positions) == (i > 0)
+        if not isinstance(ring, _JsonRun):
+            output.append(encode_coordinates(_reverse_ring(positions) if reverse else positions))
+            continue
+        text = ring.text
+        if not closed:
+            text = text[:-1] + ',' + text[1:text.index(']') + 1] + ']'
+        if reverse:
+            text = '[[' + '],['.join(reversed(text[2:-2].split('],['))) + ']]'
+        output.append(text)
+    return output
+
+
+_GEOMETRIES = {
+    'POINT': ('Point', 'coordinates', WktReader._coordinate),
+    'LINESTRING': ('LineString', 'coordinates', WktReader._point_list),
+    'POLYGON': ('Polygon', 'coordinates', WktReader._ring_list),
+    'MULTIPOINT': ('MultiPoint', 'coordinates', WktReader._point_list),
+    'MULTILINESTRING': ('MultiLineString', 'coordinates', WktReader._ring_list),
+    'MULTIPOLYGON': ('MultiPolygon', 'coordinates', WktReader._polygon_list),
+    'GEOMETRYCOLLECTION': ('GeometryCollection', 'geometries', WktReader._geometry_list),
+}
+_GEOMETRIES.update({keyword.encode('ascii'): value for keyword, value in _GEOMETRIES.items()})
+
+
+def _decode(value):
+    # Token values of bytes input for error messages
+    return value.decode('latin-1') if isinstance(value, bytes) else value
+
+
+def _numbers(run, syntax=_TEXT):
+    """
+    Converts all numbers of a coordinate run keeping the typing of the token scanner, int unless the number has a
+    fraction or an exponent. int and float accept the numbers of bytes runs without decoding.
+    """
+    values = run.replace(syntax.comma, syntax.space).split()
+    fractions = run.count(syntax.point)
+    if fractions == len(values):
+        return list(map(float, values))
+    if fractions == 0 and syntax.lower_e not in run and syntax.upper_e not in run:
+        return list(map(int, values))
+    return [int(i) if i else float(f) for i, f in syntax.typed_number_re.findall(run)]
+
+
+def read_wkt(text, coords: str = 'list'):
+    return WktReader(text, coords=coords).read()
+
+
+def read_wkt_esri(text, wkid: int):
+    return EsriWktReader(text, wkid).read()
+
+
+def read_wkt_json(text):
+    return JsonWktReader(text).read()
+
+
+def read_wkt_esri_json(text, wkid: int):
+    return EsriJsonWktReader(text, wkid).read()
@@ -8,3 +8,7 @@ class GeojsonParserError(Exception):
 
 class EsriJsonParserError(Exception):
     pass
+
+
+class WkbParserError(Exception):
+    pass
@@ -1,47 +1,101 @@
 import pygeoconv._wkt as _wkt_converter
 import pygeoconv._geojson as _geojson_converter
 import pygeoconv._esri_json as _esri_converter
+import pygeoconv._wkb as _wkb_converter
+import pygeoconv._json_stream as _json_stream
+import pygeoconv._json_text as _json_text
+from pygeoconv._esri_json import PreparedRing, PreparedPolygon
+from pygeoconv._io import BLOCK_SIZE
+from pygeoconv._json_stream import GeoJSONFeatureCollectionWriter, EsriFeatureSetWriter
+from pygeoconv._numpy import geojson_to_arrays, validate_coords
+from pygeoconv._validation import validate_validation
 
 
-def wkt_to_esri_json(wkt: str, wkid: int = 4326):
+def wkt_to_esri_json(wkt: str, wkid: int = 4326, engine: str = 'native'):
     """
     Convert WKT to Esri Json format and set the spatial reference to the value of wkid
-    wkt: str
+    wkt: str, or ASCII WKT as bytes, bytearray, memoryview or mmap
     wkid: int
+    engine: Optional str, WKT parser to use, 'native' (default) or the PLY based reference parser 'ply'
     returns a dict
     """
     if not wkt:
         raise TypeError("Unable to convert value None")
-    geojson = _wkt_converter.wkt_to_geojson(wkt)
-    arcgis = _geojson_converter.geojson_to_arcgis(geojson=geojson, wkid=wkid)
-    return arcgis
+    return _wkt_converter.wkt_to_arcgis(wkt, wkid=wkid, engine=engine)
 
 
-def wkt_to_geojson(wkt_str: str):
+def wkt_to_esri_json_str(wkt: str, wkid: int = 4326, engine: str = 'native'):
     """
-    Convert WKT to GeoJson format.
-    wkt: str
+    Convert WKT to Esri Json text, the same text as json.dumps of wkt_to_esri_json with separators=(',', ':'). The
+    native engine writes the text while parsing and copies numbers from the WKT that are written as json writes them.
+    wkt: str, or ASCII WKT as bytes, bytearray, memoryview or mmap
+    wkid: int
+    engine: Optional str, WKT parser to use, 'native' (default) or the PLY based reference parser 'ply'
+    returns a str
+    """
+    if not wkt:
+        raise TypeError("Unable to convert value None")
+    return _json_text.wkt_to_esri_json_text(wkt, wkid=wkid, engine=engine)
+
+
+def wkt_to_esri_json_bytes(wkt: str, wkid: int = 4326, engine: str = 'native'):
+    """
+    Convert WKT to Esri Json text encoded as UTF-8, see wkt_to_esri_json_str
+    returns bytes
+    """
+    return wkt_to_esri_json_str(wkt, wkid=wkid, engine=engine).encode('utf-8')
+
+
+def wkt_to_geojson(wkt_str: str, engine: str = 'native', coords: str = 'list'):
+    """
+    Convert WKT to GeoJson format. The native engine reads bytes-like input in place, without decoding it.
+    wkt: str, or ASCII WKT as bytes, bytearray, memoryview or mmap
+    engine: Optional str, WKT parser to use, 'native' (default) or the PLY based reference parser 'ply'
+    coords: Optional str, 'list' (default) for nested lists or 'numpy' for float64 arrays of shape (N, dims) per
+    ring, path or point list, requires NumPy
     returns a dict
     """
     if not wkt_str:
         raise TypeError("Unable to convert value None")
-    return _wkt_converter.wkt_to_geojson(wkt_str)
+    return _wkt_converter.wkt_to_geojson(wkt_str, engine=engine, coords=coords)
+
+
+def wkt_to_geojson_str(wkt_str: str, engine: str = 'native'):
+    """
+    Convert WKT to GeoJson text, the same text as json.dumps of wkt_to_geojson with separators=(',', ':'). The
+    native engine writes the text while parsing and copies numbers from the WKT that are written as json writes them.
+    wkt: str, or ASCII WKT as bytes, bytearray, memoryview or mmap
+    engine: Optional str, WKT parser to use, 'native' (default) or the PLY based reference parser 'ply'
+    returns a str
+    """
+    if not wkt_str:
+        raise TypeError("Unable to convert value None")
+    return _json_text.wkt_to_geojson_text(wkt_str, engine=engine)
+
+
+def wkt_to_geojson_bytes(wkt_str: str, engine: str = 'native'):
+    """
+    Convert WKT to GeoJson text encoded as UTF-8, see wkt_to_geojson_str
+    returns bytes
+    """
+    return wkt_to_geojson_str(wkt_str, engine=engine).encode('utf-8')
 
 
-def esri_json_to_wkt(esri_json: dict):
+def esri_json_to_wkt(esri_json: dict, precision: int = None, precision_mode: str = 'decimals'):
     """
     Convert an Esri Json object to WKT format
     esri_json: dict
+    precision: Optional int, round coordinates to this number of decimals or significant digits
+    precision_mode: Optional str, 'decimals' (default) or 'significant'
     returns a string
     """
     if not esri_json:
         raise TypeError("Unable to convert value None")
-    geojson = _esri_converter.esri_json_to_geojson(esri_json)
-    wkt = _wkt_converter.geojson_to_wkt(geojson)
-    return wkt
+    return _wkt_converter.esri_json_to_wkt(esri_json, precision=precision, precision_mode=precision_mode)
 
 
-def esri_json_to_geojson(esri_json: dict, id_attr=None):
+def esri_json_to_geojson(esri_json: dict, id_attr=None, coords: str = 'list', copy: bool = True,
+                         validation: str = 'fast'):
     """
     Converts an Esri Json object to GeoJson format. If the input is an Esri Json of type feature with attributes,
     use the optional id_attr parameter to specify which attribute should be used as id of the output GeoJson feature.
@@ -49,25 +103,99 @@ def esri_json_to_geojson(esri_json: dict, id_attr=None):
     conversion will fail for geometries of type Feature.
     esri_json: dict
     id_attr: Optional str
+    coords: Optional str, 'list' (default) for nested lists or 'numpy' for float64 arrays of shape (N, dims) per
+    ring, path or point list, requires NumPy
+    copy: Optional bool, False to reuse the lists and dicts of the input in the output instead of copying them. The
+    input is changed: rings are closed and reversed in place and attributes become the properties. Only for input
+    that is not used after the conversion
+    validation: Optional str, 'fast' (default) to close rings, drop rings that are too short and find the outer ring
+    of each hole by its position and edges, 'trust' for valid input with closed rings and holes inside their outer
+    ring, which skips closing and the edge tests, or 'strict' to also raise an EsriJsonParserError for coordinates
+    that are not finite numbers and for paths and rings that are too short
     returns a dict
     """
     if not esri_json:
         raise TypeError("Unable to convert value None")
-    return _esri_converter.esri_json_to_geojson(esri_json, id_attribute=id_attr)
+    validate_coords(coords)
+    validate_validation(validation)
+    geojson = _esri_converter.esri_json_to_geojson(esri_json, id_attribute=id_attr, copy=copy, validation=validation)
+    if coords == 'numpy':
+        geojson = geojson_to_arrays(geojson)
+    return geojson
+
+
+def esri_json_to_geojson_str(esri_json: dict, id_attr=None):
+    """
+    Convert an Esri Json object to GeoJson text, the same text as json.dumps of esri_json_to_geojson with
+    separators=(',', ':')
+    esri_json: dict
+    id_attr: Optional str, attribute used as id of features
+    returns a str
+    """
+    if not esri_json:
+        raise TypeError("Unable to convert value None")
+    return _json_text.esri_json_to_geojson_text(esri_json, id_attr=id_attr)
 
 
-def geojson_to_wkt(geojson: dict):
+def esri_json_to_geojson_bytes(esri_json: dict, id_attr=None):
+    """
+    Convert an Esri Json object to GeoJson text encoded as UTF-8, see esri_json_to_geojson_str
+    returns bytes
+    """
+    return esri_json_to_geojson_str(esri_json, id_attr=id_attr).encode('utf-8')
+
+
+def geojson_to_wkt(geojson: dict, out=None, precision: int = None, precision_mode: str = 'decimals'):
     """
     Converts a GeoJson object to a WKT string. This conversion does not support Feature or FeatureCollection conversion.
     geojson: dict
-    returns a string
+    out: Optional file-like object, the WKT is written to it in chunks instead of being returned
+    precision: Optional int, round coordinates to this number of decimals or significant digits
+    precision_mode: Optional str, 'decimals' (default) or 'significant'
+    returns a string, or None when out is given
     """
     if not geojson:
         raise TypeError("Unable to convert value None")
-    return _wkt_converter.geojson_to_wkt(geojson)
+    return _wkt_converter.geojson_to_wkt(geojson, out=out, precision=precision, precision_mode=precision_mode)
 
 
-def geojson_to_esri_json(geojson: dict, wkid: int = 4326, id_attr: str = 'OBJECTID'):
+def iter_geojson_to_wkt(geojson: dict, chunk_size: int = _wkt_converter.CHUNK_SIZE, precision: int = None,
+                        precision_mode: str = 'decimals'):
+    """
+    Converts a GeoJson object to WKT and yields the text in chunks of about chunk_size characters. Joined together
+    the chunks are the string geojson_to_wkt returns.
+    geojson: dict
+    chunk_size: Optional int
+    precision: Optional int, round coordinates to this number of decimals or significant digits
+    precision_mode: Optional str, 'decimals' (default) or 'significant'
+    returns a generator of strings
+    """
+    if not geojson:
+        raise TypeError("Unable to convert value None")
+    return _wkt_converter.iter_geojson_to_wkt(geojson, chunk_size=chunk_size, precision=precision,
+                                              precision_mode=precision_mode)
+
+
+def iter_wkt_file(path_or_fp, to: str = 'geojson', wkid: int = 4326, errors: str = 'raise',
+                  block_size: int = BLOCK_SIZE):
+    """
+    Reads a file with one WKT geometry per line and yields a (line number, geometry) tuple per geometry, converted to
+    GeoJson or to Esri Json with the spatial reference wkid. Blank lines are skipped. The file is read in blocks and
+    every line is parsed in place within its block, memory is bounded by the block size and the longest line.
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode
+    to: Optional str, 'geojson' (default) or 'esri'
+    wkid: Optional int, spatial reference of Esri Json output
+    errors: Optional str, 'raise' (default) to raise a WktParserError naming the line of an invalid geometry, or 'skip'
+    block_size: Optional int, number of bytes, or characters for text files, read at a time
+    returns a generator of (int, dict) tuples
+    """
+    if path_or_fp is None:
+        raise TypeError("Unable to convert value None")
+    return _wkt_converter.iter_wkt_file(path_or_fp, to=to, wkid=wkid, errors=errors, block_size=block_size)
+
+
+def geojson_to_esri_json(geojson: dict, wkid: int = 4326, id_attr: str = 'OBJECTID', copy: bool = True,
+                         validation: str = 'fast'):
     """
     Converts a GeoJson object to Esri Json and set the spatial reference to the value of wkid.
     When converting GeoJson Feature, the id of the feature will be used as the OBJECTID of the Esri Json Feature,
@@ -76,7 +204,265 @@ def geojson_to_esri_json(geojson: dict, wkid: int = 4326, id_attr: str = 'OBJECT
     geojson: dict
     wkid: int
     id_attr: Optional str
+    copy: Optional bool, False to reuse the lists and dicts of the input in the output instead of copying them. The
+    input is changed: rings are closed and reoriented in place and the id of a feature is added to its properties,
+    which become the attributes. Only for input that is not used after the conversion
+    validation: Optional str, 'fast' (default) to close rings, drop rings that are too short and test the orientation
+    of every ring, 'trust' for valid input with closed rings wound as RFC 7946 asks, which are reversed without these
+    passes, or 'strict' to also raise a GeojsonParserError for coordinates that are not finite numbers and for
+    LineStrings and rings that are too short
+    """
+    if not geojson:
+        raise TypeError("Unable to convert value None")
+    validate_validation(validation)
+    return _geojson_converter.geojson_to_arcgis(geojson=geojson, id_attr=id_attr, wkid=wkid, copy=copy,
+                                                validation=validation)
+
+
+def geojson_to_esri_json_str(geojson: dict, wkid: int = 4326, id_attr: str = 'OBJECTID'):
+    """
+    Convert a GeoJson object to Esri Json text, the same text as json.dumps of geojson_to_esri_json with
+    separators=(',', ':')
+    geojson: dict
+    wkid: int
+    id_attr: Optional str, attribute the id of a feature is written to
+    returns a str
     """
     if not geojson:
         raise TypeError("Unable to convert value None")
-    return _geojson_converter.geojson_to_arcgis(geojson=geojson, id_attr=id_attr, wkid=wkid)
+    return _json_text.geojson_to_esri_json_text(geojson, wkid=wkid, id_attr=id_attr)
+
+
+def geojson_to_esri_json_bytes(geojson: dict, wkid: int = 4326, id_attr: str = 'OBJECTID'):
+    """
+    Convert a GeoJson object to Esri Json text encoded as UTF-8, see geojson_to_esri_json_str
+    returns bytes
+    """
+    return geojson_to_esri_json_str(geojson, wkid=wkid, id_attr=id_attr).encode('utf-8')
+
+
+def iter_geojson_file(path_or_fp, to: str = 'geojson', wkid: int = 4326, id_attr: str = 'OBJECTID',
+                      block_size: int = BLOCK_SIZE):
+    """
+    Reads a GeoJson FeatureCollection file incrementally and yields its features one at a time, as GeoJson or
+    converted to Esri Json like geojson_to_esri_json does. Only the feature being read is held in memory, never the
+    whole document.
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode
+    to: Optional str, 'geojson' (default) or 'esri'
+    wkid: Optional int, spatial reference of Esri Json output
+    id_attr: Optional str, attribute the id of a feature is written to in Esri Json output
+    block_size: Optional int, number of bytes, or characters for text files, read at a time
+    returns a generator of dicts
+    """
+    if path_or_fp is None:
+        raise TypeError("Unable to convert value None")
+    return _json_stream.iter_geojson_file(path_or_fp, to=to, wkid=wkid, id_attr=id_attr, block_size=block_size)
+
+
+def iter_geojson_seq(path_or_fp, to: str = 'geojson', wkid: int = 4326, id_attr: str = 'OBJECTID',
+                     errors: str = 'raise', block_size: int = BLOCK_SIZE):
+    """
+    Reads a GeoJSONSeq file, one GeoJson text per line with or without a leading record separator, and yields its
+    features or geometries as GeoJson or converted to Esri Json like geojson_to_esri_json does. Blank lines are
+    skipped.
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode
+    to: Optional str, 'geojson' (default) or 'esri'
+    wkid: Optional int, spatial reference of Esri Json output
+    id_attr: Optional str, attribute the id of a feature is written to in Esri Json output
+    errors: Optional str, 'raise' (default) to raise a GeojsonParserError naming the line of an invalid text, or 'skip'
+    block_size: Optional int, number of bytes, or characters for text files, read at a time
+    returns a generator of dicts
+    """
+    if path_or_fp is None:
+        raise TypeError("Unable to convert value None")
+    return _json_stream.iter_geojson_seq(path_or_fp, to=to, wkid=wkid, id_attr=id_attr, errors=errors,
+                                         block_size=block_size)
+
+
+def write_geojson_seq(features, path_or_fp, rs: bool = False, source: str = 'geojson', id_attr: str = None,
+                      block_size: int = BLOCK_SIZE):
+    """
+    Writes features or geometries as GeoJSONSeq, one compact GeoJson text per line. Esri Json features are converted
+    like esri_json_to_geojson does. The text is written in blocks of about block_size characters.
+    features: iterable of dicts, for example a generator of another reader
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode
+    rs: Optional bool, start every text with the record separator of RFC 8142
+    source: Optional str, 'geojson' (default) or 'esri', the format of the features
+    id_attr: Optional str, attribute used as id of Esri Json features
+    block_size: Optional int
+    returns the number of texts written
+    """
+    if path_or_fp is None:
+        raise TypeError("Unable to write to None")
+    return _json_stream.write_geojson_seq(features, path_or_fp, rs=rs, source=source, id_attr=id_attr,
+                                          block_size=block_size)
+
+
+def iter_esri_json_lines(path_or_fp, to: str = 'esri', id_attr: str = None, errors: str = 'raise',
+                         block_size: int = BLOCK_SIZE):
+    """
+    Reads a file with one Esri Json feature or geometry per line and yields them as Esri Json or converted to GeoJson
+    like esri_json_to_geojson does. Blank lines are skipped.
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode
+    to: Optional str, 'esri' (default) or 'geojson'
+    id_attr: Optional str, attribute used as id of GeoJson output
+    errors: Optional str, 'raise' (default) to raise an EsriJsonParserError naming the line of an invalid text, or
+    'skip'
+    block_size: Optional int, number of bytes, or characters for text files, read at a time
+    returns a generator of dicts
+    """
+    if path_or_fp is None:
+        raise TypeError("Unable to convert value None")
+    return _json_stream.iter_esri_json_lines(path_or_fp, to=to, id_attr=id_attr, errors=errors,
+                                             block_size=block_size)
+
+
+def write_esri_json_lines(features, path_or_fp, source: str = 'esri', wkid: int = 4326, id_attr: str = 'OBJECTID',
+                          block_size: int = BLOCK_SIZE):
+    """
+    Writes Esri Json features or geometries, one compact Json text per line. GeoJson features are converted like
+    geojson_to_esri_json does. The text is written in blocks of about block_size characters.
+    features: iterable of dicts, for example a generator of another reader
+    path_or_fp: str or path of the file, or a file object opened in binary or text mode
+    source: Optional str, 'esri' (default) or 'geojson', the format of the features
+    wkid: Optional int, spatial reference of converted GeoJson
+    id_attr: Optional str, attribute the id of a GeoJson feature is written to
+    block_size: Optional int
+    returns the number of lines written
+    """
+    if path_or_fp is None:
+        raise TypeError("Unable to write to None")
+    return _json_stream.write_esri_json_lines(features, path_or_fp, source=source, wkid=wkid, id_attr=id_attr,
+                                              block_size=block_size)
+
+
+def wkb_to_geojson(wkb, coords: str = 'list'):
+    """
+    Converts ISO or extended WKB to GeoJson format. The SRID of extended WKB is ignored.
+    wkb: bytes, bytearray or memoryview, or a hex string
+    coords: Optional str, 'list' (default) for nested lists or 'numpy' for float64 arrays of shape (N, dims) per
+    ring, path or point list, requires NumPy
+    returns a dict
+    """
+    if not wkb:
+        raise TypeError("Unable to convert value None")
+    return _wkb_converter.wkb_to_geojson(wkb, coords=coords)
+
+
+def wkb_to_geojson_str(wkb):
+    """
+    Converts ISO or extended WKB to GeoJson text, the same text as json.dumps of wkb_to_geojson with
+    separators=(',', ':')
+    wkb: bytes, bytearray or memoryview, or a hex string
+    returns a str
+    """
+    if not wkb:
+        raise TypeError("Unable to convert value None")
+    return _json_text.wkb_to_geojson_text(wkb)
+
+
+def wkb_to_geojson_bytes(wkb):
+    """
+    Converts ISO or extended WKB to GeoJson text encoded as UTF-8, see wkb_to_geojson_str
+    returns bytes
+    """
+    return wkb_to_geojson_str(wkb).encode('utf-8')
+
+
+def geojson_to_wkb(geojson: dict, byte_order: str = 'little', extended: bool = False, srid: int = None,
+                   as_hex: bool = False):
+    """
+    Converts a GeoJson object to WKB. This conversion does not support Feature or FeatureCollection conversion.
+    geojson: dict
+    byte_order: Optional str, 'little' (default) or 'big'
+    extended: Optional bool, write extended WKB as PostGIS does instead of ISO WKB
+    srid: Optional int, SRID to embed in extended WKB
+    as_hex: Optional bool, return the WKB as a hex string
+    returns bytes, or a str when as_hex is set
+    """
+    if not geojson:
+        raise TypeError("Unable to convert value None")
+    return _wkb_converter.geojson_to_wkb(geojson, byte_order=byte_order, extended=extended, srid=srid,
+                                         as_hex=as_hex)
+
+
+def wkb_to_esri_json(wkb, wkid: int = 4326):
+    """
+    Converts ISO or extended WKB to Esri Json format and set the spatial reference to the value of wkid
+    wkb: bytes, bytearray or memoryview, or a hex string
+    wkid: int
+    returns a dict
+    """
+    if not wkb:
+        raise TypeError("Unable to convert value None")
+    geojson = _wkb_converter.wkb_to_geojson(wkb)
+    return _geojson_converter.geojson_to_arcgis(geojson=geojson, wkid=wkid, copy=False)
+
+
+def wkb_to_esri_json_str(wkb, wkid: int = 4326):
+    """
+    Converts ISO or extended WKB to Esri Json text, the same text as json.dumps of wkb_to_esri_json with
+    separators=(',', ':')
+    wkb: bytes, bytearray or memoryview, or a hex string
+    wkid: int
+    returns a str
+    """
+    if not wkb:
+        raise TypeError("Unable to convert value None")
+    return _json_text.wkb_to_esri_json_text(wkb, wkid=wkid)
+
+
+def wkb_to_esri_json_bytes(wkb, wkid: int = 4326):
+    """
+    Converts ISO or extended WKB to Esri Json text encoded as UTF-8, see wkb_to_esri_json_str
+    returns bytes
+    """
+    return wkb_to_esri_json_str(wkb, wkid=wkid).encode('utf-8')
+
+
+def esri_json_to_wkb(esri_json: dict, byte_order: str = 'little', extended: bool = False, srid: int = None,
+                     as_hex: bool = False):
+    """
+    Converts an Esri Json object to WKB
+    esri_json: dict
+    byte_order: Optional str, 'little' (default) or 'big'
+    extended: Optional bool, write extended WKB as PostGIS does instead of ISO WKB
+    srid: Optional int, SRID to embed in extended WKB
+    as_hex: Optional bool, return the WKB as a hex string
+    returns bytes, or a str when as_hex is set
+    """
+    if not esri_json:
+        raise TypeError("Unable to convert value None")
+    geojson = _esri_converter.esri_json_to_geojson(esri_json)
+    return _wkb_converter.geojson_to_wkb(geojson, byte_order=byte_order, extended=extended, srid=srid,
+                                         as_hex=as_hex)
+
+
+def wkb_to_wkt(wkb):
+    """
+    Converts ISO or extended WKB to WKT
+    wkb: bytes, bytearray or memoryview, or a hex string
+    returns a string
+    """
+    if not wkb:
+        raise TypeError("Unable to convert value None")
+    return _wkt_converter.geojson_to_wkt(_wkb_converter.wkb_to_geojson(wkb))
+
+
+def wkt_to_wkb(wkt: str, byte_order: str = 'little', extended: bool = False, srid: int = None,
+               as_hex: bool = False, engine: str = 'native'):
+    """
+    Converts WKT to WKB
+    wkt: str
+    byte_order: Optional str, 'little' (default) or 'big'
+    extended: Optional bool, write extended WKB as PostGIS does instead of ISO WKB
+    srid: Optional int, SRID to embed in extended WKB
+    as_hex: Optional bool, return the WKB as a hex string
+    engine: Optional str, WKT parser to use, 'native' (default) or the PLY based reference parser 'ply'
+    returns bytes, or a str when as_hex is set
+    """
+    if not wkt:
+        raise TypeError("Unable to convert value None")
+    geojson = _wkt_converter.wkt_to_geojson(wkt, engine=engine)
+    return _wkb_converter.geojson_to_wkb(geojson, byte_order=byte_order, extended=extended, srid=srid,
+                                         as_hex=as_hex)
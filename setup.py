@@ -20,5 +20,8 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.6",
-    install_requires=[]
+    install_requires=[],
+    extras_require={
+        "numpy": ["numpy"]
+    }
 )
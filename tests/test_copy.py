@@ -0,0 +1,84 @@
+import copy
+import json
+import unittest
+from pathlib import Path
+
+import pygeoconv
+
+
+class TestCopy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            testdata = json.loads(f.read())
+        self.geojson = [case["geojson"] for _type, case in testdata.items() if "Empty" not in _type]
+        self.geojson.append({"type": "Polygon", "coordinates": [[[0, 0], [4, 0], [4, 4], [0, 4]],
+                                                                [[1, 1], [1, 2], [2, 2], [2, 1], [1, 1]]]})
+        self.geojson.append({"type": "MultiPolygon", "coordinates": [
+            [[[0, 0], [0, 4], [4, 4], [4, 0], [0, 0]], [[1, 1], [2, 1], [2, 2]]],
+            [[[5, 5], [6, 5], [6, 6], [5, 6], [5, 5]]]]})
+        features = [{"type": "Feature", "id": i, "geometry": geojson, "properties": {"name": str(i), "value": i}}
+                    for i, geojson in enumerate(self.geojson) if geojson["type"] != "GeometryCollection"]
+        features.append({"type": "Feature", "geometry": None, "properties": None})
+        self.geojson.append({"type": "FeatureCollection", "features": features})
+
+    def test_geojson_to_esri_json(self):
+        for geojson in self.geojson:
+            with self.subTest(geojson["type"]):
+                truth = pygeoconv.geojson_to_esri_json(geojson, wkid=3857, id_attr="FID")
+                original = copy.deepcopy(geojson)
+                self.assertEqual(truth, pygeoconv.geojson_to_esri_json(original, wkid=3857, id_attr="FID",
+                                                                       copy=False))
+
+    def test_esri_json_to_geojson(self):
+        # Esri Json has no geometry collections
+        esri = [pygeoconv.geojson_to_esri_json(geojson) for geojson in self.geojson
+                if geojson["type"] != "GeometryCollection"]
+        # Open rings, holes outside of their outer ring and holes that intersect one
+        esri.append({"rings": [[[0, 0], [0, 4], [4, 4], [4, 0]], [[1, 1], [2, 1], [2, 2], [1, 2]],
+                               [[10, 10], [11, 10], [11, 11], [10, 11], [10, 10]], [[3, 3], [5, 3], [5, 5], [3, 5]]]})
+        esri.append({"paths": [[[0, 0], [1, 1]]]})
+        esri.append({"paths": [[[0, 0], [1, 1]], [[2, 2], [3, 3]]]})
+        esri.append({"features": [{"geometry": {"points": [[1, 2], [3, 4]]}, "attributes": {"OBJECTID": 5}},
+                                  {"attributes": {"name": "no geometry"}}]})
+        for esri_json in esri:
+            if isinstance(esri_json, list):
+                esri_json = {"features": esri_json}
+            with self.subTest(esri_json=str(esri_json)[:60]):
+                truth = pygeoconv.esri_json_to_geojson(esri_json)
+                original = copy.deepcopy(esri_json)
+                self.assertEqual(truth, pygeoconv.esri_json_to_geojson(original, copy=False))
+
+    def test_copy_leaves_input_unchanged(self):
+        for geojson in self.geojson:
+            with self.subTest(geojson["type"]):
+                original = copy.deepcopy(geojson)
+                esri = pygeoconv.geojson_to_esri_json(geojson)
+                self.assertEqual(original, geojson)
+                if geojson["type"] == "GeometryCollection":
+                    continue
+                original = copy.deepcopy(esri)
+                pygeoconv.esri_json_to_geojson({"features": esri} if isinstance(esri, list) else esri)
+                self.assertEqual(original, esri)
+
+    def test_shared_lists(self):
+        geojson = {"type": "Feature", "id": 7, "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+                   "properties": {"name": "line"}}
+        esri = pygeoconv.geojson_to_esri_json(geojson, copy=False)
+        self.assertIs(geojson["geometry"]["coordinates"], esri["geometry"]["paths"][0])
+        self.assertIs(geojson["properties"], esri["attributes"])
+        self.assertEqual({"name": "line", "OBJECTID": 7}, geojson["properties"])
+
+        polygon = {"type": "Polygon", "coordinates": [[[0, 0], [0, 1], [1, 1], [0, 0]]]}
+        ring = polygon["coordinates"][0]
+        esri = pygeoconv.geojson_to_esri_json(polygon, copy=False)
+        self.assertIs(ring, esri["rings"][0])
+        self.assertEqual([[0, 0], [0, 1], [1, 1], [0, 0]], ring)
+
+        arcgis = {"rings": [[[0, 0], [0, 1], [1, 1], [1, 0]]]}
+        ring = arcgis["rings"][0]
+        geojson = pygeoconv.esri_json_to_geojson(arcgis, copy=False)
+        self.assertIs(ring, geojson["coordinates"][0])
+        # Closed and reversed in place
+        self.assertEqual([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], ring)
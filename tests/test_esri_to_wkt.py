@@ -0,0 +1,78 @@
+import json
+import random
+import unittest
+
+import pygeoconv
+from pygeoconv import errors
+
+
+def _via_geojson(esri_json):
+    return pygeoconv.geojson_to_wkt(pygeoconv.esri_json_to_geojson(esri_json))
+
+
+def _square(x, y, size, clockwise):
+    ring = [[x, y], [x, y + size], [x + size, y + size], [x + size, y], [x, y]]
+    return ring if clockwise else ring[::-1]
+
+
+class TestEsriToWkt(unittest.TestCase):
+
+    def test_same_as_via_geojson(self):
+        cases = {
+            "point": {"x": -122.6764, "y": 45.5165},
+            "pointZ": {"x": -122.6764, "y": 45.5165, "z": 10},
+            "pointNaN": {"x": "NaN", "y": 22.2},
+            "multipoint": {"points": [[41.8, 71.0], [56.9, 33.7]]},
+            "multipointZ": {"points": [[41.8, 71.0, 10], [56.9, 33.7, 20]], "hasZ": True},
+            "multipointEmpty": {"points": []},
+            "polyline": {"paths": [[[6.6, 49.8], [-0.5, 32.6], [-21.7, 38.4]]]},
+            "polylineEmpty": {"paths": [[]]},
+            "multiPolyline": {"paths": [[[6.6, 49.8], [-0.5, 32.6]], [[1, 2, 3], [4, 5, 6]]]},
+            "multiPolylineEmpty": {"paths": []},
+            "polygon": {"rings": [_square(0, 0, 10, True), _square(2, 2, 2, False), _square(5, 5, 2, False)]},
+            "polygonZ": {"rings": [[[0, 0, 1], [0, 10, 1], [10, 10, 1], [10, 0, 1], [0, 0, 1]]], "hasZ": True},
+            "polygonZM": {"rings": [[[0, 0, 1, 2], [0, 10, 1, 2], [10, 10, 1, 2], [10, 0, 1, 2]]]},
+            "unclosedRings": {"rings": [[[0, 0], [0, 10], [10, 10], [10, 0]], [[2, 2], [4, 2], [4, 4]]]},
+            "invalidRings": {"rings": [[[0, 0], [0, 10], [0, 0]]]},
+            "multipolygon": {"rings": [_square(0, 0, 10, True), _square(20, 20, 10, True),
+                                       _square(22, 22, 2, False), _square(2, 2, 2, False)]},
+            "holesOutsideRings": {"rings": [
+                [[-122.45, 45.63], [-122.45, 45.68], [-122.39, 45.68], [-122.39, 45.63], [-122.45, 45.63]],
+                [[-122.46, 45.64], [-122.4, 45.64], [-122.4, 45.66], [-122.46, 45.66], [-122.46, 45.64]]]},
+            "onlyHoles": {"rings": [_square(0, 0, 10, False), _square(20, 20, 10, False), _square(25, 25, 10, False)]},
+            "extent": {"xmin": -109.55, "ymin": 25.76, "xmax": -86.39, "ymax": 48.22},
+        }
+        for name, esri_json in cases.items():
+            with self.subTest(name):
+                original = json.dumps(esri_json)
+                self.assertEqual(pygeoconv.esri_json_to_wkt(esri_json), _via_geojson(esri_json))
+                self.assertEqual(original, json.dumps(esri_json))
+
+    def test_random_polygons(self):
+        rnd = random.Random(7)
+        for i in range(200):
+            rings = []
+            for j in range(rnd.randint(1, 8)):
+                size = rnd.randint(1, 20)
+                rings.append(_square(rnd.randint(-20, 20), rnd.randint(-20, 20), size, rnd.random() < 0.5))
+                if rnd.random() < 0.3:
+                    rings[-1].pop()
+            with self.subTest(i):
+                esri_json = {"rings": rings}
+                self.assertEqual(pygeoconv.esri_json_to_wkt(esri_json), _via_geojson(esri_json))
+
+    def test_features(self):
+        feature = {"geometry": {"x": 1, "y": 2}, "attributes": {"OBJECTID": 1}}
+        with self.assertRaises(ValueError):
+            pygeoconv.esri_json_to_wkt(feature)
+        with self.assertRaises(ValueError):
+            pygeoconv.esri_json_to_wkt({"features": [feature]})
+
+    def test_unknown_object(self):
+        with self.assertRaises(errors.EsriJsonParserError):
+            pygeoconv.esri_json_to_wkt({"foo": "bar"})
+
+    def test_precision(self):
+        esri_json = {"rings": [[[0.123456, 0], [0, 1.0000001], [1, 1], [0.123456, 0]]]}
+        self.assertEqual(pygeoconv.esri_json_to_wkt(esri_json, precision=3), "POLYGON ((0.123 0, 1 1, 0 1, 0.123 0))")
+        self.assertEqual(pygeoconv.esri_json_to_wkt({"x": 1.23456, "y": 2}, precision=2), "POINT (1.23 2)")
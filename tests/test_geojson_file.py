@@ -0,0 +1,88 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv.errors import GeojsonParserError
+
+
+class TestIterGeojsonFile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            testdata = json.loads(f.read())
+        self.features = []
+        for i, (_type, case) in enumerate(testdata.items()):
+            if "Empty" in _type or case["geojson"]["type"] == "GeometryCollection":
+                continue
+            self.features.append({"type": "Feature", "id": i, "geometry": case["geojson"],
+                                  "properties": {"name": _type, "label": "café ☃ \"quoted\"\n", "value": i / 7}})
+        self.collection = {"type": "FeatureCollection", "name": "test", "features": self.features,
+                           "bbox": [-180.0, -90.0, 180.0, 90.0]}
+        self.text = json.dumps(self.collection, indent=2, ensure_ascii=False)
+
+    def test_features(self):
+        for block_size in (1, 3, 17, 1000, 1 << 20):
+            for source in (io.BytesIO(self.text.encode("utf-8")), io.StringIO(self.text)):
+                with self.subTest(block_size=block_size, source=type(source).__name__):
+                    converted = list(pygeoconv.iter_geojson_file(source, block_size=block_size))
+                    self.assertEqual(self.features, converted)
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)/"collection.geojson"
+            path.write_text(json.dumps(self.collection, separators=(",", ":")), encoding="utf-8")
+            for source in (path, str(path)):
+                with self.subTest(source=type(source).__name__):
+                    self.assertEqual(self.features, list(pygeoconv.iter_geojson_file(source)))
+
+    def test_esri_json(self):
+        truth = pygeoconv.geojson_to_esri_json(self.collection, wkid=3857, id_attr="FID")
+        source = io.BytesIO(self.text.encode("utf-8"))
+        converted = list(pygeoconv.iter_geojson_file(source, to="esri", wkid=3857, id_attr="FID", block_size=64))
+        self.assertEqual(truth, converted)
+
+    def test_member_order(self):
+        text = json.dumps({"features": self.features[:3], "crs": {"type": "name", "properties": {"name": "x"}},
+                           "type": "FeatureCollection"})
+        self.assertEqual(self.features[:3], list(pygeoconv.iter_geojson_file(io.StringIO(text), block_size=5)))
+
+    def test_empty_collections(self):
+        for text in ('{}', '{"type": "FeatureCollection", "features": []}', ' { "features" : [ ] } ',
+                     '\ufeff{"type": "FeatureCollection", "features": []}'):
+            with self.subTest(text=text):
+                self.assertEqual([], list(pygeoconv.iter_geojson_file(io.BytesIO(text.encode("utf-8")))))
+
+    def test_large_feature(self):
+        ring = [[i / 3, -i / 7] for i in range(20000)] + [[0.0, -0.0]]
+        feature = {"type": "Feature", "geometry": {"type": "LineString", "coordinates": ring}, "properties": {}}
+        text = json.dumps({"type": "FeatureCollection", "features": [feature, feature]})
+        self.assertEqual([feature, feature], list(pygeoconv.iter_geojson_file(io.StringIO(text), block_size=256)))
+
+    def test_invalid_documents(self):
+        text = json.dumps(self.collection)
+        for invalid in (text[:len(text) // 2], text[:-1], text + "{}", '{"type": "Feature", "features": []}',
+                        '{"type": "FeatureCollection", "features": [1]}', '[]',
+                        '{"type": "FeatureCollection", "features": [{"type": "Feature",}]}',
+                        '{"type": "FeatureCollection" "features": []}'):
+            with self.subTest(invalid=invalid[-40:]):
+                with self.assertRaises(GeojsonParserError):
+                    list(pygeoconv.iter_geojson_file(io.StringIO(invalid), block_size=7))
+
+    def test_features_before_an_error(self):
+        text = json.dumps({"type": "FeatureCollection", "features": self.features[:2]})[:-1] + ", ]"
+        converted = pygeoconv.iter_geojson_file(io.StringIO(text))
+        self.assertEqual(self.features[:2], [next(converted), next(converted)])
+        with self.assertRaises(GeojsonParserError):
+            next(converted)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"to": "wkt"}, {"block_size": 0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pygeoconv.iter_geojson_file(io.StringIO("{}"), **kwargs)
+        with self.assertRaises(TypeError):
+            pygeoconv.iter_geojson_file(None)
@@ -1,4 +1,7 @@
+import io
 import json
+import math
+import random
 from pathlib import Path
 import unittest
 
@@ -458,3 +461,86 @@ class TestGeojsonToWkt(unittest.TestCase):
             pygeoconv.geojson_to_wkt(source)
 
         self.assertEqual(str(cm.exception), truth, f"Failure: {_type} {_from} -> {_to}")
+
+
+class TestGeojsonToWktStreaming(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent / "data" / "geojson-to-wkt.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def test_chunks_and_out(self):
+        for _type, case in self.testdata.items():
+            if case["wkt"].startswith("Unknown Type"):
+                continue
+            with self.subTest(_type):
+                for chunk_size in (1, 7, 65536):
+                    chunks = list(pygeoconv.iter_geojson_to_wkt(case["geojson"], chunk_size=chunk_size))
+                    self.assertEqual("".join(chunks), case["wkt"])
+                out = io.StringIO()
+                self.assertIsNone(pygeoconv.geojson_to_wkt(case["geojson"], out=out))
+                self.assertEqual(out.getvalue(), case["wkt"])
+
+    def test_long_rings(self):
+        # Rings longer than one formatting block, including an exact multiple of the block size
+        rings = [[[round(math.cos(i), 6), round(math.sin(i), 6)] for i in range(n)] for n in (4096, 8192, 10001)]
+        geojson = {"type": "MultiPolygon", "coordinates": [[rings[0], rings[1]], [rings[2]], []]}
+        truth = "MULTIPOLYGON (" + ", ".join(
+            "(" + ", ".join("(" + ", ".join(f"{x} {y}" for x, y in ring) + ")" for ring in polygon) + ")"
+            for polygon in geojson["coordinates"]) + ")"
+        self.assertEqual(pygeoconv.geojson_to_wkt(geojson), truth)
+        chunks = list(pygeoconv.iter_geojson_to_wkt(geojson, chunk_size=1000))
+        self.assertEqual("".join(chunks), truth)
+        self.assertLess(max(len(chunk) for chunk in chunks), 4096 * 40)
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            pygeoconv.geojson_to_wkt({"type": "Feature", "geometry": None}, out=io.StringIO())
+
+
+class TestGeojsonToWktPrecision(unittest.TestCase):
+
+    def test_decimals(self):
+        geojson = {"type": "LineString", "coordinates": [[1.23456789, -0.0000001], [100, 2.5], [1e-7, 123456789.987654]]}
+        self.assertEqual(pygeoconv.geojson_to_wkt(geojson, precision=3),
+                         "LINESTRING (1.235 0, 100 2.5, 0 123456789.988)")
+        self.assertEqual(pygeoconv.geojson_to_wkt(geojson, precision=0),
+                         "LINESTRING (1 0, 100 2, 0 123456790)")
+        geojson = {"type": "MultiPoint", "coordinates": [[100.0, 10.5], [-10.0, -0.0000001], [0.0001, 10]]}
+        self.assertEqual(pygeoconv.geojson_to_wkt(geojson, precision=3), "MULTIPOINT (100 10.5, -10 0, 0 10)")
+
+    def test_significant(self):
+        geojson = {"type": "Point", "coordinates": [1.23456789, 123456789.987654, 0.5]}
+        self.assertEqual(pygeoconv.geojson_to_wkt(geojson, precision=4, precision_mode="significant"),
+                         "POINT Z (1.235 1.235e+08 0.5)")
+
+    def test_round_trip(self):
+        rnd = random.Random(3)
+        ring = [[rnd.uniform(-180, 180), rnd.uniform(-90, 90)] for _ in range(5000)]
+        geojson = {"type": "Polygon", "coordinates": [ring + ring[:1]]}
+        converted = pygeoconv.wkt_to_geojson(pygeoconv.geojson_to_wkt(geojson, precision=6))
+        for position, rounded in zip(geojson["coordinates"][0], converted["coordinates"][0]):
+            self.assertAlmostEqual(position[0], rounded[0], places=6)
+            self.assertAlmostEqual(position[1], rounded[1], places=6)
+
+    def test_all_geometries(self):
+        p = Path(__file__).parent / "data" / "geojson-to-wkt.json"
+        with open(p) as f:
+            testdata = json.loads(f.read())
+        for _type, case in testdata.items():
+            if case["wkt"].startswith("Unknown Type"):
+                continue
+            with self.subTest(_type):
+                # Test data coordinates have at most one decimal, rounding them only changes how they are written
+                converted = pygeoconv.geojson_to_wkt(case["geojson"], precision=2)
+                self.assertEqual(pygeoconv.wkt_to_geojson(converted), pygeoconv.wkt_to_geojson(case["wkt"]))
+                self.assertEqual("".join(pygeoconv.iter_geojson_to_wkt(case["geojson"], chunk_size=5, precision=2)),
+                                 converted)
+
+    def test_invalid_precision(self):
+        geojson = {"type": "Point", "coordinates": [1, 2]}
+        for precision, mode in ((-1, "decimals"), (0, "significant"), (1.5, "decimals"), (2, "fixed")):
+            with self.subTest(precision=precision, mode=mode):
+                with self.assertRaises(ValueError):
+                    pygeoconv.geojson_to_wkt(geojson, precision=precision, precision_mode=mode)
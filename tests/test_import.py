@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import unittest
+
+_WKT_MODULES = ('pygeoconv._wkt_parser', 'pygeoconv._wkt_parsetab', 'pygeoconv._wkt_reader', 'pygeoconv.ply.lex',
+                'pygeoconv.ply.yacc')
+
+
+def _loaded_modules(code):
+    script = f"import sys\n{code}\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.check_output([sys.executable, '-c', script], universal_newlines=True)
+    return set(output.split())
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_does_not_build_wkt_parser(self):
+        modules = _loaded_modules("import pygeoconv")
+        for module in _WKT_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_esri_and_geojson_conversion_does_not_build_wkt_parser(self):
+        modules = _loaded_modules(
+            "import pygeoconv\n"
+            "esri = pygeoconv.geojson_to_esri_json({'type': 'Point', 'coordinates': [1, 2]})\n"
+            "pygeoconv.esri_json_to_geojson(esri)\n"
+            "pygeoconv.geojson_to_wkt({'type': 'Point', 'coordinates': [1, 2]})")
+        for module in _WKT_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_parsers_are_loaded_on_first_use(self):
+        modules = _loaded_modules("import pygeoconv\npygeoconv.wkt_to_geojson('POINT (1 2)')")
+        self.assertIn('pygeoconv._wkt_reader', modules)
+        self.assertNotIn('pygeoconv._wkt_parser', modules)
+        modules = _loaded_modules("import pygeoconv\npygeoconv.wkt_to_geojson('POINT (1 2)', engine='ply')")
+        self.assertIn('pygeoconv._wkt_parser', modules)
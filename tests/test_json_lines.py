@@ -0,0 +1,159 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv.errors import EsriJsonParserError, GeojsonParserError
+
+
+class TestGeojsonSeq(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            testdata = json.loads(f.read())
+        self.features = []
+        for i, (_type, case) in enumerate(testdata.items()):
+            if "Empty" in _type or case["geojson"]["type"] == "GeometryCollection":
+                continue
+            self.features.append({"type": "Feature", "id": i, "geometry": case["geojson"],
+                                  "properties": {"name": _type, "label": "café ☃", "value": i / 7}})
+
+    def test_write(self):
+        for rs in (False, True):
+            with self.subTest(rs=rs):
+                out = io.BytesIO()
+                self.assertEqual(len(self.features), pygeoconv.write_geojson_seq(self.features, out, rs=rs))
+                prefix = "\x1e" if rs else ""
+                truth = "".join(prefix + json.dumps(feature, separators=(",", ":")) + "\n"
+                                for feature in self.features)
+                self.assertEqual(truth, out.getvalue().decode("utf-8"))
+
+    def test_round_trip(self):
+        for rs in (False, True):
+            for block_size in (1, 13, 4096):
+                with self.subTest(rs=rs, block_size=block_size):
+                    out = io.BytesIO()
+                    pygeoconv.write_geojson_seq(self.features, out, rs=rs, block_size=block_size)
+                    source = io.BytesIO(out.getvalue())
+                    self.assertEqual(self.features, list(pygeoconv.iter_geojson_seq(source, block_size=block_size)))
+
+    def test_path_and_text_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)/"features.geojsons"
+            pygeoconv.write_geojson_seq(iter(self.features), path)
+            self.assertEqual(self.features, list(pygeoconv.iter_geojson_seq(str(path))))
+            with open(path, "w", encoding="utf-8") as f:
+                pygeoconv.write_geojson_seq(self.features, f, rs=True)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(self.features, list(pygeoconv.iter_geojson_seq(f, block_size=100)))
+
+    def test_blank_lines_and_line_endings(self):
+        point = {"type": "Point", "coordinates": [1, 2]}
+        text = ('\n\x1e{"type": "Point", "coordinates": [1, 2]}\r\n  \n\x1e\n'
+                '{"type":"Point","coordinates":[1,2]}')
+        self.assertEqual([point, point], list(pygeoconv.iter_geojson_seq(io.StringIO(text))))
+
+    def test_to_esri_json(self):
+        truth = [pygeoconv.geojson_to_esri_json(feature, wkid=3857, id_attr="FID") for feature in self.features]
+        out = io.StringIO()
+        pygeoconv.write_geojson_seq(self.features, out)
+        converted = pygeoconv.iter_geojson_seq(io.StringIO(out.getvalue()), to="esri", wkid=3857, id_attr="FID")
+        self.assertEqual(truth, list(converted))
+
+    def test_from_esri_json(self):
+        esri_features = [pygeoconv.geojson_to_esri_json(feature) for feature in self.features]
+        out = io.StringIO()
+        pygeoconv.write_geojson_seq(esri_features, out, source="esri")
+        truth = [pygeoconv.esri_json_to_geojson(feature) for feature in esri_features]
+        self.assertEqual(truth, list(pygeoconv.iter_geojson_seq(io.StringIO(out.getvalue()))))
+
+    def test_numpy_coordinates(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+        geometry = {"type": "LineString", "coordinates": numpy.array([[1.0, 2.0], [3.0, 4.5]])}
+        out = io.StringIO()
+        pygeoconv.write_geojson_seq([geometry], out)
+        self.assertEqual('{"type":"LineString","coordinates":[[1.0,2.0],[3.0,4.5]]}\n', out.getvalue())
+
+    def test_invalid_lines(self):
+        text = ('{"type": "Point", "coordinates": [1, 2]}\n{"type": "Point", \n'
+                '{"type": "Point", "coordinates": [3, 4]}\n')
+        with self.assertRaisesRegex(GeojsonParserError, "on line 2"):
+            list(pygeoconv.iter_geojson_seq(io.StringIO(text)))
+        converted = list(pygeoconv.iter_geojson_seq(io.StringIO(text), errors="skip"))
+        self.assertEqual([[1, 2], [3, 4]], [geometry["coordinates"] for geometry in converted])
+        with self.assertRaisesRegex(GeojsonParserError, "on line 1"):
+            list(pygeoconv.iter_geojson_seq(io.StringIO('{"type": "Point", "coordinates": []}'), to="esri"))
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"to": "wkt"}, {"errors": "ignore"}, {"block_size": 0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pygeoconv.iter_geojson_seq(io.StringIO(""), **kwargs)
+        with self.assertRaises(ValueError):
+            pygeoconv.write_geojson_seq([], io.StringIO(), source="wkt")
+
+
+class TestEsriJsonLines(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.features = [
+            {"geometry": {"x": i, "y": -i / 3, "spatialReference": {"wkid": 4326}},
+             "attributes": {"OBJECTID": i, "name": f"point {i}"}} for i in range(50)
+        ] + [
+            {"geometry": {"rings": [[[0, 0], [0, 4], [4, 4], [4, 0], [0, 0]], [[1, 1], [2, 1], [2, 2], [1, 1]]],
+                          "spatialReference": {"wkid": 4326}},
+             "attributes": {"OBJECTID": 50, "name": "polygon"}},
+            {"geometry": {"paths": [[[0, 0, 1], [1, 1, 2]]], "hasZ": True, "spatialReference": {"wkid": 4326}},
+             "attributes": {"OBJECTID": 51}},
+        ]
+
+    def test_round_trip(self):
+        for block_size in (1, 64, 1 << 20):
+            with self.subTest(block_size=block_size):
+                out = io.BytesIO()
+                count = pygeoconv.write_esri_json_lines(self.features, out, block_size=block_size)
+                self.assertEqual(len(self.features), count)
+                self.assertEqual(len(self.features), out.getvalue().count(b"\n"))
+                source = io.BytesIO(out.getvalue())
+                self.assertEqual(self.features, list(pygeoconv.iter_esri_json_lines(source, block_size=block_size)))
+
+    def test_to_geojson(self):
+        out = io.StringIO()
+        pygeoconv.write_esri_json_lines(self.features, out)
+        truth = [pygeoconv.esri_json_to_geojson(feature) for feature in self.features]
+        converted = pygeoconv.iter_esri_json_lines(io.StringIO(out.getvalue()), to="geojson")
+        self.assertEqual(truth, list(converted))
+
+    def test_pipeline(self):
+        geojson = io.StringIO()
+        pygeoconv.write_geojson_seq(self.features, geojson, source="esri", rs=True)
+        esri = io.BytesIO()
+        pygeoconv.write_esri_json_lines(pygeoconv.iter_geojson_seq(io.StringIO(geojson.getvalue())), esri,
+                                        source="geojson", wkid=3857)
+        truth = [pygeoconv.geojson_to_esri_json(pygeoconv.esri_json_to_geojson(feature), wkid=3857)
+                 for feature in self.features]
+        self.assertEqual(truth, list(pygeoconv.iter_esri_json_lines(io.BytesIO(esri.getvalue()))))
+
+    def test_non_ascii_attributes(self):
+        features = [{"geometry": {"x": 1, "y": 2}, "attributes": {"OBJECTID": 1, "name": "Göteborg ☃"}}]
+        out = io.BytesIO()
+        pygeoconv.write_esri_json_lines(features, out)
+        text = out.getvalue().decode("ascii")
+        self.assertIn('"name":"G\\u00f6teborg \\u2603"', text)
+        self.assertEqual(json.dumps(features[0], separators=(",", ":")) + "\n", text)
+        self.assertEqual(features, list(pygeoconv.iter_esri_json_lines(io.BytesIO(out.getvalue()))))
+
+    def test_invalid_lines(self):
+        text = '{"x": 1, "y": 2}\n{"x": 1,\n{"x": 3, "y": 4}\n'
+        with self.assertRaisesRegex(EsriJsonParserError, "on line 2"):
+            list(pygeoconv.iter_esri_json_lines(io.StringIO(text)))
+        converted = list(pygeoconv.iter_esri_json_lines(io.StringIO(text), errors="skip"))
+        self.assertEqual([1, 3], [geometry["x"] for geometry in converted])
+        with self.assertRaisesRegex(EsriJsonParserError, "on line 1"):
+            list(pygeoconv.iter_esri_json_lines(io.StringIO('{"unknown": 1}'), to="geojson"))
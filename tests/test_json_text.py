@@ -0,0 +1,161 @@
+import json
+import random
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv.errors import GeojsonParserError, WkbParserError, WktParserError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+class TestJsonText(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def assertSameText(self, function, text_function, *args, **kwargs):
+        try:
+            truth = _dumps(function(*args, **kwargs))
+        except Exception as e:
+            with self.assertRaises(type(e)):
+                text_function(*args, **kwargs)
+            return
+        self.assertEqual(truth, text_function(*args, **kwargs))
+
+    def test_wkt(self):
+        for _type, case in self.testdata.items():
+            for engine in ("native", "ply"):
+                for wkt in (case["wkt"], case["wkt"].encode("ascii")):
+                    with self.subTest(_type, engine=engine, input=type(wkt).__name__):
+                        self.assertSameText(pygeoconv.wkt_to_geojson, pygeoconv.wkt_to_geojson_str, wkt,
+                                            engine=engine)
+                        self.assertSameText(pygeoconv.wkt_to_esri_json, pygeoconv.wkt_to_esri_json_str, wkt,
+                                            wkid=3857, engine=engine)
+
+    def test_bytes(self):
+        wkt = "POLYGON ((0 0, 0 1, 1 1, 0 0))"
+        self.assertEqual(pygeoconv.wkt_to_geojson_str(wkt).encode("utf-8"), pygeoconv.wkt_to_geojson_bytes(wkt))
+        self.assertEqual(pygeoconv.wkt_to_esri_json_str(wkt).encode("utf-8"), pygeoconv.wkt_to_esri_json_bytes(wkt))
+        geojson = pygeoconv.wkt_to_geojson(wkt)
+        self.assertEqual(_dumps(pygeoconv.geojson_to_esri_json(geojson)).encode("utf-8"),
+                         pygeoconv.geojson_to_esri_json_bytes(geojson))
+        esri = pygeoconv.geojson_to_esri_json(geojson)
+        self.assertEqual(_dumps(pygeoconv.esri_json_to_geojson(esri)).encode("utf-8"),
+                         pygeoconv.esri_json_to_geojson_bytes(esri))
+        wkb = pygeoconv.wkt_to_wkb(wkt)
+        self.assertEqual(_dumps(pygeoconv.wkb_to_geojson(wkb)).encode("utf-8"), pygeoconv.wkb_to_geojson_bytes(wkb))
+        self.assertEqual(_dumps(pygeoconv.wkb_to_esri_json(wkb)).encode("utf-8"),
+                         pygeoconv.wkb_to_esri_json_bytes(wkb))
+
+    def test_number_formats(self):
+        # Numbers json writes differently are converted, the others are copied from the WKT
+        numbers = ["0", "-0", "007", "-010", "12345678901234567890", "0.0", "-0.0", "1.0", "1.50", "0.1", "0.10",
+                   "0.0001", "0.00010", "0.00001", "-0.00012", "1e5", "1E-3", "2.5e+17", "123456789012345.0",
+                   "1234567890123456.0", "0.123456789012345", "0.1234567890123456", "9007199254740993.0",
+                   "3.141592653589793", "100", "-2.5", "1e400"]
+        for x in numbers:
+            for y in numbers:
+                wkt = f"LINESTRING ({x} {y}, {y} {x}, 1.5 2)"
+                with self.subTest(wkt=wkt):
+                    self.assertSameText(pygeoconv.wkt_to_geojson, pygeoconv.wkt_to_geojson_str, wkt)
+                    self.assertSameText(pygeoconv.wkt_to_esri_json, pygeoconv.wkt_to_esri_json_str, wkt)
+
+    def test_random_geometries(self):
+        rnd = random.Random(7)
+
+        def number():
+            if rnd.random() < 0.5:
+                return repr(round(rnd.uniform(-1000, 1000), rnd.randint(0, 8)))
+            return "%.*f" % (rnd.randint(0, 18), rnd.uniform(-1e6, 1e6))
+
+        for i in range(60):
+            dimensions = rnd.choice((2, 3, 4))
+            modifier = {2: "", 3: " Z", 4: " ZM"}[dimensions]
+            positions = [" ".join(number() for _ in range(dimensions)) for _ in range(rnd.randint(4, 300))]
+            if rnd.random() < 0.5:
+                positions.append(positions[0])
+            ring = rnd.choice((", ", ",", " , ", "\n,\t")).join(positions)
+            reversed_ring = ", ".join(reversed(positions))
+            for wkt in (f"LINESTRING{modifier} ({ring})", f"MULTIPOINT{modifier} ({ring})",
+                        f"POLYGON{modifier} (({ring}), ({reversed_ring}))",
+                        f"MULTIPOLYGON{modifier} ((({reversed_ring})), (({ring}), ({ring})))"):
+                with self.subTest(i=i, wkt=wkt[:40]):
+                    self.assertSameText(pygeoconv.wkt_to_geojson, pygeoconv.wkt_to_geojson_str, wkt)
+                    self.assertSameText(pygeoconv.wkt_to_esri_json, pygeoconv.wkt_to_esri_json_str, wkt)
+
+    def test_esri_rings(self):
+        for wkt in ("POLYGON ((0 0, 0 1, 1 1, 1 0, 0 0))", "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))",
+                    "POLYGON ((0 0, 1 0, 1 1, 0 1))", "POLYGON ((0 0, 4 0, 4 4, 0 4), (1 1, 1 2, 2 2, 2 1))",
+                    "POLYGON ((0 0, 4 0, 4 4, 0 4), (1 1, 2 1, 2 2))",
+                    "POLYGON ((0 0, 1 0, 0 0), (1 1, 2 1, 2 2, 1 1))",
+                    "POLYGON ((0 0, 1.5 0, 1 1, 0 1, 0.0 0.0))", "POLYGON ((0 0, 1e0 0, 1 1, 0 1))",
+                    "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 1)), ((5 5, 5 6, 6 6, 6 5), (5.5 5.5, 5.75 5.5, 5.75 5.75)))"):
+            with self.subTest(wkt=wkt):
+                self.assertSameText(pygeoconv.wkt_to_esri_json, pygeoconv.wkt_to_esri_json_str, wkt, wkid=2056)
+
+    def test_wkb(self):
+        for _type, case in self.testdata.items():
+            if _type in ("multipolygonZ", "multipolygonM", "multipolygonZM", "pointScientificNotation"):
+                continue
+            for wkb in (pygeoconv.wkt_to_wkb(case["wkt"]), pygeoconv.wkt_to_wkb(case["wkt"], byte_order="big",
+                                                                                as_hex=True)):
+                with self.subTest(_type, wkb=type(wkb).__name__):
+                    self.assertSameText(pygeoconv.wkb_to_geojson, pygeoconv.wkb_to_geojson_str, wkb)
+                    self.assertSameText(pygeoconv.wkb_to_esri_json, pygeoconv.wkb_to_esri_json_str, wkb, wkid=3857)
+
+    def test_wkb_nan(self):
+        wkb = pygeoconv.geojson_to_wkb({"type": "LineString", "coordinates": [[float("nan"), 1], [2, float("inf")]]})
+        self.assertEqual('{"type":"LineString","coordinates":[[NaN,1.0],[2.0,Infinity]]}',
+                         pygeoconv.wkb_to_geojson_str(wkb))
+
+    def test_features(self):
+        features = []
+        for i, (_type, case) in enumerate(self.testdata.items()):
+            if "Empty" in _type or case["geojson"]["type"] == "GeometryCollection":
+                continue
+            features.append({"type": "Feature", "id": i, "geometry": case["geojson"],
+                             "properties": {"name": _type, "label": "café ☃", "nested": {"coordinates": [1, [2]]},
+                                            "rings": None, "value": i / 7}})
+        collection = {"type": "FeatureCollection", "features": features}
+        for geojson in features + [collection]:
+            with self.subTest(geojson.get("id")):
+                self.assertSameText(pygeoconv.geojson_to_esri_json, pygeoconv.geojson_to_esri_json_str, geojson,
+                                    wkid=3857, id_attr="FID")
+                esri = pygeoconv.geojson_to_esri_json(geojson)
+                if isinstance(esri, list):
+                    esri = {"features": esri}
+                self.assertSameText(pygeoconv.esri_json_to_geojson, pygeoconv.esri_json_to_geojson_str, esri,
+                                    id_attr="OBJECTID")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_coordinates(self):
+        geojson = {"type": "Polygon", "coordinates": [numpy.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])]}
+        self.assertSameText(pygeoconv.geojson_to_esri_json, pygeoconv.geojson_to_esri_json_str, geojson)
+
+    def test_errors(self):
+        with self.assertRaises(WktParserError):
+            pygeoconv.wkt_to_geojson_str("POINT (1)")
+        with self.assertRaises(WktParserError):
+            pygeoconv.wkt_to_esri_json_str(b"LINESTRING (1 2, 3 4")
+        with self.assertRaises(GeojsonParserError):
+            pygeoconv.wkt_to_esri_json_str("POINT EMPTY")
+        with self.assertRaises(WkbParserError):
+            pygeoconv.wkb_to_geojson_str(b"\x01\x01\x00")
+        with self.assertRaises(ValueError):
+            pygeoconv.wkt_to_geojson_str("POINT (1 2)", engine="other")
+        for function in (pygeoconv.wkt_to_geojson_str, pygeoconv.wkt_to_esri_json_str, pygeoconv.wkb_to_geojson_str,
+                         pygeoconv.wkb_to_esri_json_str, pygeoconv.geojson_to_esri_json_str,
+                         pygeoconv.esri_json_to_geojson_str):
+            with self.subTest(function.__name__):
+                with self.assertRaises(TypeError):
+                    function(None)
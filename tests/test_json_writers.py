@@ -0,0 +1,173 @@
+import io
+import json
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygeoconv
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+class TestGeoJSONFeatureCollectionWriter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            testdata = json.loads(f.read())
+        self.features = []
+        for i, (_type, case) in enumerate(testdata.items()):
+            if "Empty" in _type or case["geojson"]["type"] == "GeometryCollection":
+                continue
+            self.features.append({"type": "Feature", "id": i, "geometry": case["geojson"],
+                                  "properties": {"name": _type, "label": "café ☃", "value": i / 7}})
+        self.truth = _dumps({"type": "FeatureCollection", "features": self.features})
+
+    def test_write(self):
+        for block_size in (1, 100, 1 << 20):
+            for out in (io.BytesIO(), io.StringIO()):
+                with self.subTest(block_size=block_size, out=type(out).__name__):
+                    with pygeoconv.GeoJSONFeatureCollectionWriter(out, block_size=block_size) as writer:
+                        for feature in self.features:
+                            writer.write(feature)
+                    self.assertEqual(len(self.features), writer.count)
+                    text = out.getvalue()
+                    self.assertEqual(self.truth, text if isinstance(text, str) else text.decode("utf-8"))
+
+    def test_path_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)/"collection.geojson"
+            with pygeoconv.GeoJSONFeatureCollectionWriter(str(path)) as writer:
+                self.assertEqual(len(self.features), writer.write_all(iter(self.features)))
+            self.assertEqual(self.features, list(pygeoconv.iter_geojson_file(path)))
+
+    def test_empty_collection(self):
+        out = io.StringIO()
+        pygeoconv.GeoJSONFeatureCollectionWriter(out).close()
+        self.assertEqual('{"type":"FeatureCollection","features":[]}', out.getvalue())
+
+    def test_from_esri_json(self):
+        esri_features = [pygeoconv.geojson_to_esri_json(feature) for feature in self.features]
+        out = io.StringIO()
+        with pygeoconv.GeoJSONFeatureCollectionWriter(out, source="esri") as writer:
+            writer.write_all(esri_features)
+        truth = pygeoconv.esri_json_to_geojson({"features": esri_features})
+        self.assertEqual(truth, json.loads(out.getvalue()))
+
+    def test_socket(self):
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            with pygeoconv.GeoJSONFeatureCollectionWriter(sender, block_size=64) as writer:
+                writer.write_all(self.features[:3])
+            sender.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = receiver.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        truth = _dumps({"type": "FeatureCollection", "features": self.features[:3]})
+        self.assertEqual(truth, b"".join(chunks).decode("utf-8"))
+
+    def test_closed_writer(self):
+        out = io.StringIO()
+        writer = pygeoconv.GeoJSONFeatureCollectionWriter(out)
+        writer.write(self.features[0])
+        writer.close()
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(self.features[1])
+        self.assertEqual(_dumps({"type": "FeatureCollection", "features": self.features[:1]}), out.getvalue())
+
+    def test_error_leaves_collection_open(self):
+        out = io.StringIO()
+        with self.assertRaises(KeyError):
+            with pygeoconv.GeoJSONFeatureCollectionWriter(out, block_size=1) as writer:
+                writer.write(self.features[0])
+                raise KeyError("failed")
+        self.assertFalse(out.getvalue().endswith("]}"))
+
+    def test_non_ascii_properties(self):
+        out = io.BytesIO()
+        with pygeoconv.GeoJSONFeatureCollectionWriter(out) as writer:
+            writer.write(self.features[0])
+        text = out.getvalue().decode("ascii")
+        self.assertIn('"label":"caf\\u00e9 \\u2603"', text)
+        self.assertEqual(json.dumps({"type": "FeatureCollection", "features": self.features[:1]},
+                                    separators=(",", ":")), text)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"source": "wkt"}, {"block_size": 0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pygeoconv.GeoJSONFeatureCollectionWriter(io.StringIO(), **kwargs)
+        with self.assertRaises(TypeError):
+            pygeoconv.GeoJSONFeatureCollectionWriter(None)
+
+
+class TestEsriFeatureSetWriter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.features = [
+            {"geometry": {"rings": [[[0, 0], [0, 4], [4, 4], [4, 0], [0, 0]]], "spatialReference": {"wkid": 3857}},
+             "attributes": {"OBJECTID": i, "name": f"polygon {i}"}} for i in range(20)
+        ]
+
+    def test_write(self):
+        out = io.BytesIO()
+        with pygeoconv.EsriFeatureSetWriter(out, wkid=3857, block_size=10) as writer:
+            writer.write_all(self.features)
+        truth = {"geometryType": "esriGeometryPolygon", "spatialReference": {"wkid": 3857},
+                 "features": self.features}
+        self.assertEqual(_dumps(truth), out.getvalue().decode("utf-8"))
+
+    def test_geometry_types(self):
+        for geometry, geometry_type in (({"x": 1, "y": 2}, "esriGeometryPoint"),
+                                        ({"points": [[1, 2]]}, "esriGeometryMultipoint"),
+                                        ({"paths": [[[1, 2], [3, 4]]]}, "esriGeometryPolyline"),
+                                        ({"xmin": 1, "ymin": 2, "xmax": 3, "ymax": 4}, "esriGeometryEnvelope")):
+            with self.subTest(geometry_type=geometry_type):
+                out = io.StringIO()
+                with pygeoconv.EsriFeatureSetWriter(out) as writer:
+                    writer.write({"geometry": geometry, "attributes": {}})
+                    writer.write({"attributes": {}})
+                self.assertEqual(geometry_type, json.loads(out.getvalue())["geometryType"])
+
+    def test_empty_feature_set(self):
+        out = io.StringIO()
+        pygeoconv.EsriFeatureSetWriter(out).close()
+        self.assertEqual('{"spatialReference":{"wkid":4326},"features":[]}', out.getvalue())
+        out = io.StringIO()
+        pygeoconv.EsriFeatureSetWriter(out, geometry_type="esriGeometryPoint", wkid=2056).close()
+        self.assertEqual('{"geometryType":"esriGeometryPoint","spatialReference":{"wkid":2056},"features":[]}',
+                         out.getvalue())
+
+    def test_mixed_geometry_types(self):
+        writer = pygeoconv.EsriFeatureSetWriter(io.StringIO())
+        writer.write(self.features[0])
+        with self.assertRaises(ValueError):
+            writer.write({"geometry": {"x": 1, "y": 2}, "attributes": {}})
+        self.assertEqual(1, writer.count)
+
+    def test_non_ascii_attributes(self):
+        feature = {"geometry": {"x": 1, "y": 2}, "attributes": {"OBJECTID": 1, "name": "Göteborg"}}
+        out = io.BytesIO()
+        with pygeoconv.EsriFeatureSetWriter(out) as writer:
+            writer.write(feature)
+        text = out.getvalue().decode("ascii")
+        self.assertIn('"name":"G\\u00f6teborg"', text)
+        self.assertEqual(feature, json.loads(text)["features"][0])
+
+    def test_from_geojson(self):
+        geojson = {"type": "FeatureCollection", "features": [
+            {"type": "Feature", "id": i, "geometry": {"type": "LineString", "coordinates": [[i, 0], [0, i]]},
+             "properties": {"name": str(i)}} for i in range(5)]}
+        out = io.StringIO()
+        with pygeoconv.EsriFeatureSetWriter(out, source="geojson", wkid=3857, id_attr="FID") as writer:
+            writer.write_all(pygeoconv.iter_geojson_file(io.StringIO(json.dumps(geojson))))
+        truth = {"geometryType": "esriGeometryPolyline", "spatialReference": {"wkid": 3857},
+                 "features": pygeoconv.geojson_to_esri_json(geojson, wkid=3857, id_attr="FID")}
+        self.assertEqual(_dumps(truth), out.getvalue())
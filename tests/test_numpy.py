@@ -0,0 +1,152 @@
+import json
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv._numpy import geojson_to_arrays
+from pygeoconv.errors import WktParserError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _tolist(value):
+    if isinstance(value, list):
+        return [_tolist(item) for item in value]
+    return value.tolist()
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestNumpyOutput(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def _assert_arrays(self, geojson, truth):
+        if geojson['type'] == 'GeometryCollection':
+            for geometry, geometry_truth in zip(geojson['geometries'], truth['geometries']):
+                self._assert_arrays(geometry, geometry_truth)
+            return
+        if not truth['coordinates']:
+            self.assertEqual(geojson['coordinates'], [])
+            return
+        depth = {'Point': 0, 'LineString': 1, 'MultiPoint': 1}.get(geojson['type'])
+        if depth is not None:
+            self.assertIsInstance(geojson['coordinates'], numpy.ndarray)
+            self.assertEqual(geojson['coordinates'].ndim, depth + 1)
+            self.assertEqual(geojson['coordinates'].dtype, numpy.float64)
+        self.assertEqual(_tolist(geojson['coordinates']), truth['coordinates'])
+
+    def test_wkt_to_geojson_numpy(self):
+        for _type, case in self.testdata.items():
+            for engine in ("native", "ply"):
+                with self.subTest(_type, engine=engine):
+                    converted = pygeoconv.wkt_to_geojson(case["wkt"], engine=engine, coords="numpy")
+                    self._assert_arrays(converted, case["geojson"])
+
+    def test_wkt_polygon_rings(self):
+        converted = pygeoconv.wkt_to_geojson("POLYGON Z ((0 0 1, 10 0 1, 10 10 1, 0 0 1), (1 1 1, 2 1 1, 2 2 1, 1 1 1))",
+                                             coords="numpy")
+        self.assertEqual(len(converted["coordinates"]), 2)
+        self.assertEqual([ring.shape for ring in converted["coordinates"]], [(4, 3), (4, 3)])
+
+    def test_wkt_mixed_dimensions(self):
+        with self.assertRaises(WktParserError):
+            pygeoconv.wkt_to_geojson("LINESTRING (1 2, 3 4 5)", coords="numpy")
+
+    def test_esri_json_to_geojson_numpy(self):
+        inp = {
+            "features": [{
+                "geometry": {"rings": [[[0, 0], [0, 10], [10, 10], [10, 0], [0, 0]],
+                                       [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]]},
+                "attributes": {"OBJECTID": 1}
+            }, {
+                "geometry": {"paths": [[[0, 0], [1, 1]]]},
+                "attributes": {"OBJECTID": 2}
+            }, {
+                "geometry": {"x": 1, "y": 2},
+                "attributes": {"OBJECTID": 3}
+            }]
+        }
+        truth = pygeoconv.esri_json_to_geojson(inp)
+        converted = pygeoconv.esri_json_to_geojson(inp, coords="numpy")
+        for feature, feature_truth in zip(converted["features"], truth["features"]):
+            self._assert_arrays(feature["geometry"], feature_truth["geometry"])
+        self.assertEqual(converted["features"][0]["geometry"]["coordinates"][0].shape, (5, 2))
+
+    def test_unknown_coords(self):
+        with self.assertRaises(ValueError):
+            pygeoconv.wkt_to_geojson("POINT (1 2)", coords="tuple")
+        with self.assertRaises(ValueError):
+            pygeoconv.esri_json_to_geojson({"x": 1, "y": 2}, coords="tuple")
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestNumpyInput(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"geojson-to-wkt.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def _as_arrays(self, geojson):
+        # geojson_to_arrays converts in place, work on a copy so the list version stays available
+        return geojson_to_arrays(json.loads(json.dumps(geojson)))
+
+    def _as_lists(self, geojson):
+        # The list GeoJson with the float typing of the arrays
+        return json.loads(json.dumps(geojson, default=lambda value: value.tolist()))
+
+    def test_geojson_to_wkt_numpy(self):
+        for _type, case in self.testdata.items():
+            if case["wkt"].startswith("Unknown Type"):
+                continue
+            with self.subTest(_type):
+                arrays = self._as_arrays(case["geojson"])
+                self.assertEqual(pygeoconv.geojson_to_wkt(arrays), pygeoconv.geojson_to_wkt(self._as_lists(arrays)))
+
+    def test_geojson_to_esri_json_numpy(self):
+        for _type, case in self.testdata.items():
+            if case["wkt"].startswith("Unknown Type") or not case["geojson"].get("coordinates", True):
+                continue
+            with self.subTest(_type):
+                arrays = self._as_arrays(case["geojson"])
+                converted = pygeoconv.geojson_to_esri_json(arrays)
+                self.assertEqual(converted, pygeoconv.geojson_to_esri_json(self._as_lists(arrays)))
+                json.dumps(converted)
+
+    def test_orient_and_close_rings(self):
+        # Counter clockwise outer ring and clockwise hole, neither of them closed
+        polygon = {
+            "type": "Polygon",
+            "coordinates": [numpy.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=numpy.float64),
+                            numpy.array([[2, 2], [2, 4], [4, 4], [4, 2]], dtype=numpy.float64)]
+        }
+        output = pygeoconv.geojson_to_esri_json(polygon)
+        self.assertEqual(output["rings"], [
+            [[0.0, 0.0], [0.0, 10.0], [10.0, 10.0], [10.0, 0.0], [0.0, 0.0]],
+            [[2.0, 2.0], [4.0, 2.0], [4.0, 4.0], [2.0, 4.0], [2.0, 2.0]],
+        ])
+        self.assertEqual(polygon["coordinates"][0].shape, (4, 2))
+
+    def test_stacked_arrays(self):
+        rings = numpy.array([[[0, 0], [0, 10], [10, 10], [10, 0], [0, 0]],
+                             [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]], dtype=numpy.float64)
+        for geojson_type, coordinates in (("Polygon", rings), ("MultiLineString", rings),
+                                          ("MultiPolygon", rings[numpy.newaxis])):
+            with self.subTest(geojson_type):
+                geojson = {"type": geojson_type, "coordinates": coordinates}
+                lists = {"type": geojson_type, "coordinates": coordinates.tolist()}
+                self.assertEqual(pygeoconv.geojson_to_esri_json(geojson), pygeoconv.geojson_to_esri_json(lists))
+                self.assertEqual(pygeoconv.geojson_to_wkt(geojson), pygeoconv.geojson_to_wkt(lists))
+
+    def test_long_array_chunks(self):
+        ring = numpy.linspace(0, 1, 2 * 10001).reshape(-1, 2)
+        geojson = {"type": "LineString", "coordinates": ring}
+        truth = pygeoconv.geojson_to_wkt({"type": "LineString", "coordinates": ring.tolist()})
+        self.assertEqual(pygeoconv.geojson_to_wkt(geojson), truth)
+        self.assertEqual("".join(pygeoconv.iter_geojson_to_wkt(geojson, chunk_size=100)), truth)
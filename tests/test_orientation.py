@@ -0,0 +1,72 @@
+import math
+import random
+import unittest
+
+from pygeoconv._orientation import ring_is_clockwise, shoelace_sum
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _geojson_sum(ring):
+    # The loop of the GeoJson converter before the shared kernel
+    total = 0
+    pt1 = ring[0]
+    for i in range(len(ring) - 1):
+        pt2 = ring[i + 1]
+        total += (pt2[0] - pt1[0]) * (pt2[1] + pt1[1])
+        pt1 = pt2
+    return total
+
+
+def _esri_sum(ring):
+    # The loop of the Esri Json converter before the shared kernel, with the edge back to the first position
+    area = 0
+    for i in range(len(ring)):
+        j = (i + 1) % len(ring)
+        area += (ring[j][0] - ring[i][0]) * (ring[j][1] + ring[i][1])
+    return area
+
+
+def _ring(rnd, n, dimensions=2):
+    positions = []
+    for k in range(n):
+        r = rnd.uniform(0.5, 1.5)
+        position = [r * math.cos(2 * math.pi * k / n), r * math.sin(2 * math.pi * k / n)]
+        positions.append(position + [rnd.uniform(0, 100) for _ in range(dimensions - 2)])
+    return positions + [positions[0][:]]
+
+
+class TestOrientation(unittest.TestCase):
+
+    def test_same_sum(self):
+        rnd = random.Random(4)
+        for n in (3, 4, 10, 100, 1000):
+            for dimensions in (2, 3, 4):
+                ring = _ring(rnd, n, dimensions)
+                for ring in (ring, ring[::-1], [tuple(position) for position in ring]):
+                    with self.subTest(n=n, dimensions=dimensions, ring=type(ring[0]).__name__):
+                        self.assertEqual(_geojson_sum(ring), shoelace_sum(ring))
+                        self.assertEqual(_esri_sum(ring), shoelace_sum(ring))
+
+    def test_orientation(self):
+        self.assertTrue(ring_is_clockwise([[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]))
+        self.assertFalse(ring_is_clockwise([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]))
+        # Rings without area count as clockwise
+        self.assertTrue(ring_is_clockwise([[0, 0], [1, 1], [0, 0], [0, 0]]))
+        self.assertIsInstance(shoelace_sum([[0, 0], [0, 1], [1, 1], [0, 0]]), int)
+
+    def test_mixed_dimensions(self):
+        ring = [[0, 0], [0, 1, 5], [1, 1], [1, 0, 2, 3], [0, 0]]
+        self.assertEqual(_geojson_sum(ring), shoelace_sum(ring))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_array(self):
+        rnd = random.Random(8)
+        for n in (3, 100, 10000):
+            ring = _ring(rnd, n, 3)
+            with self.subTest(n=n):
+                self.assertAlmostEqual(_geojson_sum(ring), shoelace_sum(numpy.array(ring)))
+                self.assertEqual(ring_is_clockwise(ring), ring_is_clockwise(numpy.array(ring)))
@@ -0,0 +1,265 @@
+import math
+import random
+import unittest
+
+import pygeoconv
+from pygeoconv._esri_json import _array_intersects_array, _close_ring, _coordinates_contain_coordinates, \
+    _coordinates_contain_point, _edge_intersects_edge, _ring_is_clockwise, group_rings
+from pygeoconv._index import STRTree, envelope
+
+
+def _linear_group_rings(rings):
+    # group_rings as it was before the index, every hole is tested against every outer ring
+    outer_rings = []
+    holes = []
+    for ring in rings:
+        ring = _close_ring(ring)
+        if len(ring) < 4:
+            continue
+        if _ring_is_clockwise(ring):
+            outer_rings.append([(ring, True)])
+        else:
+            holes.append(ring)
+    uncontained_holes = []
+    while holes:
+        hole = holes.pop()
+        for x in range(len(outer_rings) - 1, -1, -1):
+            if _coordinates_contain_coordinates(outer_rings[x][0][0], hole):
+                outer_rings[x].append((hole, True))
+                break
+        else:
+            uncontained_holes.append(hole)
+    while uncontained_holes:
+        hole = uncontained_holes.pop()
+        for x in range(len(outer_rings) - 1, -1, -1):
+            if _array_intersects_array(outer_rings[x][0][0], hole):
+                outer_rings[x].append((hole, True))
+                break
+        else:
+            outer_rings.append([(hole, False)])
+    return outer_rings
+
+
+def _pairs_intersect(a, b):
+    # _array_intersects_array as it was before the sweep, every edge of a tested against every edge of b
+    for i in range(len(a) - 1):
+        for j in range(len(b) - 1):
+            if _edge_intersects_edge(a[i], a[i + 1], b[j], b[j + 1]):
+                return True
+    return False
+
+
+def _star(rnd, n, cx, cy, radius):
+    ring = []
+    for k in range(n):
+        angle = 2 * math.pi * k / n
+        r = radius * rnd.uniform(0.3, 1.0)
+        ring.append([cx + r * math.cos(angle), cy + r * math.sin(angle)])
+    return ring + ring[:1]
+
+
+def _square(x, y, size, clockwise):
+    ring = [[x, y], [x, y + size], [x + size, y + size], [x + size, y], [x, y]]
+    return ring if clockwise else ring[::-1]
+
+
+class TestSTRTree(unittest.TestCase):
+
+    def test_query(self):
+        rnd = random.Random(3)
+        for n in (0, 1, 5, 16, 17, 300, 2000):
+            boxes = []
+            for _ in range(n):
+                x, y = rnd.uniform(-100, 100), rnd.uniform(-100, 100)
+                boxes.append((x, y, x + rnd.uniform(0, 20), y + rnd.uniform(0, 20)))
+            tree = STRTree(boxes)
+            for _ in range(50):
+                x, y = rnd.uniform(-110, 110), rnd.uniform(-110, 110)
+                query = (x, y, x + rnd.uniform(0, 30), y + rnd.uniform(0, 30))
+                with self.subTest(n=n, query=query):
+                    truth = [i for i, box in enumerate(boxes) if box[0] <= query[2] and query[0] <= box[2] and
+                             box[1] <= query[3] and query[1] <= box[3]]
+                    self.assertEqual(truth, sorted(tree.query(*query)))
+                    truth = [i for i, box in enumerate(boxes) if box[0] <= x <= box[2] and box[1] <= y <= box[3]]
+                    self.assertEqual(truth, sorted(tree.query_point(x, y)))
+
+    def test_envelope(self):
+        ring = [[1, 2], [-3, 4, 9], [5, -6], [1, 2]]
+        self.assertEqual((-3, -6, 5, 4), envelope(ring))
+        minx, miny, maxx, maxy = envelope(ring, 0.01)
+        self.assertAlmostEqual(-3.1, minx)
+        self.assertAlmostEqual(4.1, maxy)
+
+
+class TestGroupRings(unittest.TestCase):
+
+    def assertSameGrouping(self, rings):
+        truth = _linear_group_rings([ring[:] for ring in rings])
+        self.assertEqual(truth, group_rings([ring[:] for ring in rings]))
+
+    def test_grid(self):
+        rings = []
+        for i in range(10):
+            for j in range(10):
+                rings.append(_square(i * 10, j * 10, 8, True))
+                rings.append(_square(i * 10 + 1, j * 10 + 1, 2, False))
+                rings.append(_square(i * 10 + 5, j * 10 + 5, 2, False))
+        rings.append(_square(-20, -20, 5, False))
+        grouped = group_rings(rings)
+        self.assertEqual(101, len(grouped))
+        self.assertEqual([3] * 100 + [1], [len(polygon) for polygon in grouped])
+        self.assertSameGrouping(rings)
+
+    def test_random_rings(self):
+        rnd = random.Random(11)
+        for case in range(200):
+            rings = []
+            for _ in range(rnd.randint(1, 30)):
+                size = rnd.uniform(0.5, 30)
+                # Shells and holes that overlap, nest, touch and cross each other
+                rings.append(_square(rnd.randint(-20, 20), rnd.randint(-20, 20), size, rnd.random() < 0.4))
+            with self.subTest(case=case):
+                self.assertSameGrouping(rings)
+
+    def test_long_rings(self):
+        # Outer rings long enough to be prepared
+        rnd = random.Random(13)
+        for case in range(60):
+            rings = []
+            for _ in range(rnd.randint(1, 12)):
+                ring = _star(rnd, rnd.randint(3, 120), rnd.uniform(-10, 10), rnd.uniform(-10, 10), rnd.uniform(1, 15))
+                rings.append(ring[::-1] if rnd.random() < 0.3 else ring)
+            with self.subTest(case=case):
+                self.assertSameGrouping(rings)
+
+    def test_not_finite_coordinates(self):
+        # Holes whose boxes or first points are not finite are tested against every outer ring
+        nan, inf = float("nan"), float("inf")
+        rings = [_square(i * 20, 0, 10, True) for i in range(40)]
+        self.assertSameGrouping(rings + [[[nan, 5], [5, 5], [15, 8], [5, 2], [nan, 5]]])
+        rnd = random.Random(17)
+        for value in (nan, inf, -inf):
+            for position in (0, 2):
+                for case in range(20):
+                    hole = _square(rnd.uniform(-10, 800), rnd.uniform(-10, 10), rnd.uniform(1, 12), False)
+                    hole[position] = [value, rnd.uniform(0, 10)]
+                    if position == 0:
+                        hole[-1] = hole[0]
+                    with self.subTest(value=value, position=position, case=case):
+                        self.assertSameGrouping(rings + [hole])
+
+    def test_esri_json_to_geojson(self):
+        holes = [_square(i * 3 + 0.5, 0.5, 1, False) for i in range(20)]
+        rings = [_square(i * 3, 0, 2, True) for i in range(20)] + holes
+        geojson = pygeoconv.esri_json_to_geojson({"rings": rings})
+        self.assertEqual("MultiPolygon", geojson["type"])
+        self.assertEqual([2] * 20, [len(polygon) for polygon in geojson["coordinates"]])
+
+
+class TestRingIntersection(unittest.TestCase):
+
+    def test_random_rings(self):
+        rnd = random.Random(5)
+        for case in range(300):
+            a = _star(rnd, rnd.randint(3, 60), rnd.uniform(-5, 5), rnd.uniform(-5, 5), rnd.uniform(0.5, 10))
+            b = _star(rnd, rnd.randint(3, 60), rnd.uniform(-5, 5), rnd.uniform(-5, 5), rnd.uniform(0.5, 10))
+            with self.subTest(case=case):
+                self.assertEqual(_pairs_intersect(a, b), _array_intersects_array(a, b))
+                self.assertEqual(_pairs_intersect(b, a), _array_intersects_array(b, a))
+
+    def test_grid_rings(self):
+        # Vertices on a small grid give shared vertices, touching and collinear edges
+        rnd = random.Random(9)
+        for case in range(300):
+            a = [[rnd.randint(0, 6), rnd.randint(0, 6)] for _ in range(rnd.randint(3, 40))]
+            b = [[rnd.randint(0, 6) + rnd.choice((0, 7)), rnd.randint(0, 6)] for _ in range(rnd.randint(3, 40))]
+            a.append(a[0])
+            b.append(b[0])
+            with self.subTest(case=case):
+                self.assertEqual(_pairs_intersect(a, b), _array_intersects_array(a, b))
+
+    def test_touching_and_far_rings(self):
+        a = _square(0, 0, 10, True)
+        # The same square with 32 edges, compared with the sweep
+        a_long = [[x / 8 * 10, 0] for x in range(8)] + [[10, y / 8 * 10] for y in range(8)] + \
+            [[10 - x / 8 * 10, 10] for x in range(8)] + [[0, 10 - y / 8 * 10] for y in range(9)]
+        for b in (_square(10, 2, 3, True), _square(10 + 1e-12, 2, 3, True), _square(100, 100, 1, True),
+                  _square(2, 2, 3, False), _square(-1, -1, 12, False)):
+            with self.subTest(b=b):
+                self.assertEqual(_pairs_intersect(a, b), _array_intersects_array(a, b))
+                self.assertEqual(_pairs_intersect(a_long, b), _array_intersects_array(a_long, b))
+
+    def test_not_finite_coordinates(self):
+        rnd = random.Random(2)
+        a = _star(rnd, 40, 0, 0, 5)
+        b = _star(rnd, 40, 1, 0, 5)
+        for value in (float("nan"), float("inf")):
+            for position in (0, 3, 20):
+                a_broken = [p[:] for p in a]
+                a_broken[position] = [value, 0]
+                with self.subTest(value=value, position=position):
+                    self.assertEqual(_pairs_intersect(a_broken, b), _array_intersects_array(a_broken, b))
+                    self.assertEqual(_pairs_intersect(b, a_broken), _array_intersects_array(b, a_broken))
+
+
+class TestPreparedRing(unittest.TestCase):
+
+    def test_contains_point(self):
+        rnd = random.Random(17)
+        for case in range(100):
+            ring = _star(rnd, rnd.randint(3, 200), 0, 0, 10)
+            if rnd.random() < 0.3:
+                ring.pop()
+            prepared = pygeoconv.PreparedRing(ring)
+            points = [[rnd.uniform(-12, 12), rnd.uniform(-12, 12)] for _ in range(50)] + [point[:] for point in ring]
+            with self.subTest(case=case):
+                for point in points:
+                    self.assertEqual(_coordinates_contain_point(ring, point), prepared.contains_point(point))
+
+    def test_grid_ring(self):
+        # Horizontal edges and points on vertices and edges of the ring
+        ring = [[0, 0], [0, 4], [2, 4], [2, 2], [4, 2], [4, 6], [6, 6], [6, 0], [3, 0], [3, 1], [1, 1], [1, 0], [0, 0]]
+        prepared = pygeoconv.PreparedRing(ring)
+        for x in range(-1, 8):
+            for y in range(-1, 8):
+                for point in ([x, y], [x + 0.5, y], [x, y + 0.5]):
+                    with self.subTest(point=point):
+                        self.assertEqual(_coordinates_contain_point(ring, point), prepared.contains_point(point))
+
+    def test_rings(self):
+        rnd = random.Random(19)
+        for case in range(200):
+            ring = _star(rnd, rnd.randint(3, 150), 0, 0, 10)
+            other = _star(rnd, rnd.randint(3, 40), rnd.uniform(-8, 8), rnd.uniform(-8, 8), rnd.uniform(0.1, 5))
+            prepared = pygeoconv.PreparedRing(ring)
+            with self.subTest(case=case):
+                self.assertEqual(_array_intersects_array(ring, other), prepared.intersects(other))
+                self.assertEqual(_coordinates_contain_coordinates(ring, other), prepared.contains(other))
+
+    def test_not_finite_coordinates(self):
+        rnd = random.Random(23)
+        ring = _star(rnd, 60, 0, 0, 10)
+        other = _star(rnd, 20, 1, 1, 2)
+        for value in (float("nan"), float("inf"), float("-inf")):
+            for broken in ("ring", "other", "point"):
+                a, b, point = [p[:] for p in ring], [p[:] for p in other], [1.0, 1.0]
+                {"ring": a, "other": b, "point": [point]}[broken][0][1] = value
+                prepared = pygeoconv.PreparedRing(a)
+                with self.subTest(value=value, broken=broken):
+                    self.assertEqual(_coordinates_contain_point(a, point), prepared.contains_point(point))
+                    self.assertEqual(_array_intersects_array(a, b), prepared.intersects(b))
+
+    def test_prepared_polygon(self):
+        polygon = pygeoconv.PreparedPolygon([_square(0, 0, 10, False), _square(2, 2, 3, True), _square(6, 6, 2, True)])
+        self.assertTrue(polygon.contains_point((1, 1)))
+        self.assertTrue(polygon.contains_point([5.5, 2.5]))
+        self.assertFalse(polygon.contains_point((3, 3)))
+        self.assertFalse(polygon.contains_point((7, 7)))
+        self.assertFalse(polygon.contains_point((11, 5)))
+        self.assertEqual(3, len(polygon.rings))
+        geojson = pygeoconv.wkt_to_geojson("POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 2 5, 5 5, 5 2, 2 2))")
+        polygon = pygeoconv.PreparedPolygon(geojson["coordinates"])
+        self.assertTrue(polygon.contains_point((1, 1)))
+        self.assertFalse(polygon.contains_point((3, 3)))
+        with self.assertRaises(ValueError):
+            pygeoconv.PreparedPolygon([])
@@ -0,0 +1,120 @@
+import json
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv.errors import EsriJsonParserError, GeojsonParserError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _square(x, y, size, clockwise):
+    ring = [[x, y], [x, y + size], [x + size, y + size], [x + size, y], [x, y]]
+    return ring if clockwise else ring[::-1]
+
+
+class TestValidation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            testdata = json.loads(f.read())
+        # Esri Json written by the conversion and the GeoJson read back from it hold closed and oriented rings
+        self.esri = [pygeoconv.geojson_to_esri_json(case["geojson"]) for _type, case in testdata.items()
+                     if "Empty" not in _type and case["geojson"]["type"] != "GeometryCollection"]
+        self.esri.append({"rings": [_square(0, 0, 10, True), _square(1, 1, 2, False), _square(5, 5, 2, False),
+                                    _square(20, 0, 10, True), _square(21, 1, 8, False), _square(40, 0, 1, True)]})
+        self.esri.append({"rings": [_square(0, 0, 10, True)] + [_square(i, 1, 0.5, False) for i in range(1, 9)]})
+        self.esri.append({"rings": [_square(0, 0, 1, False), _square(5, 5, 1, False)]})
+        self.esri.append({"features": [{"geometry": esri, "attributes": {"OBJECTID": i}}
+                                       for i, esri in enumerate(self.esri)]})
+        self.geojson = [pygeoconv.esri_json_to_geojson(esri) for esri in self.esri]
+
+    def test_trust(self):
+        for geojson in self.geojson:
+            with self.subTest(geojson["type"]):
+                self.assertEqual(pygeoconv.geojson_to_esri_json(geojson),
+                                 pygeoconv.geojson_to_esri_json(geojson, validation="trust"))
+                self.assertEqual(pygeoconv.geojson_to_esri_json(geojson),
+                                 pygeoconv.geojson_to_esri_json(json.loads(json.dumps(geojson)), copy=False,
+                                                                validation="trust"))
+        for esri in self.esri:
+            with self.subTest(esri=str(esri)[:60]):
+                self.assertEqual(pygeoconv.esri_json_to_geojson(esri),
+                                 pygeoconv.esri_json_to_geojson(esri, validation="trust"))
+                self.assertEqual(pygeoconv.esri_json_to_geojson(esri),
+                                 pygeoconv.esri_json_to_geojson(json.loads(json.dumps(esri)), copy=False,
+                                                                validation="trust"))
+
+    def test_trust_skips_checks(self):
+        # Rings are taken as they are, an open ring stays open
+        geojson = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1]]]}
+        self.assertEqual([[[0, 1], [1, 1], [1, 0], [0, 0]]],
+                         pygeoconv.geojson_to_esri_json(geojson, validation="trust")["rings"])
+        self.assertEqual([[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]],
+                         pygeoconv.geojson_to_esri_json(geojson)["rings"])
+
+    def test_strict(self):
+        for geojson in self.geojson:
+            with self.subTest(geojson["type"]):
+                self.assertEqual(pygeoconv.geojson_to_esri_json(geojson),
+                                 pygeoconv.geojson_to_esri_json(geojson, validation="strict"))
+        for esri in self.esri:
+            with self.subTest(esri=str(esri)[:60]):
+                self.assertEqual(pygeoconv.esri_json_to_geojson(esri),
+                                 pygeoconv.esri_json_to_geojson(esri, validation="strict"))
+        for geojson in ({"type": "Point", "coordinates": [1, 2.5, 3]},
+                        {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1]]]},
+                        {"type": "Feature", "geometry": None, "properties": {}}):
+            with self.subTest(geojson=geojson):
+                pygeoconv.geojson_to_esri_json(geojson, validation="strict")
+
+    def test_strict_errors(self):
+        invalid_geojson = [
+            {"type": "Point", "coordinates": [1, float("nan")]},
+            {"type": "Point", "coordinates": [float("inf"), 1]},
+            {"type": "Point", "coordinates": [1]},
+            {"type": "Point", "coordinates": ["1", 2]},
+            {"type": "MultiPoint", "coordinates": [[1, 2], [True, 2]]},
+            {"type": "LineString", "coordinates": [[1, 2]]},
+            {"type": "MultiLineString", "coordinates": [[[1, 2], [3, 4]], [[1, 2]]]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 0]]]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]], []]},
+            {"type": "MultiPolygon", "coordinates": [[[[0, 0], [1, 0], [1, 1], [0, 0]]], [[[0, 0], [1, 0]]]]},
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [1, None]}, "properties": {}},
+            {"type": "GeometryCollection", "geometries": [{"type": "LineString", "coordinates": [[0, 0]]}]},
+        ]
+        for geojson in invalid_geojson:
+            with self.subTest(geojson=geojson):
+                with self.assertRaises(GeojsonParserError):
+                    pygeoconv.geojson_to_esri_json(geojson, validation="strict")
+        invalid_esri = [
+            {"x": float("nan"), "y": 1},
+            {"x": 1, "y": 2, "z": "high"},
+            {"points": [[1, 2], [3, float("-inf")]]},
+            {"paths": [[[1, 2]]]},
+            {"rings": [[[0, 0], [1, 0], [1, 1]], [[0, 0], [0, 1], [0, 0]]]},
+            {"features": [{"geometry": {"paths": [[[1, 2], [3]]]}, "attributes": {"OBJECTID": 1}}]},
+        ]
+        for esri in invalid_esri:
+            with self.subTest(esri=esri):
+                with self.assertRaises(EsriJsonParserError):
+                    pygeoconv.esri_json_to_geojson(esri, validation="strict")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_strict_arrays(self):
+        geojson = {"type": "Polygon", "coordinates": [numpy.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])]}
+        self.assertEqual(pygeoconv.geojson_to_esri_json(geojson),
+                         pygeoconv.geojson_to_esri_json(geojson, validation="strict"))
+        geojson["coordinates"][0][1, 1] = numpy.nan
+        with self.assertRaises(GeojsonParserError):
+            pygeoconv.geojson_to_esri_json(geojson, validation="strict")
+
+    def test_unknown_validation(self):
+        with self.assertRaises(ValueError):
+            pygeoconv.geojson_to_esri_json(self.geojson[0], validation="none")
+        with self.assertRaises(ValueError):
+            pygeoconv.esri_json_to_geojson(self.esri[0], validation="none")
@@ -0,0 +1,98 @@
+import json
+import struct
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv.errors import WkbParserError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# WKB stores one dimension for a whole geometry, these cases mix dimensions or have four values without ZM
+_MIXED_DIMENSIONS = ("multipolygonZ", "multipolygonM", "multipolygonZM", "pointScientificNotation")
+
+
+class TestWkb(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def test_round_trip(self):
+        for _type, case in self.testdata.items():
+            if _type in _MIXED_DIMENSIONS:
+                continue
+            for byte_order in ("little", "big"):
+                for extended in (False, True):
+                    with self.subTest(_type, byte_order=byte_order, extended=extended):
+                        wkb = pygeoconv.wkt_to_wkb(case["wkt"], byte_order=byte_order, extended=extended)
+                        self.assertEqual(pygeoconv.wkb_to_geojson(wkb), case["geojson"])
+
+    def test_known_wkb(self):
+        cases = {
+            "0101000000000000000000F03F0000000000000040": {"type": "Point", "coordinates": [1, 2]},
+            "00000000013FF00000000000004000000000000000": {"type": "Point", "coordinates": [1, 2]},
+            # Extended WKB of PostGIS with SRID 4326
+            "0101000020E6100000000000000000F03F0000000000000040": {"type": "Point", "coordinates": [1, 2]},
+            "01010000A0E6100000000000000000F03F00000000000000400000000000000840":
+                {"type": "Point", "coordinates": [1, 2, 3], "properties": {"z": True}},
+            "0101000000000000000000F87F000000000000F87F": {"type": "Point", "coordinates": []},
+            "010200000000000000": {"type": "LineString", "coordinates": []},
+        }
+        for wkb, geojson in cases.items():
+            with self.subTest(wkb):
+                self.assertEqual(pygeoconv.wkb_to_geojson(wkb), geojson)
+                self.assertEqual(pygeoconv.wkb_to_geojson(bytes.fromhex(wkb)), geojson)
+                self.assertEqual(pygeoconv.wkb_to_geojson(wkb.lower().encode()), geojson)
+                self.assertEqual(pygeoconv.wkb_to_geojson(memoryview(bytearray.fromhex(wkb))), geojson)
+        self.assertEqual(pygeoconv.wkt_to_wkb("POINT (1 2)", as_hex=True), "0101000000000000000000F03F0000000000000040")
+        self.assertEqual(pygeoconv.wkt_to_wkb("POINT Z (1 2 3)", extended=True, srid=4326, as_hex=True),
+                         "01010000A0E6100000000000000000F03F00000000000000400000000000000840")
+        self.assertEqual(pygeoconv.wkt_to_wkb("POINT (1 2)", byte_order="big"),
+                         bytes.fromhex("00000000013FF00000000000004000000000000000"))
+
+    def test_iso_type_codes(self):
+        for wkt, code in (("POINT Z (1 2 3)", 1001), ("LINESTRING M (1 2 3, 4 5 6)", 2002),
+                          ("POLYGON ZM ((0 0 1 1, 1 0 1 1, 1 1 1 1, 0 0 1 1))", 3003)):
+            with self.subTest(wkt):
+                self.assertEqual(struct.unpack_from("<I", pygeoconv.wkt_to_wkb(wkt), 1)[0], code)
+
+    def test_wkt_and_esri(self):
+        wkt = "POLYGON ((0 0, 0 10, 10 10, 10 0, 0 0), (2 2, 4 2, 4 4, 2 4, 2 2))"
+        wkb = pygeoconv.wkt_to_wkb(wkt)
+        self.assertEqual(pygeoconv.wkb_to_wkt(wkb), pygeoconv.geojson_to_wkt(pygeoconv.wkb_to_geojson(wkb)))
+        esri_json = pygeoconv.wkb_to_esri_json(wkb, wkid=3006)
+        self.assertEqual(esri_json, pygeoconv.wkt_to_esri_json(wkt, wkid=3006))
+        self.assertEqual(pygeoconv.wkb_to_geojson(pygeoconv.esri_json_to_wkb(esri_json)),
+                         pygeoconv.esri_json_to_geojson(esri_json))
+
+    def test_invalid_wkb(self):
+        wkb = pygeoconv.wkt_to_wkb("LINESTRING (1 2, 3 4)")
+        for invalid in (wkb[:-1], wkb + b"\x00", b"\x02" + wkb[1:], wkb[:1] + b"\x08" + wkb[2:], "01xx", b"\x01"):
+            with self.subTest(invalid):
+                with self.assertRaises(WkbParserError):
+                    pygeoconv.wkb_to_geojson(invalid)
+
+    def test_invalid_geojson(self):
+        with self.assertRaises(ValueError):
+            pygeoconv.geojson_to_wkb({"type": "Feature", "geometry": None})
+        with self.assertRaises(ValueError):
+            pygeoconv.geojson_to_wkb({"type": "LineString", "coordinates": [[1, 2], [3, 4, 5]]})
+        with self.assertRaises(ValueError):
+            pygeoconv.geojson_to_wkb({"type": "Point", "coordinates": [1, 2]}, srid=4326)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        for _type, case in self.testdata.items():
+            if _type in _MIXED_DIMENSIONS:
+                continue
+            with self.subTest(_type):
+                wkb = pygeoconv.wkt_to_wkb(case["wkt"], byte_order="big")
+                converted = pygeoconv.wkb_to_geojson(wkb, coords="numpy")
+                self.assertEqual(pygeoconv.geojson_to_wkb(converted, byte_order="big"), wkb)
+                self.assertEqual(json.loads(json.dumps(converted, default=lambda value: value.tolist())),
+                                 case["geojson"])
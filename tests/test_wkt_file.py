@@ -0,0 +1,89 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv.errors import GeojsonParserError, WktParserError
+
+
+class TestIterWktFile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+        self.lines = [case["wkt"] for case in self.testdata.values()]
+        self.text = "\n".join(self.lines) + "\n"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)/"geometries.wkt"
+        self.path.write_text(self.text)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_geojson(self):
+        truth = [(i, pygeoconv.wkt_to_geojson(wkt)) for i, wkt in enumerate(self.lines, 1)]
+        with open(self.path, "rb") as binary, open(self.path) as text:
+            for name, source in (("path", self.path), ("str path", str(self.path)), ("binary file", binary),
+                                 ("text file", text), ("StringIO", io.StringIO(self.text))):
+                with self.subTest(name):
+                    self.assertEqual(truth, list(pygeoconv.iter_wkt_file(source)))
+
+    def test_esri_json(self):
+        lines = [case["wkt"] for _type, case in self.testdata.items() if "Empty" not in _type]
+        truth = [(i, pygeoconv.wkt_to_esri_json(wkt, wkid=3857)) for i, wkt in enumerate(lines, 1)]
+        source = io.BytesIO("\n".join(lines).encode("ascii"))
+        self.assertEqual(truth, list(pygeoconv.iter_wkt_file(source, to="esri", wkid=3857)))
+
+    def test_lines_across_blocks(self):
+        truth = list(pygeoconv.iter_wkt_file(self.path))
+        for block_size in (1, 2, 7, 64, 1000):
+            for source in (io.BytesIO(self.text.encode("ascii")), io.StringIO(self.text)):
+                with self.subTest(block_size=block_size, source=type(source).__name__):
+                    self.assertEqual(truth, list(pygeoconv.iter_wkt_file(source, block_size=block_size)))
+
+    def test_long_lines(self):
+        ring = [[i, -i / 4] for i in range(5000)]
+        wkt = "LINESTRING (" + ", ".join(f"{x} {y}" for x, y in ring) + ")"
+        source = io.BytesIO(f"POINT (1 2)\n{wkt}\nPOINT (3 4)".encode("ascii"))
+        converted = list(pygeoconv.iter_wkt_file(source, block_size=4096))
+        self.assertEqual([(1, {"type": "Point", "coordinates": [1, 2]}),
+                          (2, {"type": "LineString", "coordinates": ring}),
+                          (3, {"type": "Point", "coordinates": [3, 4]})], converted)
+
+    def test_blank_lines_and_line_endings(self):
+        source = io.BytesIO(b"\r\nPOINT (1 2)\r\n  \r\n\tPOINT Z (1 2 3) \r\n\r\n")
+        converted = list(pygeoconv.iter_wkt_file(source))
+        self.assertEqual([(2, {"type": "Point", "coordinates": [1, 2]}),
+                          (4, {"type": "Point", "coordinates": [1, 2, 3], "properties": {"z": True}})], converted)
+
+    def test_invalid_line(self):
+        source = io.StringIO("POINT (1 2)\nPOINT (1)\nPOINT (3 4)\n")
+        generator = pygeoconv.iter_wkt_file(source)
+        self.assertEqual((1, {"type": "Point", "coordinates": [1, 2]}), next(generator))
+        with self.assertRaisesRegex(WktParserError, "on line 2"):
+            next(generator)
+
+    def test_skip_invalid_lines(self):
+        source = io.StringIO("POINT (1 2)\nPOINT (1)\nPOINT (3 4) x\nPOINT (3 4)\n")
+        converted = list(pygeoconv.iter_wkt_file(source, errors="skip"))
+        self.assertEqual([(1, {"type": "Point", "coordinates": [1, 2]}), (4, {"type": "Point", "coordinates": [3, 4]})],
+                         converted)
+
+    def test_esri_json_errors(self):
+        with self.assertRaisesRegex(WktParserError, "on line 2"):
+            list(pygeoconv.iter_wkt_file(io.StringIO("POINT (1 2)\nPOINT (1"), to="esri"))
+        with self.assertRaisesRegex(GeojsonParserError, "on line 2"):
+            list(pygeoconv.iter_wkt_file(io.StringIO("POINT (1 2)\nPOINT EMPTY"), to="esri"))
+        converted = list(pygeoconv.iter_wkt_file(io.StringIO("POINT EMPTY\nPOINT (1 2)"), to="esri", errors="skip"))
+        self.assertEqual([2], [line_number for line_number, _ in converted])
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"to": "wkb"}, {"errors": "ignore"}, {"block_size": 0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pygeoconv.iter_wkt_file(self.path, **kwargs)
+        with self.assertRaises(TypeError):
+            pygeoconv.iter_wkt_file(None)
@@ -0,0 +1,47 @@
+import json
+import unittest
+from pathlib import Path
+
+import pygeoconv
+from pygeoconv._wkt_reader import read_wkt_esri
+
+
+class TestWktToEsri(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def _via_geojson(self, wkt, wkid=4326):
+        return pygeoconv.geojson_to_esri_json(pygeoconv.wkt_to_geojson(wkt), wkid=wkid)
+
+    def test_same_as_via_geojson(self):
+        for _type, case in self.testdata.items():
+            with self.subTest(_type):
+                try:
+                    truth = self._via_geojson(case["wkt"], wkid=3006)
+                except Exception as e:
+                    with self.assertRaises(type(e)) as raised:
+                        pygeoconv.wkt_to_esri_json(case["wkt"], wkid=3006)
+                    self.assertEqual(str(raised.exception), str(e))
+                    continue
+                # Compare the serialized output as well, the key order has to match
+                self.assertEqual(json.dumps(read_wkt_esri(case["wkt"], 3006)), json.dumps(truth))
+                self.assertEqual(json.dumps(pygeoconv.wkt_to_esri_json(case["wkt"], wkid=3006)), json.dumps(truth))
+
+    def test_orient_rings(self):
+        # Counterclockwise outer ring and clockwise hole, the outer ring of the second polygon is not closed
+        wkt = "MULTIPOLYGON (((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 2 4, 4 4, 4 2, 2 2)), ((20 20, 30 20, 30 30)))"
+        self.assertEqual(pygeoconv.wkt_to_esri_json(wkt), self._via_geojson(wkt))
+        self.assertEqual(pygeoconv.wkt_to_esri_json(wkt)["rings"], [
+            [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]],
+            [[0, 0], [0, 10], [10, 10], [10, 0], [0, 0]],
+            [[20, 20], [30, 30], [30, 20], [20, 20]],
+        ])
+
+    def test_invalid_wkt(self):
+        for engine in ("native", "ply"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(pygeoconv.errors.WktParserError):
+                    pygeoconv.wkt_to_esri_json("POLYGON ((0 0, 1 1", engine=engine)
@@ -1,8 +1,14 @@
 import json
+import mmap
+import random
+import sys
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pygeoconv
+from pygeoconv.errors import WktParserError
 
 
 class TestWktToGeojson(unittest.TestCase):
@@ -698,3 +704,160 @@ class TestWktToGeojson(unittest.TestCase):
             print(converted)
         self.assertDictEqual(truth, converted,
                              f"Failure: {_type} {_from} -> {_to}")
+
+
+class TestWktEngines(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def test_engines_produce_identical_output(self):
+        for _type, case in self.testdata.items():
+            with self.subTest(_type):
+                native = pygeoconv.wkt_to_geojson(case["wkt"], engine="native")
+                ply = pygeoconv.wkt_to_geojson(case["wkt"], engine="ply")
+                self.assertEqual(native, ply)
+                self.assertEqual(json.dumps(native), json.dumps(ply))
+
+    def test_engines_reject_invalid_wkt(self):
+        for wkt in ["POINT (1)", "POINT (1 2 3 4 5)", "POINT Z EMPTY", "LINESTRING (1 2,)",
+                    "POLYGON (1 2, 3 4)", "MULTIPOLYGON ((1 2, 3 4))", "GEOMETRYCOLLECTION ()",
+                    "POINT (1 2) POINT (3 4)", "POINT (1 2"]:
+            for engine in ("native", "ply"):
+                with self.subTest(wkt=wkt, engine=engine):
+                    with self.assertRaises(WktParserError):
+                        pygeoconv.wkt_to_geojson(wkt, engine=engine)
+
+    def test_long_lists(self):
+        ring = [[i, -i] for i in range(2000)]
+        ring_wkt = '(' + ', '.join(f'{x} {y}' for x, y in ring) + ')'
+        wkt = f'GEOMETRYCOLLECTION ({", ".join(f"MULTIPOLYGON (({ring_wkt}, {ring_wkt}))" for _ in range(10))})'
+        truth = {'type': 'GeometryCollection',
+                 'geometries': [{'type': 'MultiPolygon', 'coordinates': [[ring, ring]]}] * 10}
+        for engine in ("native", "ply"):
+            with self.subTest(engine=engine):
+                self.assertEqual(truth, pygeoconv.wkt_to_geojson(wkt, engine=engine))
+
+    def test_number_types(self):
+        converted = pygeoconv.wkt_to_geojson("POINT (-1 2.5 3e2 -4.0E-1)", engine="native")
+        self.assertEqual(converted["coordinates"], [-1, 2.5, 300.0, -0.4])
+        self.assertEqual([type(x) for x in converted["coordinates"]], [int, float, float, float])
+
+    def test_coordinate_runs_keep_number_types(self):
+        for wkt in ["LINESTRING (1 2, 3 4)", "LINESTRING (1.5 2.5, 3.0 4.0)", "LINESTRING (1 2.5, 3e1 -4E-1)",
+                    "LINESTRING (1.5e2 2, 3 4.0)", "MULTIPOINT Z (1 2 3, 4 5 6)", "POLYGON ((1 2 3, 4 5, 6 7 8 9))",
+                    "LINESTRING (1 2,\n\t3 4 )", "LINESTRING (1-2, 3 4)", "LINESTRING (1 2, (3 4))"]:
+            with self.subTest(wkt=wkt):
+                native = pygeoconv.wkt_to_geojson(wkt, engine="native")
+                ply = pygeoconv.wkt_to_geojson(wkt, engine="ply")
+                self.assertEqual(json.dumps(native), json.dumps(ply))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            pygeoconv.wkt_to_geojson("POINT (1 2)", engine="unknown")
+
+
+class TestWktBytesInput(unittest.TestCase):
+
+    def setUp(self) -> None:
+        p = Path(__file__).parent/"data"/"wkt-to-geojson.json"
+        with open(p) as f:
+            self.testdata = json.loads(f.read())
+
+    def _inputs(self, wkt):
+        data = wkt.encode('ascii')
+        return {'bytes': data, 'bytearray': bytearray(data), 'memoryview': memoryview(data),
+                'memoryview slice': memoryview(b'xx' + data + b'yy')[2:-2]}
+
+    def test_bytes_like_input(self):
+        for _type, case in self.testdata.items():
+            truth = json.dumps(pygeoconv.wkt_to_geojson(case["wkt"]))
+            for name, data in self._inputs(case["wkt"]).items():
+                for engine in ("native", "ply"):
+                    with self.subTest(_type, input=name, engine=engine):
+                        self.assertEqual(truth, json.dumps(pygeoconv.wkt_to_geojson(data, engine=engine)))
+
+    def test_long_runs(self):
+        ring = [[i, -i / 3] for i in range(2000)]
+        wkt = 'POLYGON ((' + ', '.join(f'{x} {y}' for x, y in ring) + '))'
+        for name, data in self._inputs(wkt).items():
+            with self.subTest(input=name):
+                self.assertEqual({'type': 'Polygon', 'coordinates': [ring]}, pygeoconv.wkt_to_geojson(data))
+
+    def test_mmap_input(self):
+        wkt = 'MULTIPOINT Z ((1 2 3), (4.5 -5 6e1))'
+        with tempfile.TemporaryFile() as f:
+            f.write(wkt.encode('ascii'))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self.assertEqual(pygeoconv.wkt_to_geojson(wkt), pygeoconv.wkt_to_geojson(data))
+                self.assertEqual(pygeoconv.wkt_to_esri_json(wkt), pygeoconv.wkt_to_esri_json(data))
+
+    def test_esri_json_and_wkb(self):
+        wkt = 'MULTIPOLYGON (((0 0, 0 4, 4 4, 4 0, 0 0), (1 1, 2 1, 2 2, 1 1)), ((5 5, 5 6, 6 6, 5 5)))'
+        for name, data in self._inputs(wkt).items():
+            with self.subTest(input=name):
+                self.assertEqual(pygeoconv.wkt_to_esri_json(wkt), pygeoconv.wkt_to_esri_json(data))
+                self.assertEqual(pygeoconv.wkt_to_wkb(wkt), pygeoconv.wkt_to_wkb(data))
+
+    def test_invalid_bytes(self):
+        for wkt in [b"POINT (1)", b"POINT (1 2", b"POINT (1 2) POINT (3 4)", "POINT (1 \u00e9)".encode('utf-8')]:
+            for engine in ("native", "ply"):
+                with self.subTest(wkt=wkt, engine=engine):
+                    with self.assertRaises(WktParserError):
+                        pygeoconv.wkt_to_geojson(wkt, engine=engine)
+
+    def test_same_errors_as_str(self):
+        for wkt in ["POINT (1)", "LINESTRING (1 2,)", "POINT (1 2) POINT (3 4)", "POINT (1 2", "POINT (1 2) x"]:
+            with self.subTest(wkt=wkt):
+                with self.assertRaises(WktParserError) as expected:
+                    pygeoconv.wkt_to_geojson(wkt)
+                with self.assertRaises(WktParserError) as raised:
+                    pygeoconv.wkt_to_geojson(wkt.encode('ascii'))
+                self.assertEqual(str(expected.exception), str(raised.exception))
+
+
+class TestWktParserTables(unittest.TestCase):
+
+    def test_tables_match_grammar(self):
+        from pygeoconv import _wkt_parser, _wkt_parsetab
+        self.assertEqual(_wkt_parsetab.signature, _wkt_parser.grammar_signature(),
+                         "Stale WKT parser tables, run python -m pygeoconv._wkt_parser")
+
+    def test_tables_match_generated_tables(self):
+        from pygeoconv import _wkt_parser
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)/"parsetab.py"
+            _wkt_parser.write_tables(str(path))
+            self.assertEqual(path.read_text(), Path(_wkt_parser.TABLES_FILE).read_text(),
+                             "Stale WKT parser tables, run python -m pygeoconv._wkt_parser")
+
+
+class TestWktThreadSafety(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Switch threads as often as possible so interleaved parses show up reliably
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        rnd = random.Random(0)
+        self.cases = []
+        for i in range(3000):
+            coordinates = [[i, rnd.randint(-1000, 1000)] for _ in range(rnd.randint(2, 30))]
+            wkt = 'LINESTRING (' + ', '.join(f'{x} {y}' for x, y in coordinates) + ')'
+            self.cases.append((wkt, {'type': 'LineString', 'coordinates': coordinates}))
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self.switch_interval)
+
+    def _parse_concurrently(self, engine):
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(lambda case: pygeoconv.wkt_to_geojson(case[0], engine=engine), self.cases))
+
+    def test_concurrent_parsing(self):
+        for engine in ("native", "ply"):
+            with self.subTest(engine=engine):
+                results = self._parse_concurrently(engine)
+                for (wkt, truth), converted in zip(self.cases, results):
+                    self.assertEqual(truth, converted, wkt)